@@ -8,46 +8,64 @@ import httpx
 
 
 class AdminClient:
-    """Client for interacting with the Apple Flow admin API."""
+    """Client for interacting with the Apple Flow admin API.
+
+    One pooled ``httpx.Client`` is created on first use and reused, so
+    repeated calls share a keep-alive connection. Call ``close()`` or use
+    the client as a context manager to release it.
+    """
 
     def __init__(self, base_url: str = "http://127.0.0.1:8787", timeout: float = 10.0):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> AdminClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        return self._client
 
     def pending_approvals(self) -> list[dict[str, Any]]:
         """Get list of pending approval requests."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/approvals/pending")
-            response.raise_for_status()
-            return response.json()
+        response = self._http().get("/approvals/pending")
+        response.raise_for_status()
+        return response.json()
 
     def override_approval(self, request_id: str, status: str) -> dict[str, Any]:
         """Override an approval request status."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}/approvals/{request_id}/override",
-                json={"status": status},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self._http().post(
+            f"/approvals/{request_id}/override",
+            json={"status": status},
+        )
+        response.raise_for_status()
+        return response.json()
 
     def list_sessions(self) -> list[dict[str, Any]]:
         """Get list of active sessions."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/sessions")
-            response.raise_for_status()
-            return response.json()
+        response = self._http().get("/sessions")
+        response.raise_for_status()
+        return response.json()
 
     def audit_events(self, limit: int = 200) -> list[dict[str, Any]]:
         """Get recent audit events."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/audit/events", params={"limit": limit})
-            response.raise_for_status()
-            return response.json()
+        response = self._http().get("/audit/events", params={"limit": limit})
+        response.raise_for_status()
+        return response.json()
 
     def health(self) -> dict[str, Any]:
         """Check API health."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
+        response = self._http().get("/health")
+        response.raise_for_status()
+        return response.json()
@@ -14,6 +14,7 @@ from __future__ import annotations
 import html
 import json
 import logging
+import os
 import re
 import shutil
 import sqlite3
@@ -3068,11 +3069,22 @@ def _run_command(
 def _build_temp_audio_path(suffix: str) -> str:
     with tempfile.NamedTemporaryFile(prefix="apple-flow-tts-", suffix=suffix, delete=False) as tmp:
         path = tmp.name
+    _discard_file(path)
+    return path
+
+
+def _discard_file(path: str) -> None:
     try:
-        Path(path).unlink(missing_ok=True)
-    except Exception:
+        os.unlink(path)
+    except OSError:
         pass
-    return path
+
+
+def _is_nonempty_file(path: str) -> bool:
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
 
 
 def _synthesize_tts_to_audio_file(
@@ -3114,15 +3126,12 @@ def _synthesize_tts_to_audio_file(
                         timeout=timeout,
                         input_text=payload,
                     )
-                    if piper_result["ok"] and Path(audio_path).exists() and Path(audio_path).stat().st_size > 0:
+                    if piper_result["ok"] and _is_nonempty_file(audio_path):
                         return {"ok": True, "engine": "piper", "path": audio_path}
                     errors.append(
                         f"piper failed: {piper_result.get('stderr') or piper_result.get('error') or 'unknown error'}"
                     )
-                    try:
-                        Path(audio_path).unlink(missing_ok=True)
-                    except Exception:
-                        pass
+                    _discard_file(audio_path)
         if engine == "piper":
             return {"ok": False, "error": " ; ".join(errors) if errors else "piper synthesis failed"}
 
@@ -3137,14 +3146,11 @@ def _synthesize_tts_to_audio_file(
         say_command.extend(["-v", voice])
     say_command.append(payload)
     say_result = _run_command(say_command, timeout=timeout)
-    if say_result["ok"] and Path(audio_path).exists() and Path(audio_path).stat().st_size > 0:
+    if say_result["ok"] and _is_nonempty_file(audio_path):
         return {"ok": True, "engine": "say", "path": audio_path}
 
     errors.append(f"say failed: {say_result.get('stderr') or say_result.get('error') or 'unknown error'}")
-    try:
-        Path(audio_path).unlink(missing_ok=True)
-    except Exception:
-        pass
+    _discard_file(audio_path)
     return {"ok": False, "error": " ; ".join(errors) if errors else "speech synthesis failed"}
 
 
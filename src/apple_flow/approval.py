@@ -30,6 +30,8 @@ class OrchestrationResult:
     run_id: str | None = None
     approval_request_id: str | None = None
     response: str | None = None
+    # Run state this handler left the run in, when known (saves a re-read).
+    final_state: RunState | None = None
 
 
 class ApprovalHandler:
@@ -406,7 +408,7 @@ class ApprovalHandler:
             final = f"❌ Execution failed ({reason}).\n\n{execution_output}"
             self._safe_send(sender, final, context=egress_context)
             self._log(kind.value, sender, run_request_text, final)
-            return OrchestrationResult(kind=kind, run_id=run_id, response=final)
+            return OrchestrationResult(kind=kind, run_id=run_id, response=final, final_state=RunState.FAILED)
 
         if self.enable_verifier:
             self.store.update_run_state(run_id, RunState.VERIFYING.value)
@@ -438,7 +440,7 @@ class ApprovalHandler:
                 )
                 self._safe_send(sender, final, context=egress_context)
                 self._log(kind.value, sender, run_request_text, final)
-                return OrchestrationResult(kind=kind, run_id=run_id, response=final)
+                return OrchestrationResult(kind=kind, run_id=run_id, response=final, final_state=RunState.FAILED)
             final = f"Execution:\n{execution_output}\n\nVerification:\n{verification_output}"
         else:
             final = execution_output
@@ -476,7 +478,7 @@ class ApprovalHandler:
             except Exception as exc:
                 logger.debug("Failed to schedule follow-up: %s", exc)
 
-        return OrchestrationResult(kind=kind, run_id=run_id, response=final)
+        return OrchestrationResult(kind=kind, run_id=run_id, response=final, final_state=RunState.COMPLETED)
 
     def handle_approval_required(
         self,
@@ -22,6 +22,7 @@ from .setup_wizard import (
     validate_phone,
     validate_workspace_path,
 )
+from .utils import atomic_write_text
 
 SERVICE_LABEL = "local.apple-flow"
 ADMIN_SERVICE_LABEL = "local.apple-flow-admin"
@@ -80,7 +81,7 @@ def _write_env(path: Path, updates: dict[str, str]) -> list[str]:
             lines.append(rendered)
         updated_keys.append(key)
 
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    atomic_write_text(path, "\n".join(lines) + "\n")
     return updated_keys
 
 
@@ -130,6 +130,34 @@ _PREFIX_TO_KIND = {
     "logs": CommandKind.LOGS,
 }
 
+# Single-word commands that take no payload.
+_BARE_COMMANDS = {
+    "status": CommandKind.STATUS,
+    "help": CommandKind.HELP,
+    "health": CommandKind.HEALTH,
+    "usage": CommandKind.USAGE,
+    "logs": CommandKind.LOGS,
+}
+
+# "<word> <payload>" commands.
+_ARGUMENT_COMMANDS = {
+    "status": CommandKind.STATUS,
+    "help": CommandKind.HELP,
+    "approve": CommandKind.APPROVE,
+    "deny": CommandKind.DENY,
+}
+
+# Whole-message phrases; checked before _ARGUMENT_COMMANDS so "deny all" wins over "deny".
+_PHRASE_COMMANDS = {
+    "clear context": CommandKind.CLEAR_CONTEXT,
+    "new chat": CommandKind.CLEAR_CONTEXT,
+    "reset context": CommandKind.CLEAR_CONTEXT,
+    "deny all": CommandKind.DENY_ALL,
+    "clear approvals": CommandKind.DENY_ALL,
+    "cancel all": CommandKind.DENY_ALL,
+}
+_PHRASE_MAX_LEN = max(len(phrase) for phrase in _PHRASE_COMMANDS)
+
 
 def _extract_workspace_alias(payload: str) -> tuple[str, str]:
     """Extract @alias from the beginning of the payload.
@@ -146,45 +174,30 @@ def _extract_workspace_alias(payload: str) -> tuple[str, str]:
 
 def parse_command(raw_text: str) -> ParsedCommand:
     text = raw_text.strip()
-    lowered = text.lower()
-
-    if lowered == "status":
-        return ParsedCommand(kind=CommandKind.STATUS, payload="")
-
-    if lowered.startswith("status "):
-        return ParsedCommand(kind=CommandKind.STATUS, payload=text.split(" ", 1)[1].strip())
-
-    if lowered == "help":
-        return ParsedCommand(kind=CommandKind.HELP, payload="")
-
-    if lowered.startswith("help "):
-        return ParsedCommand(kind=CommandKind.HELP, payload=text.split(" ", 1)[1].strip())
-
-    if lowered in {"clear context", "new chat", "reset context"}:
-        return ParsedCommand(kind=CommandKind.CLEAR_CONTEXT, payload="")
-
-    if lowered == "health":
-        return ParsedCommand(kind=CommandKind.HEALTH, payload="")
-
-    if lowered == "usage":
-        return ParsedCommand(kind=CommandKind.USAGE, payload="")
-
-    if lowered == "logs":
-        return ParsedCommand(kind=CommandKind.LOGS, payload="")
-
-    if lowered.startswith("approve "):
-        return ParsedCommand(kind=CommandKind.APPROVE, payload=text.split(" ", 1)[1].strip())
-
-    if lowered in {"deny all", "clear approvals", "cancel all"}:
-        return ParsedCommand(kind=CommandKind.DENY_ALL, payload="")
-
-    if lowered.startswith("deny "):
-        return ParsedCommand(kind=CommandKind.DENY, payload=text.split(" ", 1)[1].strip())
-
-    for prefix, kind in _PREFIX_TO_KIND.items():
-        marker = f"{prefix}:"
-        if lowered.startswith(marker):
-            payload = text[len(marker):].strip()
+    # Dispatch on the first space-delimited token so ordinary chat never pays
+    # for lowercasing the whole message.
+    space = text.find(" ")
+    head = text if space < 0 else text[:space]
+    head_lower = head.lower()
+
+    if space < 0:
+        kind = _BARE_COMMANDS.get(head_lower)
+        if kind is not None:
+            return ParsedCommand(kind=kind, payload="")
+    else:
+        if len(text) <= _PHRASE_MAX_LEN:
+            kind = _PHRASE_COMMANDS.get(text.lower())
+            if kind is not None:
+                return ParsedCommand(kind=kind, payload="")
+        kind = _ARGUMENT_COMMANDS.get(head_lower)
+        if kind is not None:
+            return ParsedCommand(kind=kind, payload=text[space + 1:].strip())
+
+    colon = head.find(":")
+    if colon >= 0:
+        kind = _PREFIX_TO_KIND.get(head[:colon].lower())
+        if kind is not None:
+            payload = text[colon + 1:].strip()
             workspace, clean_payload = _extract_workspace_alias(payload)
             return ParsedCommand(kind=kind, payload=clean_payload, workspace=workspace)
 
@@ -146,12 +146,11 @@ class CompanionLoop:
 
         # Check scheduled follow-ups
         if self.scheduler:
-            due_actions = self.scheduler.check_due()
+            due_actions = self.scheduler.pop_due()
             for action in due_actions:
                 observations.append(
                     f"Scheduled follow-up ({action['action_type']}): {action.get('payload', {}).get('summary', 'check-in')}"
                 )
-                self.scheduler.mark_fired(action["action_id"])
 
         self.store.set_state("companion_last_obs_count", str(len(observations)))
 
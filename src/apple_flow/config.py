@@ -26,6 +26,8 @@ class RelaySettings(BaseSettings):
     default_workspace: str = str(Path.home())
     timezone: str = ""  # e.g. "America/Los_Angeles"; empty = system local timezone
     db_path: Path = Path.home() / ".apple-flow" / "relay.db"
+    sqlite_journal_mode: str = "wal"  # wal | delete | truncate | persist
+    sqlite_checkpoint_interval_seconds: float = 300.0  # 0 disables the periodic WAL truncate
     poll_interval_seconds: float = 2.0
     approval_ttl_minutes: int = 20
     max_messages_per_minute: int = 30
@@ -142,6 +144,8 @@ class RelaySettings(BaseSettings):
     reminders_owner: str = ""
     reminders_auto_approve: bool = False
     reminders_poll_interval_seconds: float = 5.0
+    reminders_idle_poll_interval_seconds: float = 0.0
+    reminders_use_eventkit: bool = False
     reminders_due_delay_seconds: int = 60
 
     # Global trigger tag: items without this tag are skipped across all channels.
@@ -292,6 +296,7 @@ class RelaySettings(BaseSettings):
         "memory_v2_include_legacy_fallback",
         "enable_helper_maintenance",
         "helper_maintenance_interval_seconds",
+        "sqlite_checkpoint_interval_seconds",
         "helper_recycle_idle_seconds",
         "helper_recycle_max_age_seconds",
         "watchdog_poll_stall_seconds",
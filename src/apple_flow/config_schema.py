@@ -55,6 +55,7 @@ _ENUM_OPTIONS: dict[str, list[str]] = {
         "sunday",
     ],
     "apple_flow_phone_tts_engine": ["auto", "say", "piper"],
+    "apple_flow_sqlite_journal_mode": ["wal", "delete", "truncate", "persist"],
     "apple_flow_imessage_auto_send_image_results": ["off", "owner-only", "allowed-senders"],
 }
 
@@ -81,6 +82,8 @@ def _section_for_key(key: str) -> str:
         "apple_flow_default_workspace",
         "apple_flow_timezone",
         "apple_flow_db_path",
+        "apple_flow_sqlite_journal_mode",
+        "apple_flow_sqlite_checkpoint_interval_seconds",
         "apple_flow_poll_interval_seconds",
         "apple_flow_max_messages_per_minute",
         "apple_flow_approval_ttl_minutes",
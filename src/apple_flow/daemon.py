@@ -5,6 +5,7 @@ import contextlib
 import functools
 import json
 import logging
+import random
 import shutil
 import signal
 import sqlite3
@@ -73,6 +74,22 @@ _FASTLANE_COMMANDS = {
 }
 
 _ATTACHMENT_PLACEHOLDER_TEXTS = {"\uFFFC", "￼"}
+# Fastest iMessage/Mail poll cadence while messages keep arriving.
+_ACTIVE_POLL_INTERVAL_SECONDS = 0.25
+
+
+def _next_poll_delay(previous: float, had_messages: bool, ceiling: float) -> float:
+    """Return the next base poll delay: the floor after activity, else double up to ``ceiling``."""
+    floor = min(_ACTIVE_POLL_INTERVAL_SECONDS, ceiling)
+    if had_messages:
+        return floor
+    return min(ceiling, max(floor, previous * 2))
+
+
+def _jittered(delay: float) -> float:
+    # +/-10% keeps the iMessage and Mail loops from settling into lockstep.
+    return delay * random.uniform(0.9, 1.1)
+
 
 def migrate_legacy_db_if_needed(
     settings: RelaySettings,
@@ -134,7 +151,11 @@ class RelayDaemon:
                 path=csv_path,
                 include_headers_if_missing=settings.csv_audit_include_headers_if_missing,
             )
-        self.store = SQLiteStore(Path(settings.db_path), csv_audit_logger=csv_audit_logger)
+        self.store = SQLiteStore(
+            Path(settings.db_path),
+            csv_audit_logger=csv_audit_logger,
+            journal_mode=settings.sqlite_journal_mode,
+        )
         self.store.bootstrap()
         self.policy = PolicyEngine(settings)
         self.ingress = IMessageIngress(
@@ -474,6 +495,8 @@ class RelayDaemon:
                 due_delay_seconds=settings.reminders_due_delay_seconds,
                 timezone_name=settings.timezone,
                 store=self.store,
+                idle_poll_interval_seconds=settings.reminders_idle_poll_interval_seconds,
+                use_eventkit=settings.reminders_use_eventkit,
             )
             self.reminders_orchestrator = RelayOrchestrator(
                 egress=self.egress,
@@ -1082,6 +1105,8 @@ class RelayDaemon:
             tasks.append(asyncio.create_task(self._supervise_loop("memory_maintenance", self._memory_maintenance_loop)))
         if getattr(getattr(self, "settings", None), "enable_helper_maintenance", False):
             tasks.append(asyncio.create_task(self._supervise_loop("helper_maintenance", self._helper_maintenance_loop)))
+        if getattr(getattr(self, "settings", None), "sqlite_checkpoint_interval_seconds", 0) > 0:
+            tasks.append(asyncio.create_task(self._supervise_loop("sqlite_checkpoint", self._sqlite_checkpoint_loop)))
         try:
             await asyncio.gather(*tasks)
         except asyncio.CancelledError:
@@ -1163,9 +1188,30 @@ class RelayDaemon:
                 self._record_loop_failure("helper_maintenance", f"{type(exc).__name__}: {exc}")
             await asyncio.sleep(self.settings.helper_maintenance_interval_seconds)
 
+    async def _sqlite_checkpoint_loop(self) -> None:
+        """Periodically fold the state DB's WAL back into the main file and truncate it."""
+        interval = self.settings.sqlite_checkpoint_interval_seconds
+        logger.info("SQLite checkpoint loop started (interval=%.0fs)", interval)
+        while not self._shutdown_requested:
+            await asyncio.sleep(interval)
+            try:
+                result = await self._call_blocking(self.store.checkpoint, "TRUNCATE")
+                if result is not None and result[0]:
+                    logger.debug("SQLite checkpoint busy; %s/%s WAL frames copied", result[2], result[1])
+                self._record_loop_success("sqlite_checkpoint")
+            except Exception as exc:
+                logger.exception("SQLite checkpoint loop error: %s", exc)
+                self._record_loop_failure("sqlite_checkpoint", f"{type(exc).__name__}: {exc}")
+
     async def _poll_imessage_loop(self) -> None:
-        """iMessage polling loop (original behaviour)."""
+        """iMessage polling loop.
+
+        Polls every ``_ACTIVE_POLL_INTERVAL_SECONDS`` right after messages
+        arrive and backs off to ``poll_interval_seconds`` once quiet.
+        """
+        poll_delay = self.settings.poll_interval_seconds
         while not self._shutdown_requested:
+            had_messages = False
             try:
                 sender_allowlist = self.settings.allowed_senders if self.settings.only_poll_allowed_senders else None
                 if self.settings.only_poll_allowed_senders and not (sender_allowlist or []):
@@ -1187,6 +1233,7 @@ class RelayDaemon:
                     sender_allowlist=sender_allowlist,
                     require_sender_filter=self.settings.only_poll_allowed_senders,
                 )
+                had_messages = bool(messages)
                 recent_attachment_outbound = getattr(
                     self.egress,
                     "was_recent_attachment_outbound",
@@ -1194,6 +1241,7 @@ class RelayDaemon:
                 )
 
                 # Update in-memory cursor for all fetched messages; write to DB once after batch
+                cursor_before = self._last_rowid
                 dispatchable = []
                 for msg in messages:
                     if self._shutdown_requested:
@@ -1276,8 +1324,15 @@ class RelayDaemon:
                         continue
                     dispatchable.append(msg)
 
+                # Rows past the batch up to the scanned tip were all filtered
+                # out by the sender allowlist; skip them so later polls don't
+                # rescan them.
+                scanned_tip = getattr(self.ingress, "last_scanned_rowid", None)
+                if not self._shutdown_requested and scanned_tip is not None:
+                    self._last_rowid = max(scanned_tip, self._last_rowid or 0)
+
                 # Persist the updated cursor once after scanning the batch
-                if messages:
+                if self._last_rowid != cursor_before:
                     try:
                         self.store.set_state("last_rowid", str(self._last_rowid))
                     except sqlite3.OperationalError as exc:
@@ -1356,7 +1411,8 @@ class RelayDaemon:
                 logger.exception("Relay loop error: %s", exc)
                 self._record_loop_failure("imessage", f"{type(exc).__name__}: {exc}")
 
-            await asyncio.sleep(self.settings.poll_interval_seconds)
+            poll_delay = _next_poll_delay(poll_delay, had_messages, self.settings.poll_interval_seconds)
+            await asyncio.sleep(_jittered(poll_delay))
         await self._flush_inflight_on_shutdown(timeout=2.0)
 
     def _synthesize_attachment_only_text(self, msg: InboundMessage) -> str:
@@ -1466,7 +1522,9 @@ class RelayDaemon:
             self._inflight_mail_ids = set()
 
         logger.info("Apple Mail polling loop started")
+        poll_delay = self.settings.poll_interval_seconds
         while not self._shutdown_requested:
+            had_messages = False
             try:
                 mail_allowlist = self.settings.mail_allowed_senders or None
                 messages = await asyncio.to_thread(
@@ -1474,6 +1532,7 @@ class RelayDaemon:
                     sender_allowlist=mail_allowlist,
                     require_sender_filter=bool(mail_allowlist),
                 )
+                had_messages = bool(messages)
                 if getattr(self.mail_ingress, "last_fetch_error", ""):
                     self._record_gateway_failure("mail", self.mail_ingress.last_fetch_error)
                 else:
@@ -1586,7 +1645,8 @@ class RelayDaemon:
                 logger.exception("Mail polling loop error: %s", exc)
                 self._record_loop_failure("mail", f"{type(exc).__name__}: {exc}")
 
-            await asyncio.sleep(self.settings.poll_interval_seconds)
+            poll_delay = _next_poll_delay(poll_delay, had_messages, self.settings.poll_interval_seconds)
+            await asyncio.sleep(_jittered(poll_delay))
         await self._flush_inflight_on_shutdown(timeout=2.0)
 
     async def _poll_reminders_loop(self) -> None:
@@ -1637,7 +1697,16 @@ class RelayDaemon:
 
                         dispatchable_reminders.append(msg)
 
-                    async def _dispatch_reminder(msg):
+                    async def _dispatch_reminder(msg, batch_remaining: list[int]):
+                        try:
+                            await _handle_reminder(msg)
+                        finally:
+                            batch_remaining[0] -= 1
+                            if batch_remaining[0] == 0:
+                                # One store write per dispatch batch, as soon as it finishes.
+                                await asyncio.to_thread(self.reminders_ingress.flush_processed)
+
+                    async def _handle_reminder(msg):
                         async with self._concurrency_sem:
                             try:
                                 started_at = time.monotonic()
@@ -1669,7 +1738,8 @@ class RelayDaemon:
                                             archive_list_name=self.settings.reminders_archive_list_name,
                                         )
                                 if occurrence_key:
-                                    self.reminders_ingress.mark_processed_occurrence(occurrence_key)
+                                    # Persisted when the last reminder of this batch finishes.
+                                    self.reminders_ingress.mark_processed_occurrence(occurrence_key, defer=True)
                                 self._record_connector_completion()
                             except Exception as exc:
                                 logger.exception(
@@ -1680,8 +1750,9 @@ class RelayDaemon:
                                 )
 
                     if dispatchable_reminders:
+                        batch_remaining = [len(dispatchable_reminders)]
                         for msg in dispatchable_reminders:
-                            self._spawn_dispatch_task(_dispatch_reminder(msg))
+                            self._spawn_dispatch_task(_dispatch_reminder(msg, batch_remaining))
                         await self._flush_inflight_on_shutdown()
                     self._record_loop_success("reminders")
                     self._publish_watchdog_state()
@@ -1690,6 +1761,8 @@ class RelayDaemon:
                 self._record_loop_failure("reminders", f"{type(exc).__name__}: {exc}")
 
             await asyncio.sleep(self.settings.reminders_poll_interval_seconds)
+        await self._flush_inflight_on_shutdown(timeout=2.0)
+        self.reminders_ingress.flush_processed()
 
     async def _poll_notes_loop(self) -> None:
         """Apple Notes polling loop."""
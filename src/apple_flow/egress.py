@@ -96,7 +96,7 @@ class IMessageEgress:
         )
 
     def _gc_recent(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         expired_fingerprints = [
             fingerprint
             for fingerprint, ts in self._recent_fingerprints.items()
@@ -143,7 +143,7 @@ class IMessageEgress:
 
     def mark_outbound(self, recipient: str, text: str) -> None:
         self._gc_recent()
-        now = time.time()
+        now = time.monotonic()
         self._recent_fingerprints[self._fingerprint(recipient, text)] = now
         normalized_sender = normalize_sender(recipient)
         normalized_text = normalize_echo_text(text)
@@ -152,7 +152,7 @@ class IMessageEgress:
 
     def mark_attachment_outbound(self, recipient: str) -> None:
         self._gc_recent()
-        self._recent_attachment_recipients[normalize_sender(recipient)] = time.time()
+        self._recent_attachment_recipients[normalize_sender(recipient)] = time.monotonic()
 
     def was_recent_attachment_outbound(self, sender: str) -> bool:
         self._gc_recent()
@@ -337,7 +337,7 @@ class IMessageEgress:
         self._gc_recent()
         outbound_fingerprint = self._fingerprint(recipient, text)
         last_ts = self._recent_fingerprints.get(outbound_fingerprint)
-        if last_ts is not None and (time.time() - last_ts) <= self.suppress_duplicate_outbound_seconds:
+        if last_ts is not None and (time.monotonic() - last_ts) <= self.suppress_duplicate_outbound_seconds:
             logger.info(
                 "Suppressing duplicate outbound message to %s (%s chars) within %.1fs window",
                 recipient,
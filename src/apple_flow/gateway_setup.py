@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 from . import apple_tools
-from .osascript_utils import run_osascript_with_recovery
+from .osascript_utils import (
+    is_app_not_running_error,
+    is_transient_osascript_error,
+    run_osascript_with_recovery,
+    warm_app,
+)
 
 
 @dataclass(frozen=True)
@@ -26,8 +32,11 @@ class GatewayResourceStatus:
     result: EnsureResult
 
 
+_APPLESCRIPT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def _escape_applescript(value: str) -> str:
-    return value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.translate(_APPLESCRIPT_ESCAPES)
 
 
 def _run_osascript(script: str, timeout_seconds: float = 12.0) -> subprocess.CompletedProcess[str]:
@@ -40,85 +49,140 @@ def _run_osascript(script: str, timeout_seconds: float = 12.0) -> subprocess.Com
     )
 
 
-def _ensure_via_applescript(script: str) -> EnsureResult:
-    app_name = ""
-    if 'tell application "Reminders"' in script:
-        app_name = "Reminders"
-    elif 'tell application "Notes"' in script:
-        app_name = "Notes"
-    elif 'tell application "Calendar"' in script:
-        app_name = "Calendar"
+# (application, AppleScript class) for each ensurable resource kind.
+_RESOURCE_KINDS = {
+    "reminders_list": ("Reminders", "list"),
+    "notes_folder": ("Notes", "folder"),
+    "calendar": ("Calendar", "calendar"),
+}
+
+# Extra passes over resources whose in-script error was recoverable
+# (app not running yet, or a transient Apple Events failure).
+_ENSURE_RECOVERY_ATTEMPTS = 2
+_ENSURE_RECOVERY_BACKOFF_SECONDS = 0.5
+
+_ONE_LINE_HANDLER = (
+    "on oneLine(txt)\n"
+    "  set AppleScript's text item delimiters to \" \"\n"
+    "  set flat to (paragraphs of (txt as text)) as text\n"
+    "  set AppleScript's text item delimiters to \"\"\n"
+    "  return flat\n"
+    "end oneLine\n"
+)
+
+
+def _ensure_block(kind: str, name: str) -> str:
+    app, cls = _RESOURCE_KINDS[kind]
+    safe_name = _escape_applescript(name)
+    return (
+        "try\n"
+        f'  tell application "{app}"\n'
+        f'    if not (exists {cls} "{safe_name}") then\n'
+        f'      make new {cls} with properties {{name:"{safe_name}"}}\n'
+        '      set end of outLines to "created"\n'
+        "    else\n"
+        '      set end of outLines to "exists"\n'
+        "    end if\n"
+        "  end tell\n"
+        "on error errMsg\n"
+        '  set end of outLines to "failed:" & my oneLine(errMsg)\n'
+        "end try\n"
+    )
 
+
+def _parse_ensure_marker(marker: str) -> EnsureResult:
+    marker = marker.strip()
+    if marker.lower() in ("created", "exists"):
+        return EnsureResult(status=marker.lower())
+    if marker.lower().startswith("failed:"):
+        return EnsureResult(status="failed", detail=marker[len("failed:"):].strip())
+    if marker:
+        return EnsureResult(status="failed", detail=f"unexpected output: {marker.lower()}")
+    return EnsureResult(status="failed", detail="empty AppleScript output")
+
+
+def _is_recoverable_failure(result: EnsureResult) -> bool:
+    return result.status == "failed" and (
+        is_app_not_running_error(result.detail) or is_transient_osascript_error(result.detail)
+    )
+
+
+def _ensure_many(resources: list[tuple[str, str]]) -> list[EnsureResult]:
+    """Ensure ``(kind, name)`` resources exist with a single osascript process.
+
+    Each resource runs in its own ``try`` block and reports one line, so a
+    failure in one app does not hide the others' results. Because those
+    errors never reach osascript's stderr, recovery happens here: apps that
+    reported "isn't running" are launched and only the failed resources are
+    re-run, as are resources that hit a transient Apple Events error.
+    """
+    if not resources:
+        return []
+    results = _run_ensure_script(resources)
+    warmed: set[str] = set()
+    for attempt in range(1, _ENSURE_RECOVERY_ATTEMPTS + 1):
+        retry = [index for index, result in enumerate(results) if _is_recoverable_failure(result)]
+        if not retry:
+            break
+        not_running = {
+            _RESOURCE_KINDS[resources[index][0]][0]
+            for index in retry
+            if is_app_not_running_error(results[index].detail)
+        }
+        newly_warmed = [app for app in sorted(not_running - warmed) if warm_app(app)]
+        warmed.update(not_running)
+        if not newly_warmed:
+            time.sleep(_ENSURE_RECOVERY_BACKOFF_SECONDS * attempt)
+        for index, result in zip(retry, _run_ensure_script([resources[index] for index in retry]), strict=True):
+            results[index] = result
+    return results
+
+
+def _run_ensure_script(resources: list[tuple[str, str]]) -> list[EnsureResult]:
+    script = (
+        _ONE_LINE_HANDLER
+        + "set outLines to {}\n"
+        + "".join(_ensure_block(kind, name) for kind, name in resources)
+        + "set AppleScript's text item delimiters to linefeed\n"
+        + "return outLines as text"
+    )
+    apps = {_RESOURCE_KINDS[kind][0] for kind, _name in resources}
     result = run_osascript_with_recovery(
         script,
-        app_name=app_name,
-        timeout=12.0,
+        # Warming is only meaningful when a single app is involved.
+        app_name=next(iter(apps)) if len(apps) == 1 else "",
+        timeout=12.0 + 4.0 * (len(resources) - 1),
         max_attempts=3,
     )
     if not result.ok:
-        return EnsureResult(status="failed", detail=result.detail)
-    marker = result.stdout.strip().lower()
-    if marker == "created":
-        return EnsureResult(status="created")
-    if marker == "exists":
-        return EnsureResult(status="exists")
-    if marker:
-        return EnsureResult(status="failed", detail=f"unexpected output: {marker}")
-    return EnsureResult(status="failed", detail="empty AppleScript output")
+        return [EnsureResult(status="failed", detail=result.detail) for _ in resources]
+    markers = result.stdout.splitlines()
+    markers += [""] * (len(resources) - len(markers))
+    return [_parse_ensure_marker(marker) for marker in markers[: len(resources)]]
 
 
-def ensure_reminders_list(list_name: str) -> EnsureResult:
-    selector = (list_name or "").strip()
-    path_parts = apple_tools.reminders_split_selector(selector)
-
-    if len(path_parts) > 1:
+def _nested_reminders_selector_error(list_name: str) -> EnsureResult | None:
+    if len(apple_tools.reminders_split_selector((list_name or "").strip())) > 1:
         return EnsureResult(
             status="failed",
             detail="nested Reminders selectors are unsupported; use a top-level list name",
         )
+    return None
 
-    safe_name = _escape_applescript(selector)
-    script = (
-        'tell application "Reminders"\n'
-        f'  if not (exists list "{safe_name}") then\n'
-        f'    make new list with properties {{name:"{safe_name}"}}\n'
-        '    return "created"\n'
-        "  else\n"
-        '    return "exists"\n'
-        "  end if\n"
-        "end tell"
-    )
-    return _ensure_via_applescript(script)
+
+def ensure_reminders_list(list_name: str) -> EnsureResult:
+    error = _nested_reminders_selector_error(list_name)
+    if error is not None:
+        return error
+    return _ensure_many([("reminders_list", (list_name or "").strip())])[0]
 
 
 def ensure_notes_folder(folder_name: str) -> EnsureResult:
-    safe_name = _escape_applescript(folder_name)
-    script = (
-        'tell application "Notes"\n'
-        f'  if not (exists folder "{safe_name}") then\n'
-        f'    make new folder with properties {{name:"{safe_name}"}}\n'
-        '    return "created"\n'
-        "  else\n"
-        '    return "exists"\n'
-        "  end if\n"
-        "end tell"
-    )
-    return _ensure_via_applescript(script)
+    return _ensure_many([("notes_folder", folder_name)])[0]
 
 
 def ensure_calendar(calendar_name: str) -> EnsureResult:
-    safe_name = _escape_applescript(calendar_name)
-    script = (
-        'tell application "Calendar"\n'
-        f'  if not (exists calendar "{safe_name}") then\n'
-        f'    make new calendar with properties {{name:"{safe_name}"}}\n'
-        '    return "created"\n'
-        "  else\n"
-        '    return "exists"\n'
-        "  end if\n"
-        "end tell"
-    )
-    return _ensure_via_applescript(script)
+    return _ensure_many([("calendar", calendar_name)])[0]
 
 
 def ensure_gateway_resources(
@@ -134,54 +198,38 @@ def ensure_gateway_resources(
     notes_log_folder_name: str,
     calendar_name: str,
 ) -> list[GatewayResourceStatus]:
-    statuses: list[GatewayResourceStatus] = []
+    """Ensure every enabled gateway resource exists, in one osascript call."""
+    wanted: list[tuple[str, str, str]] = []  # (label, kind, name)
     if enable_reminders:
-        statuses.append(
-            GatewayResourceStatus(
-                label="Reminders task list",
-                name=reminders_list_name,
-                result=ensure_reminders_list(reminders_list_name),
-            )
-        )
-        statuses.append(
-            GatewayResourceStatus(
-                label="Reminders archive list",
-                name=reminders_archive_list_name,
-                result=ensure_reminders_list(reminders_archive_list_name),
-            )
-        )
+        wanted.append(("Reminders task list", "reminders_list", reminders_list_name))
+        wanted.append(("Reminders archive list", "reminders_list", reminders_archive_list_name))
     if enable_notes:
-        statuses.append(
-            GatewayResourceStatus(
-                label="Notes task folder",
-                name=notes_folder_name,
-                result=ensure_notes_folder(notes_folder_name),
-            )
-        )
-        statuses.append(
-            GatewayResourceStatus(
-                label="Notes archive folder",
-                name=notes_archive_folder_name,
-                result=ensure_notes_folder(notes_archive_folder_name),
-            )
-        )
+        wanted.append(("Notes task folder", "notes_folder", notes_folder_name))
+        wanted.append(("Notes archive folder", "notes_folder", notes_archive_folder_name))
     if enable_notes_logging:
-        statuses.append(
-            GatewayResourceStatus(
-                label="Notes log folder",
-                name=notes_log_folder_name,
-                result=ensure_notes_folder(notes_log_folder_name),
-            )
-        )
+        wanted.append(("Notes log folder", "notes_folder", notes_log_folder_name))
     if enable_calendar:
-        statuses.append(
-            GatewayResourceStatus(
-                label="Calendar",
-                name=calendar_name,
-                result=ensure_calendar(calendar_name),
-            )
-        )
-    return statuses
+        wanted.append(("Calendar", "calendar", calendar_name))
+
+    results: dict[int, EnsureResult] = {}
+    batch: list[tuple[int, str, str]] = []
+    for index, (_label, kind, name) in enumerate(wanted):
+        if kind == "reminders_list":
+            error = _nested_reminders_selector_error(name)
+            if error is not None:
+                results[index] = error
+                continue
+            name = name.strip()
+        batch.append((index, kind, name))
+    for (index, _kind, _name), result in zip(
+        batch, _ensure_many([(kind, name) for _index, kind, name in batch]), strict=True
+    ):
+        results[index] = result
+
+    return [
+        GatewayResourceStatus(label=label, name=name, result=results[index])
+        for index, (label, _kind, name) in enumerate(wanted)
+    ]
 
 
 def resolve_binary(binary_name: str) -> str | None:
@@ -20,6 +20,11 @@ class IMessageIngress:
         self.max_attachment_size_mb = max_attachment_size_mb
         self._conn: sqlite3.Connection | None = None
         self._message_columns: set[str] | None = None
+        # MAX(ROWID) observed by the last fetch_new() whose batch was not
+        # truncated by ``limit``; None when unknown. Every row up to it either
+        # was returned or failed the sender filter, so callers may advance
+        # their cursor to it.
+        self.last_scanned_rowid: int | None = None
 
     def _connect(self) -> sqlite3.Connection:
         if self._conn is not None:
@@ -79,6 +84,7 @@ class IMessageIngress:
             predicate_parts.append("m.ROWID > ?")
             params.append(since_rowid)
 
+        self.last_scanned_rowid = None
         sender_candidates = self._sender_candidates(sender_allowlist or [])
         if require_sender_filter and not sender_candidates:
             return []
@@ -95,25 +101,36 @@ class IMessageIngress:
         has_attributed_body = "attributedBody" in columns
 
         attributed_body_select = "m.attributedBody AS attributed_body" if has_attributed_body else "X'' AS attributed_body"
+        # The tip is read in the same statement (and snapshot) as the batch, so
+        # an idle poll costs one query and still reports where the table ends.
         query = f"""
-            SELECT
-                m.ROWID as rowid,
-                COALESCE(h.id, m.destination_caller_id, 'unknown') as sender,
-                COALESCE(m.text, '') as text,
-                {attributed_body_select},
-                datetime(m.date / 1000000000 + strftime('%s','2001-01-01'), 'unixepoch') as received_at,
-                m.is_from_me as is_from_me
-            FROM message m
-            LEFT JOIN handle h ON h.ROWID = m.handle_id
-            {predicate}
-            ORDER BY m.ROWID ASC
-            LIMIT {int(limit)}
+            WITH tip AS (SELECT MAX(ROWID) AS tip_rowid FROM message)
+            SELECT tip.tip_rowid AS tip_rowid, batch.*
+            FROM tip
+            LEFT JOIN (
+                SELECT
+                    m.ROWID as rowid,
+                    COALESCE(h.id, m.destination_caller_id, 'unknown') as sender,
+                    COALESCE(m.text, '') as text,
+                    {attributed_body_select},
+                    datetime(m.date / 1000000000 + strftime('%s','2001-01-01'), 'unixepoch') as received_at,
+                    m.is_from_me as is_from_me
+                FROM message m
+                LEFT JOIN handle h ON h.ROWID = m.handle_id
+                {predicate}
+                ORDER BY m.ROWID ASC
+                LIMIT {int(limit)}
+            ) AS batch
+            ORDER BY batch.rowid ASC
         """
 
         if not self.db_path.exists():
             return []
 
-        rows = self._query_all(query, params)
+        result = self._query_all(query, params)
+        rows = [row for row in result if row["rowid"] is not None]
+        if result and result[0]["tip_rowid"] is not None and len(rows) < int(limit):
+            self.last_scanned_rowid = int(result[0]["tip_rowid"])
 
         messages = []
         for row in rows:
@@ -48,7 +48,7 @@ class AppleMailEgress:
         """
         outbound_fingerprint = self._fingerprint(recipient, text)
         last_ts = self._recent_fingerprints.get(outbound_fingerprint)
-        if last_ts is not None and (time.time() - last_ts) <= self.suppress_duplicate_outbound_seconds:
+        if last_ts is not None and (time.monotonic() - last_ts) <= self.suppress_duplicate_outbound_seconds:
             logger.info(
                 "Suppressing duplicate outbound email to %s (%s chars) within %.1fs window",
                 recipient,
@@ -284,7 +284,7 @@ class AppleMailEgress:
         return f"Re: {subject}"
 
     def _gc_recent(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         expired = [
             fp for fp, ts in self._recent_fingerprints.items() if (now - ts) > self.echo_window_seconds
         ]
@@ -304,7 +304,7 @@ class AppleMailEgress:
 
     def mark_outbound(self, recipient: str, text: str) -> None:
         self._gc_recent()
-        self._recent_fingerprints[self._fingerprint(recipient, text)] = time.time()
+        self._recent_fingerprints[self._fingerprint(recipient, text)] = time.monotonic()
         if self.signature:
             # Also fingerprint text+signature so bounced replies are detected
-            self._recent_fingerprints[self._fingerprint(recipient, text + self.signature)] = time.time()
+            self._recent_fingerprints[self._fingerprint(recipient, text + self.signature)] = time.monotonic()
@@ -170,7 +170,11 @@ def build_app(store: Any | None = None) -> FastAPI:
                 path=csv_path,
                 include_headers_if_missing=settings.csv_audit_include_headers_if_missing,
             )
-        active_store = SQLiteStore(Path(settings.db_path), csv_audit_logger=csv_audit_logger)
+        active_store = SQLiteStore(
+            Path(settings.db_path),
+            csv_audit_logger=csv_audit_logger,
+            journal_mode=settings.sqlite_journal_mode,
+        )
     if hasattr(active_store, "bootstrap"):
         try:
             active_store.bootstrap()
@@ -256,7 +260,9 @@ def build_app(store: Any | None = None) -> FastAPI:
 
     @app.get("/metrics", dependencies=[Depends(verify_token)])
     def metrics() -> dict[str, Any]:
-        events_count = len(app.state.store.list_events()) if hasattr(app.state.store, "list_events") else 0
+        events_count = (
+            len(app.state.store.list_events(include_payload=False)) if hasattr(app.state.store, "list_events") else 0
+        )
         runtime = _runtime_payload()["watchdog"]
         return {
             "active_sessions": len(app.state.store.list_sessions()),
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import logging
 import subprocess
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger("apple_flow.osascript_utils")
+
+# Compiled handlers are content-addressed, so restarts reuse them and a
+# changed script simply gets a new file.
+_COMPILED_SCRIPT_DIR = Path.home() / "Library" / "Caches" / "apple-flow" / "osascript"
 
 
 _TRANSIENT_MARKERS = (
@@ -68,9 +78,35 @@ def warm_app(app_name: str, *, timeout: float = 10.0) -> bool:
     return True
 
 
+def compile_applescript(source: str, name: str, *, timeout: float = 15.0) -> str | None:
+    """Compile ``source`` with osacompile into the user cache dir.
+
+    Returns the ``.scpt`` path (reused if already compiled), or None when
+    osacompile is unavailable or fails so callers can fall back to
+    ``osascript -e``.
+    """
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    target_path = _COMPILED_SCRIPT_DIR / f"{name}-{digest}.scpt"
+    if target_path.is_file():
+        return str(target_path)
+    target = str(target_path)
+    try:
+        _COMPILED_SCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+        result = _run_command(["osacompile", "-o", target, "-e", source], timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.debug("osacompile unavailable for %s: %s", name, exc)
+        return None
+    if result.returncode != 0:
+        logger.warning("osacompile failed for %s: %s", name, (result.stderr or "").strip())
+        return None
+    return target
+
+
 def run_osascript_with_recovery(
     script: str,
     *,
+    argv: Sequence[str] = (),
+    compiled_path: str | None = None,
     app_name: str = "",
     timeout: float = 30.0,
     max_attempts: int = 3,
@@ -84,7 +120,11 @@ def run_osascript_with_recovery(
 
     for attempt in range(1, attempts + 1):
         try:
-            result = _run_command(["osascript", "-e", script], timeout=timeout)
+            if compiled_path:
+                cmd = ["osascript", compiled_path, *argv]
+            else:
+                cmd = ["osascript", "-e", script, *argv]
+            result = _run_command(cmd, timeout=timeout)
         except subprocess.TimeoutExpired:
             last_stderr = "timed out"
             last_returncode = -1
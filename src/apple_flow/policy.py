@@ -11,11 +11,10 @@ class PolicyEngine:
     def __init__(self, settings: RelaySettings):
         self.settings = settings
         self._sender_windows: dict[str, deque[datetime]] = defaultdict(deque)
+        self._allowed_senders = frozenset(settings.allowed_senders)
 
     def is_sender_allowed(self, sender: str) -> bool:
-        if not self.settings.allowed_senders:
-            return False
-        return sender in self.settings.allowed_senders
+        return sender in self._allowed_senders
 
     def is_workspace_allowed(self, workspace: str) -> bool:
         candidate = Path(workspace).resolve()
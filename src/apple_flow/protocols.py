@@ -79,8 +79,8 @@ class StoreProtocol(Protocol):
         """Create an audit event."""
         ...
 
-    def list_events(self, limit: int = 200) -> list[dict[str, Any]]:
-        """List recent events."""
+    def list_events(self, limit: int = 200, *, include_payload: bool = True) -> list[dict[str, Any]]:
+        """List recent events; ``include_payload=False`` skips payload decoding."""
         ...
 
     def set_state(self, key: str, value: str) -> None:
@@ -91,6 +91,18 @@ class StoreProtocol(Protocol):
         """Get a key-value state entry."""
         ...
 
+    def list_reminder_occurrences(self) -> dict[str, int]:
+        """List processed reminder occurrence keys with last-seen unix times."""
+        ...
+
+    def upsert_reminder_occurrences(self, occurrences: list[tuple[str, int]]) -> None:
+        """Insert or refresh processed reminder occurrences."""
+        ...
+
+    def delete_reminder_occurrences(self, occurrence_keys: list[str]) -> int:
+        """Forget processed reminder occurrences."""
+        ...
+
     def close(self) -> None:
         """Close database connections."""
         ...
@@ -3,6 +3,10 @@
 Unlike iMessage/Mail egress which sends new messages, this egress *mutates*
 the source reminder: it writes the AI response into the reminder's notes
 field and marks it as completed.
+
+Each operation is a fixed AppleScript ``on run argv`` handler. Handlers are
+compiled once per process with ``osacompile`` and then invoked with native
+argv values, so no AppleScript string escaping is needed.
 """
 
 from __future__ import annotations
@@ -10,15 +14,113 @@ from __future__ import annotations
 import logging
 import subprocess
 
+from .osascript_utils import compile_applescript
+
 logger = logging.getLogger("apple_flow.reminders_egress")
 REMINDERS_APP_TARGET = 'application id "com.apple.reminders"'
 
+# argv: list id, list name, reminder id, result text
+_COMPLETE_SCRIPT = f'''
+on run argv
+    set listId to item 1 of argv
+    set listName to item 2 of argv
+    set reminderId to item 3 of argv
+    set resultText to item 4 of argv
+    tell {REMINDERS_APP_TARGET}
+        try
+            if listId is not "" then
+                set taskList to first list whose id is listId
+            else
+                set taskList to list listName
+            end if
+            set matchedReminder to (first reminder of taskList whose id is reminderId)
+            set body of matchedReminder to resultText
+            set completed of matchedReminder to true
+            return "ok"
+        on error errMsg
+            return "error: " & errMsg
+        end try
+    end tell
+end run
+'''
+
+# argv: list id, list name, reminder id, note
+_ANNOTATE_SCRIPT = f'''
+on run argv
+    set listId to item 1 of argv
+    set listName to item 2 of argv
+    set reminderId to item 3 of argv
+    set noteText to item 4 of argv
+    tell {REMINDERS_APP_TARGET}
+        try
+            if listId is not "" then
+                set taskList to first list whose id is listId
+            else
+                set taskList to list listName
+            end if
+            set matchedReminder to (first reminder of taskList whose id is reminderId)
+            set existingBody to body of matchedReminder
+            if existingBody is missing value then
+                set body of matchedReminder to noteText
+            else
+                set body of matchedReminder to existingBody & linefeed & linefeed & noteText
+            end if
+            return "ok"
+        on error errMsg
+            return "error: " & errMsg
+        end try
+    end tell
+end run
+'''
+
+# argv: source list id, source list name, archive list id, archive list name,
+#       reminder id, result text
+_ARCHIVE_SCRIPT = f'''
+on run argv
+    set sourceListId to item 1 of argv
+    set sourceListName to item 2 of argv
+    set archiveListId to item 3 of argv
+    set archiveListName to item 4 of argv
+    set reminderId to item 5 of argv
+    set resultText to item 6 of argv
+    tell {REMINDERS_APP_TARGET}
+        try
+            if sourceListId is not "" then
+                set sourceList to first list whose id is sourceListId
+            else
+                set sourceList to list sourceListName
+            end if
+            if archiveListId is not "" then
+                set archiveList to first list whose id is archiveListId
+            else
+                set archiveList to list archiveListName
+            end if
+            set matchedReminder to (first reminder of sourceList whose id is reminderId)
+            set body of matchedReminder to resultText
+            set completed of matchedReminder to true
+            move matchedReminder to archiveList
+            return "ok"
+        on error errMsg
+            return "error: " & errMsg
+        end try
+    end tell
+end run
+'''
+
+_SCRIPTS = {
+    "complete": _COMPLETE_SCRIPT,
+    "annotate": _ANNOTATE_SCRIPT,
+    "archive": _ARCHIVE_SCRIPT,
+}
+
 
 class AppleRemindersEgress:
     """Updates reminders in Reminders.app with AI results."""
 
     def __init__(self, list_name: str = "agent-task"):
         self.list_name = list_name
+        # script name -> compiled .scpt path, or None when osacompile failed.
+        self._compiled: dict[str, str | None] = {}
 
     def _resolve_list_selector(self, selector: str) -> dict[str, str] | None:
         from . import apple_tools
@@ -34,6 +136,26 @@ class AppleRemindersEgress:
             "source": str(resolved.get("source", "")),
         }
 
+    def _compiled_script(self, name: str) -> str | None:
+        """Compile the named handler once; return its .scpt path or None."""
+        if name not in self._compiled:
+            self._compiled[name] = compile_applescript(_SCRIPTS[name], f"reminders_{name}")
+        return self._compiled[name]
+
+    def _run_script(self, name: str, *args: str) -> subprocess.CompletedProcess[bytes]:
+        """Run a handler with argv, preferring the precompiled script."""
+        compiled = self._compiled_script(name)
+        if compiled is not None:
+            cmd = ["osascript", compiled, *args]
+        else:
+            cmd = ["osascript", "-e", _SCRIPTS[name], *args]
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=False,
+            timeout=15,
+        )
+
     def complete_reminder(self, reminder_id: str, result_text: str) -> bool:
         """Write ``result_text`` into the reminder's notes and mark it complete.
 
@@ -42,49 +164,23 @@ class AppleRemindersEgress:
         resolved_list = self._resolve_list_selector(self.list_name)
         if resolved_list is None:
             return False
-        if resolved_list.get("id"):
-            escaped_list_id = resolved_list["id"].replace('"', '\\"')
-            target_list_clause = f'set taskList to first list whose id is "{escaped_list_id}"'
-        else:
-            escaped_list_name = resolved_list["name"].replace('"', '\\"')
-            target_list_clause = f'set taskList to list "{escaped_list_name}"'
-        escaped_text = (
-            result_text
-            .replace("\\", "\\\\")
-            .replace('"', '\\"')
-            .replace("\n", "\\n")
-        )
-        escaped_id = reminder_id.replace('"', '\\"')
-
-        script = f'''
-        tell {REMINDERS_APP_TARGET}
-            try
-                {target_list_clause}
-                set matchedReminder to (first reminder of taskList whose id is "{escaped_id}")
-                set body of matchedReminder to "{escaped_text}"
-                set completed of matchedReminder to true
-                return "ok"
-            on error errMsg
-                return "error: " & errMsg
-            end try
-        end tell
-        '''
 
         try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=15,
+            result = self._run_script(
+                "complete",
+                resolved_list["id"],
+                resolved_list["name"],
+                reminder_id,
+                result_text,
             )
-            output = result.stdout.strip()
+            output = result.stdout.decode("utf-8", "replace").strip()
             if result.returncode != 0 or output.startswith("error:"):
                 logger.warning(
                     "Failed to complete reminder %s: rc=%s output=%s stderr=%s",
                     reminder_id,
                     result.returncode,
                     output,
-                    result.stderr.strip(),
+                    result.stderr.decode("utf-8", "replace").strip(),
                 )
                 return False
             logger.info("Completed reminder %s in list %r", reminder_id, self.list_name)
@@ -107,46 +203,16 @@ class AppleRemindersEgress:
         resolved_list = self._resolve_list_selector(self.list_name)
         if resolved_list is None:
             return False
-        if resolved_list.get("id"):
-            escaped_list_id = resolved_list["id"].replace('"', '\\"')
-            target_list_clause = f'set taskList to first list whose id is "{escaped_list_id}"'
-        else:
-            escaped_list_name = resolved_list["name"].replace('"', '\\"')
-            target_list_clause = f'set taskList to list "{escaped_list_name}"'
-        escaped_note = (
-            note
-            .replace("\\", "\\\\")
-            .replace('"', '\\"')
-            .replace("\n", "\\n")
-        )
-        escaped_id = reminder_id.replace('"', '\\"')
-
-        script = f'''
-        tell {REMINDERS_APP_TARGET}
-            try
-                {target_list_clause}
-                set matchedReminder to (first reminder of taskList whose id is "{escaped_id}")
-                set existingBody to body of matchedReminder
-                if existingBody is missing value then
-                    set body of matchedReminder to "{escaped_note}"
-                else
-                    set body of matchedReminder to existingBody & "\\n\\n" & "{escaped_note}"
-                end if
-                return "ok"
-            on error errMsg
-                return "error: " & errMsg
-            end try
-        end tell
-        '''
 
         try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=15,
+            result = self._run_script(
+                "annotate",
+                resolved_list["id"],
+                resolved_list["name"],
+                reminder_id,
+                note,
             )
-            output = result.stdout.strip()
+            output = result.stdout.decode("utf-8", "replace").strip()
             if result.returncode != 0 or output.startswith("error:"):
                 logger.warning(
                     "Failed to annotate reminder %s: rc=%s output=%s",
@@ -182,57 +248,24 @@ class AppleRemindersEgress:
         resolved_archive_list = self._resolve_list_selector(archive_list_name)
         if resolved_source_list is None or resolved_archive_list is None:
             return False
-        if resolved_source_list.get("id"):
-            escaped_source_id = resolved_source_list["id"].replace('"', '\\"')
-            source_list_clause = f'set sourceList to first list whose id is "{escaped_source_id}"'
-        else:
-            escaped_source_name = resolved_source_list["name"].replace('"', '\\"')
-            source_list_clause = f'set sourceList to list "{escaped_source_name}"'
-        if resolved_archive_list.get("id"):
-            escaped_archive_id = resolved_archive_list["id"].replace('"', '\\"')
-            archive_list_clause = f'set archiveList to first list whose id is "{escaped_archive_id}"'
-        else:
-            escaped_archive_name = resolved_archive_list["name"].replace('"', '\\"')
-            archive_list_clause = f'set archiveList to list "{escaped_archive_name}"'
-        escaped_text = (
-            result_text
-            .replace("\\", "\\\\")
-            .replace('"', '\\"')
-            .replace("\n", "\\n")
-        )
-        escaped_id = reminder_id.replace('"', '\\"')
-
-        script = f'''
-        tell {REMINDERS_APP_TARGET}
-            try
-                {source_list_clause}
-                {archive_list_clause}
-                set matchedReminder to (first reminder of sourceList whose id is "{escaped_id}")
-                set body of matchedReminder to "{escaped_text}"
-                set completed of matchedReminder to true
-                move matchedReminder to archiveList
-                return "ok"
-            on error errMsg
-                return "error: " & errMsg
-            end try
-        end tell
-        '''
-
         try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=15,
+            result = self._run_script(
+                "archive",
+                resolved_source_list["id"],
+                resolved_source_list["name"],
+                resolved_archive_list["id"],
+                resolved_archive_list["name"],
+                reminder_id,
+                result_text,
             )
-            output = result.stdout.strip()
+            output = result.stdout.decode("utf-8", "replace").strip()
             if result.returncode != 0 or output.startswith("error:"):
                 logger.warning(
                     "Failed to move reminder %s to archive: rc=%s output=%s stderr=%s",
                     reminder_id,
                     result.returncode,
                     output,
-                    result.stderr.strip(),
+                    result.stderr.decode("utf-8", "replace").strip(),
                 )
                 return False
             logger.info(
@@ -0,0 +1,145 @@
+"""Optional in-process EventKit backend for Reminders ingress.
+
+Fetching through EventKit avoids forking ``osascript`` and the Apple Events
+round trip on every poll. It needs PyObjC's EventKit bindings (the
+``eventkit`` extra) and Reminders access granted to the Python process.
+When either is missing, ``load_eventkit_backend`` returns None and the
+ingress keeps using AppleScript.
+
+Reminder ids are reported in the same ``x-apple-reminder://<id>`` form the
+AppleScript path uses, so egress and dedupe keys are unaffected: Reminders.app
+builds its scripting ``id`` from the same calendar item identifier.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger("apple_flow.reminders_eventkit")
+
+_EK_ENTITY_TYPE_REMINDER = 1
+_ACCESS_TIMEOUT_SECONDS = 10.0
+_FETCH_TIMEOUT_SECONDS = 30.0
+# Reminders.app's scripting ``id`` is this prefix plus the EKReminder's
+# calendarItemIdentifier, so both backends yield identical dedupe keys and
+# egress can look up EventKit-fetched reminders by id.
+_REMINDER_ID_PREFIX = "x-apple-reminder://"
+
+
+class EventKitRemindersBackend:
+    """Reads incomplete reminders from one Reminders list via EventKit."""
+
+    def __init__(self, event_kit: Any, event_store: Any):
+        self._ek = event_kit
+        self._store = event_store
+        # Bumped by EKEventStoreChangedNotification; the ingress compares it
+        # between polls to skip fetches while nothing has changed.
+        self.change_count = 0
+        self._observer: Any = None
+
+    def observe_changes(self) -> None:
+        """Subscribe to store change notifications (delivered on a private queue)."""
+        if self._observer is not None:
+            return
+        center = self._ek.NSNotificationCenter.defaultCenter()
+        queue = self._ek.NSOperationQueue.alloc().init()
+        self._observer = center.addObserverForName_object_queue_usingBlock_(
+            self._ek.EKEventStoreChangedNotification,
+            self._store,
+            queue,
+            self._on_store_changed,
+        )
+
+    def _on_store_changed(self, _notification: Any) -> None:
+        self.change_count += 1
+
+    def fetch_incomplete(self, list_name: str, limit: int) -> list[dict[str, str]] | None:
+        """Return up to ``limit`` incomplete reminders, or None if the list is ambiguous/missing."""
+        calendars = [
+            calendar
+            for calendar in self._store.calendarsForEntityType_(_EK_ENTITY_TYPE_REMINDER) or []
+            if str(calendar.title()) == list_name
+        ]
+        if len(calendars) != 1:
+            logger.debug("EventKit found %s Reminders lists named %r", len(calendars), list_name)
+            return None
+
+        predicate = self._store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+            None, None, calendars
+        )
+        done = threading.Event()
+        fetched: list[Any] = []
+
+        def _completion(reminders: Any) -> None:
+            fetched.extend(reminders or [])
+            done.set()
+
+        self._store.fetchRemindersMatchingPredicate_completion_(predicate, _completion)
+        if not done.wait(_FETCH_TIMEOUT_SECONDS):
+            logger.warning("EventKit reminders fetch timed out after %.0fs", _FETCH_TIMEOUT_SECONDS)
+            return None
+
+        rows: list[dict[str, str]] = []
+        for reminder in fetched:
+            if len(rows) >= limit:
+                break
+            rows.append(
+                {
+                    "id": f"{_REMINDER_ID_PREFIX}{reminder.calendarItemIdentifier()}",
+                    "name": str(reminder.title() or "")[:1000],
+                    "body": str(reminder.notes() or "")[:4000],
+                    "creation_date": _format_nsdate(reminder.creationDate()),
+                    "due_date": self._format_due(reminder.dueDateComponents()),
+                }
+            )
+        return rows
+
+    def _format_due(self, components: Any) -> str:
+        if components is None:
+            return ""
+        calendar = components.calendar() or self._ek.NSCalendar.currentCalendar()
+        date = calendar.dateFromComponents_(components)
+        if date is None:
+            return ""
+        formatter = self._ek.NSDateFormatter.alloc().init()
+        formatter.setDateFormat_("yyyy-MM-dd HH:mm:ss")
+        return str(formatter.stringFromDate_(date))
+
+
+def _format_nsdate(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def load_eventkit_backend() -> EventKitRemindersBackend | None:
+    """Import EventKit and request Reminders access; None when unavailable or denied."""
+    try:
+        import EventKit  # type: ignore[import-not-found]
+    except ImportError:
+        logger.info("PyObjC EventKit not installed; Reminders ingress will use AppleScript")
+        return None
+
+    event_store = EventKit.EKEventStore.alloc().init()
+    granted = threading.Event()
+    result: dict[str, bool] = {"ok": False}
+
+    def _completion(ok: bool, error: Any) -> None:
+        result["ok"] = bool(ok)
+        if error is not None:
+            logger.warning("EventKit Reminders access error: %s", error)
+        granted.set()
+
+    if hasattr(event_store, "requestFullAccessToRemindersWithCompletion_"):
+        event_store.requestFullAccessToRemindersWithCompletion_(_completion)
+    else:
+        event_store.requestAccessToEntityType_completion_(_EK_ENTITY_TYPE_REMINDER, _completion)
+    if not granted.wait(_ACCESS_TIMEOUT_SECONDS) or not result["ok"]:
+        logger.warning("EventKit Reminders access not granted; falling back to AppleScript")
+        return None
+    backend = EventKitRemindersBackend(EventKit, event_store)
+    try:
+        backend.observe_changes()
+    except Exception as exc:  # noqa: BLE001 - PyObjC surfaces arbitrary errors
+        logger.warning("EventKit change notifications unavailable: %s", exc)
+    return backend
@@ -10,14 +10,22 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from . import apple_tools
 from .models import InboundMessage
-from .osascript_utils import run_osascript_with_recovery
+from .osascript_utils import compile_applescript, run_osascript_with_recovery
 from .protocols import StoreProtocol
+from .reminders_eventkit import EventKitRemindersBackend, load_eventkit_backend
 from .utils import normalize_sender
 
 logger = logging.getLogger("apple_flow.reminders_ingress")
@@ -27,6 +35,170 @@ REMINDERS_APP_TARGET = 'application id "com.apple.reminders"'
 _PROCESSED_IDS_KEY = "reminders_processed_ids"
 _PROCESSED_OCCURRENCES_KEY = "reminders_processed_occurrences"
 
+# Bounds for the processed-occurrence dedupe map. Entries are refreshed whenever
+# a full scan still sees the reminder open, so only occurrences that have left
+# the list age out.
+_PROCESSED_OCCURRENCES_MAX = 10_000
+_PROCESSED_OCCURRENCES_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Extra look-back applied to the modification-date watermark so edits landing
+# while a poll is in flight are never missed.
+_MODIFIED_SINCE_SLACK_SECONDS = 5
+
+# Reminders.app's on-disk Core Data stores (current and pre-Catalina layouts).
+# Any write by Reminders touches these files, so their stat() signature is a
+# cheap change trigger that avoids spawning osascript while nothing changes.
+_REMINDERS_STORE_DIRS = (
+    Path.home() / "Library" / "Group Containers" / "group.com.apple.reminders" / "Container_v1" / "Stores",
+    Path.home() / "Library" / "Reminders" / "Container_v1" / "Stores",
+)
+
+
+# argv: list id, list name, max count, modified-since lookback seconds ("" = full scan)
+_FETCH_SCRIPT = f'''
+on pad2(n)
+    set nStr to n as text
+    if (length of nStr) is 1 then
+        return "0" & nStr
+    end if
+    return nStr
+end pad2
+
+on isoLocalDate(d)
+    set y to year of d as integer
+    set m to month of d as integer
+    set dd to day of d as integer
+    set hh to hours of d as integer
+    set mm to minutes of d as integer
+    set ss to seconds of d as integer
+    return (y as text) & "-" & my pad2(m) & "-" & my pad2(dd) & " " & my pad2(hh) & ":" & my pad2(mm) & ":" & my pad2(ss)
+end isoLocalDate
+
+on jsonEscape(txt)
+    set bs to character id 92
+    set AppleScript's text item delimiters to bs
+    set parts to text items of txt
+    set AppleScript's text item delimiters to bs & bs
+    set txt to parts as text
+    set AppleScript's text item delimiters to quote
+    set parts to text items of txt
+    set AppleScript's text item delimiters to bs & quote
+    set txt to parts as text
+    set AppleScript's text item delimiters to linefeed
+    set parts to text items of txt
+    set AppleScript's text item delimiters to bs & "n"
+    set txt to parts as text
+    set AppleScript's text item delimiters to return
+    set parts to text items of txt
+    set AppleScript's text item delimiters to bs & "r"
+    set txt to parts as text
+    set AppleScript's text item delimiters to ""
+    return txt
+end jsonEscape
+
+on jsonField(fieldName, fieldValue)
+    return quote & fieldName & quote & ":" & quote & fieldValue & quote
+end jsonField
+
+on run argv
+    set listId to item 1 of argv
+    set listName to item 2 of argv
+    set lookbackText to item 4 of argv
+    tell {REMINDERS_APP_TARGET}
+        set maxCount to (item 3 of argv) as integer
+        set outputLines to {{}}
+
+        if listId is not "" then
+            set taskList to first list whose id is listId
+        else
+            set taskList to list listName
+        end if
+
+        if lookbackText is "" then
+            set openItems to (every reminder of taskList whose completed is false)
+        else
+            set modifiedCutoff to (current date) - (lookbackText as integer)
+            set openItems to (every reminder of taskList whose completed is false and modification date > modifiedCutoff)
+        end if
+
+        repeat with rem in openItems
+            if (count of outputLines) >= maxCount then exit repeat
+
+            set rId to id of rem
+            if rId is missing value then
+                set rIdStr to ""
+            else
+                set rIdStr to my jsonEscape(rId as text)
+            end if
+
+            set rName to name of rem
+            if rName is missing value then
+                set rNameStr to ""
+            else
+                set rNameText to rName as text
+                if length of rNameText > 1000 then set rNameText to text 1 thru 1000 of rNameText
+                set rNameStr to my jsonEscape(rNameText)
+            end if
+
+            try
+                set rBody to body of rem
+                if rBody is missing value then
+                    set rBodyStr to ""
+                else
+                    set rBodyText to rBody as text
+                    if length of rBodyText > 4000 then set rBodyText to text 1 thru 4000 of rBodyText
+                    set rBodyStr to my jsonEscape(rBodyText)
+                end if
+            on error
+                set rBodyStr to ""
+            end try
+
+            try
+                set rCreation to creation date of rem
+                if rCreation is missing value then
+                    set rCreationStr to ""
+                else
+                    set rCreationStr to my jsonEscape(rCreation as text)
+                end if
+            on error
+                set rCreationStr to ""
+            end try
+
+            try
+                set rDue to due date of rem
+                if rDue is missing value then
+                    set rDueStr to ""
+                else
+                    try
+                        set rDueStr to my isoLocalDate(rDue)
+                    on error
+                        set rDueStr to my jsonEscape(rDue as text)
+                    end try
+                end if
+            on error
+                set rDueStr to ""
+            end try
+
+            set end of outputLines to "{{" & my jsonField("id", rIdStr) & "," & my jsonField("name", rNameStr) & "," & my jsonField("body", rBodyStr) & "," & my jsonField("creation_date", rCreationStr) & "," & my jsonField("due_date", rDueStr) & "}}"
+        end repeat
+
+        set AppleScript's text item delimiters to linefeed
+        return (outputLines as text)
+    end tell
+end run
+'''
+
+
+@dataclass(frozen=True, slots=True)
+class _RawReminder:
+    """One reminder row as emitted by the AppleScript fetch."""
+
+    id: str
+    name: str = ""
+    body: str = ""
+    creation_date: str = ""
+    due_date: str = ""
+
 
 class AppleRemindersIngress:
     """Reads incomplete reminders from a designated Reminders.app list."""
@@ -40,6 +212,8 @@ class AppleRemindersIngress:
         due_delay_seconds: int = 60,
         timezone_name: str = "",
         store: StoreProtocol | None = None,
+        idle_poll_interval_seconds: float = 0.0,
+        use_eventkit: bool = False,
     ):
         self.list_name = list_name
         self.owner_sender = normalize_sender(owner_sender)
@@ -49,27 +223,35 @@ class AppleRemindersIngress:
         self.timezone_name = timezone_name.strip()
         self._tzinfo = self._load_timezone(self.timezone_name)
         self._store = store
-        self._processed_occurrences: set[str] = set()
+        self.idle_poll_interval_seconds = max(0.0, float(idle_poll_interval_seconds))
+        self._last_store_signature: object | None = None
+        self._last_fetch_at = 0.0
+        # occurrence key -> unix time it was last marked or seen open (oldest first).
+        self._processed_occurrences: OrderedDict[str, int] = OrderedDict()
+        # Marks recorded in memory but not yet written to the store (see flush_processed).
+        self._unflushed_occurrences: dict[str, int] = {}
+        self._unflushed_evictions: set[str] = set()
+        # Guards the three structures above; fetch_new runs in a worker thread
+        # while dispatch tasks mark occurrences from the event loop.
+        self._occurrences_lock = threading.Lock()
         self._resolved_list_cache: dict[str, str] | None = None
+        # Compiled fetch handler path; None falls back to ``osascript -e``.
+        self._compiled_fetch_script: str | None = None
+        self._fetch_script_compiled = False
+        # Monotonic start time of the last poll that left nothing pending.
+        # When set, the next fetch only asks Reminders for items modified since.
+        self._modified_since: float | None = None
+        # In-process EventKit reader (opt-in); None keeps the AppleScript path.
+        # Loaded on the first fetch: the access request can block for seconds.
+        self.use_eventkit = use_eventkit
+        self._eventkit: EventKitRemindersBackend | None = None
+        self._eventkit_loaded = False
         self.last_fetch_error: str = ""
         # Hydrate processed occurrence keys from persistent store on startup.
         if store is not None:
-            raw_occurrences = store.get_state(_PROCESSED_OCCURRENCES_KEY)
-            if raw_occurrences:
-                try:
-                    self._processed_occurrences = set(json.loads(raw_occurrences))
-                except (json.JSONDecodeError, TypeError):
-                    self._processed_occurrences = set()
-            else:
-                # Backward-compatible migration from reminder-id-only dedupe.
-                raw_ids = store.get_state(_PROCESSED_IDS_KEY)
-                if raw_ids:
-                    try:
-                        legacy_ids = set(json.loads(raw_ids))
-                    except (json.JSONDecodeError, TypeError):
-                        legacy_ids = set()
-                    self._processed_occurrences = {self._occurrence_key(reminder_id, "") for reminder_id in legacy_ids}
-                    self._persist_processed_occurrences()
+            self._processed_occurrences = OrderedDict(store.list_reminder_occurrences())
+            if not self._processed_occurrences:
+                self._migrate_kv_state(store)
 
     def fetch_new(
         self,
@@ -82,36 +264,72 @@ class AppleRemindersIngress:
 
         Parameters mirror the ingress interface for compatibility.
         ``since_rowid`` and ``sender_allowlist`` are unused (Reminders is local-only).
+
+        After a poll that leaves nothing pending (no new or due-deferred
+        reminders, no truncation), the next poll only scans reminders modified
+        since then. Any pending work falls back to a full scan.
+
+        When ``idle_poll_interval_seconds`` is set (opt-in) and nothing is
+        pending, the fetch is skipped entirely while Reminders reports no
+        change, with a backup fetch at least once per idle interval. The
+        change signal is EventKit's store-changed notification when that
+        backend is active, otherwise the Reminders store file stats.
         """
-        raw_reminders = self._fetch_incomplete_via_applescript(limit)
+        self.flush_processed()
+        if self.use_eventkit and not self._eventkit_loaded:
+            self._eventkit = load_eventkit_backend()
+            self._eventkit_loaded = True
+        poll_started = time.monotonic()
+        signature = self._change_signature() if self.idle_poll_interval_seconds else None
+        if (
+            signature is not None
+            and self._modified_since is not None
+            and signature == self._last_store_signature
+            and poll_started - self._last_fetch_at < self.idle_poll_interval_seconds
+        ):
+            return []
+        self._last_store_signature = signature
+        self._last_fetch_at = poll_started
+        raw_reminders = self._fetch_incomplete_via_eventkit(limit)
+        full_scan = raw_reminders is not None or self._modified_since is None
+        if raw_reminders is None:
+            raw_reminders = self._fetch_incomplete_via_applescript(limit)
+        truncated = len(raw_reminders) >= limit
+        pending = truncated
+        now_epoch = int(time.time())
         resolved_list = self._resolved_list_cache
         if resolved_list is None and ("/" in self.list_name or "\\" in self.list_name):
             resolved_list = self._resolve_list_selector()
         messages: list[InboundMessage] = []
 
+        due_cutoff: datetime | None = None
+        trigger_tag = self.trigger_tag
+
+        # Checks run cheapest-first; string cleanup waits until a reminder is kept.
         for raw in raw_reminders:
-            reminder_id = raw.get("id", "")
+            if len(messages) >= limit:
+                pending = True
+                break
+
+            reminder_id = raw.id
             if not reminder_id:
                 continue
 
-            name = (raw.get("name", "") or "").strip()
-            body = (raw.get("body", "") or "").strip()
-            creation_date = raw.get("creation_date", "")
-            due_date = raw.get("due_date", "")
+            due_date = raw.due_date
             occurrence_key = self._occurrence_key(reminder_id, due_date)
-            raw_list_path = str(raw.get("list_path", "") or "")
-            raw_list_id = str(raw.get("list_id", "") or "")
 
             # Skip already-processed occurrences.
-            if occurrence_key in self._processed_occurrences:
+            with self._occurrences_lock:
+                processed = occurrence_key in self._processed_occurrences
+                if processed and full_scan:
+                    self._processed_occurrences[occurrence_key] = now_epoch
+                    self._processed_occurrences.move_to_end(occurrence_key)
+            if processed:
                 continue
 
             # Skip reminders that don't contain the trigger tag (if configured).
-            if self.trigger_tag:
-                if self.trigger_tag not in name and self.trigger_tag not in body:
-                    continue
-                name = name.replace(self.trigger_tag, "").strip()
-                body = body.replace(self.trigger_tag, "").strip()
+            if trigger_tag and trigger_tag not in raw.name and trigger_tag not in raw.body:
+                continue
 
             # Due-tagged reminders are dispatched only after due time + configured delay.
             if due_date:
@@ -123,22 +341,35 @@ class AppleRemindersIngress:
                         due_date,
                     )
                     continue
-                cutoff = self._now() - timedelta(seconds=self.due_delay_seconds)
-                if due_at > cutoff:
+                if due_cutoff is None:
+                    due_cutoff = self._now() - timedelta(seconds=self.due_delay_seconds)
+                if due_at > due_cutoff:
+                    # Unmodified reminders must still be re-fetched once due.
+                    pending = True
                     continue
 
+            name = raw.name
+            body = raw.body
+            if trigger_tag:
+                name = name.replace(trigger_tag, "")
+                body = body.replace(trigger_tag, "")
+            name = name.strip()
+            body = body.strip()
+
             # Build the task text from reminder name + notes.
             text = self._compose_text(name, body, due_date)
             if not text:
                 continue
 
+            pending = True
+
             # Prefix with task: or idea: depending on auto_approve setting.
             if self.auto_approve:
                 prefixed_text = f"relay: {text}"
             else:
                 prefixed_text = f"task: {text}"
 
-            received_at = creation_date or datetime.now(timezone.utc).isoformat()
+            received_at = raw.creation_date or datetime.now(timezone.utc).isoformat()
 
             messages.append(
                 InboundMessage(
@@ -152,21 +383,61 @@ class AppleRemindersIngress:
                         "reminder_id": reminder_id,
                         "occurrence_key": occurrence_key,
                         "reminder_name": name,
-                        "list_name": (resolved_list or {}).get("path") or raw_list_path or self.list_name,
-                        "list_path": (resolved_list or {}).get("path") or raw_list_path,
-                        "list_id": (resolved_list or {}).get("id") or raw_list_id,
+                        "list_name": (resolved_list or {}).get("path") or self.list_name,
+                        "list_path": (resolved_list or {}).get("path", ""),
+                        "list_id": (resolved_list or {}).get("id", ""),
                     },
                 )
             )
 
-        return messages[:limit]
+        if full_scan and not truncated and not self.last_fetch_error:
+            self._prune_processed_occurrences(now_epoch)
+        if pending or self.last_fetch_error:
+            self._modified_since = None
+        else:
+            self._modified_since = poll_started
+        return messages
+
+    def mark_processed_occurrence(self, occurrence_key: str, *, defer: bool = False) -> None:
+        """Record an occurrence key as processed so it won't be fetched again.
 
-    def mark_processed_occurrence(self, occurrence_key: str) -> None:
-        """Record an occurrence key as processed so it won't be fetched again."""
-        if not occurrence_key:
+        With ``defer=True`` the key takes effect in memory immediately but is
+        written by the next ``flush_processed()`` (the daemon flushes once per
+        dispatch batch; ``fetch_new`` also flushes first), so a burst of
+        completions shares one commit.
+        """
+        self.mark_processed_many([occurrence_key], defer=defer)
+
+    def mark_processed_many(self, occurrence_keys: Iterable[str], *, defer: bool = False) -> None:
+        """Record several occurrence keys as processed with a single store commit."""
+        seen_at = int(time.time())
+        with self._occurrences_lock:
+            for occurrence_key in occurrence_keys:
+                if not occurrence_key:
+                    continue
+                self._processed_occurrences[occurrence_key] = seen_at
+                self._processed_occurrences.move_to_end(occurrence_key)
+                self._unflushed_occurrences[occurrence_key] = seen_at
+            while len(self._processed_occurrences) > _PROCESSED_OCCURRENCES_MAX:
+                evicted = self._processed_occurrences.popitem(last=False)[0]
+                self._unflushed_occurrences.pop(evicted, None)
+                self._unflushed_evictions.add(evicted)
+        if not defer:
+            self.flush_processed()
+
+    def flush_processed(self) -> None:
+        """Write pending processed-occurrence marks and evictions to the store."""
+        with self._occurrences_lock:
+            upserts = list(self._unflushed_occurrences.items())
+            evictions = list(self._unflushed_evictions)
+            self._unflushed_occurrences.clear()
+            self._unflushed_evictions.clear()
+        if self._store is None:
             return
-        self._processed_occurrences.add(occurrence_key)
-        self._persist_processed_occurrences()
+        if upserts:
+            self._store.upsert_reminder_occurrences(upserts)
+        if evictions:
+            self._store.delete_reminder_occurrences(evictions)
 
     def mark_processed(self, reminder_id: str) -> None:
         """Backward-compatible helper for id-only callers."""
@@ -176,10 +447,91 @@ class AppleRemindersIngress:
         """Not applicable for Reminders.  Returns 0 as sentinel."""
         return 0
 
-    def _persist_processed_occurrences(self) -> None:
-        """Persist processed reminder occurrence keys to the store."""
-        if self._store is not None:
-            self._store.set_state(_PROCESSED_OCCURRENCES_KEY, json.dumps(sorted(self._processed_occurrences)))
+    def _change_signature(self) -> object | None:
+        """Token that differs whenever Reminders may have changed; None if unknown."""
+        if self._eventkit is not None:
+            return ("eventkit", self._eventkit.change_count)
+        return self._store_signature()
+
+    @staticmethod
+    def _store_signature() -> tuple[tuple[str, int, int], ...] | None:
+        """Return (name, mtime_ns, size) for Reminders store files, or None if unreadable."""
+        entries: list[tuple[str, int, int]] = []
+        for directory in _REMINDERS_STORE_DIRS:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                continue
+        if not entries:
+            return None
+        return tuple(sorted(entries))
+
+    def _migrate_kv_state(self, store: StoreProtocol) -> None:
+        """One-shot move of JSON-in-kv_state dedupe keys into the reminders_processed table."""
+        raw_occurrences = store.get_state(_PROCESSED_OCCURRENCES_KEY)
+        loaded: OrderedDict[str, int] = OrderedDict()
+        if raw_occurrences:
+            try:
+                loaded = self._load_occurrences(json.loads(raw_occurrences))
+            except (json.JSONDecodeError, TypeError, ValueError):
+                loaded = OrderedDict()
+        else:
+            # Backward-compatible migration from reminder-id-only dedupe.
+            raw_ids = store.get_state(_PROCESSED_IDS_KEY)
+            if raw_ids:
+                try:
+                    legacy_ids = set(json.loads(raw_ids))
+                except (json.JSONDecodeError, TypeError):
+                    legacy_ids = set()
+                loaded = self._load_occurrences(
+                    [self._occurrence_key(reminder_id, "") for reminder_id in legacy_ids]
+                )
+        if not loaded:
+            return
+        self._processed_occurrences = loaded
+        store.upsert_reminder_occurrences(list(loaded.items()))
+        store.set_state(_PROCESSED_OCCURRENCES_KEY, "")
+        store.set_state(_PROCESSED_IDS_KEY, "")
+
+    def _prune_processed_occurrences(self, now_epoch: int) -> None:
+        """Drop occurrences not marked or seen open within the TTL.
+
+        Only called after a complete full scan, which has just refreshed every
+        processed reminder that is still open.
+        """
+        expires_before = now_epoch - _PROCESSED_OCCURRENCES_TTL_SECONDS
+        pruned: list[str] = []
+        with self._occurrences_lock:
+            while self._processed_occurrences:
+                key, seen_at = next(iter(self._processed_occurrences.items()))
+                if seen_at >= expires_before:
+                    break
+                del self._processed_occurrences[key]
+                pruned.append(key)
+        if pruned and self._store is not None:
+            self._store.delete_reminder_occurrences(pruned)
+
+    @staticmethod
+    def _load_occurrences(raw: object) -> OrderedDict[str, int]:
+        """Build the dedupe map from legacy kv_state JSON.
+
+        Accepts a ``{key: unix_time}`` object or a plain list of keys, which
+        are stamped with the current time.
+        """
+        if isinstance(raw, dict):
+            items = sorted(((str(key), int(ts)) for key, ts in raw.items()), key=lambda item: item[1])
+        elif isinstance(raw, list):
+            now_epoch = int(time.time())
+            items = [(str(key), now_epoch) for key in raw]
+        else:
+            raise TypeError(f"unexpected processed occurrences payload: {type(raw).__name__}")
+        return OrderedDict(items[-_PROCESSED_OCCURRENCES_MAX:])
 
     def _resolve_list_selector(self) -> dict[str, str] | None:
         if not self.list_name:
@@ -199,135 +551,59 @@ class AppleRemindersIngress:
         }
         return self._resolved_list_cache
 
-    def _fetch_incomplete_via_applescript(self, limit: int) -> list[dict[str, str]]:
-        """Run AppleScript to get incomplete reminders as tab-delimited records.
+    def _fetch_incomplete_via_eventkit(self, limit: int) -> list[_RawReminder] | None:
+        """Fetch through EventKit when enabled; None means use AppleScript instead.
+
+        EventKit always returns the full incomplete set, so results count as a
+        full scan. Nested list paths are left to the AppleScript resolver.
+        """
+        if self._eventkit is None or "/" in self.list_name or "\\" in self.list_name:
+            return None
+        try:
+            rows = self._eventkit.fetch_incomplete(self.list_name, int(limit))
+        except Exception as exc:  # noqa: BLE001 - PyObjC surfaces arbitrary errors
+            logger.warning("EventKit reminders fetch failed, using AppleScript: %s", exc)
+            return None
+        if rows is None:
+            return None
+        self.last_fetch_error = ""
+        return [
+            _RawReminder(
+                id=row.get("id", ""),
+                name=row.get("name", ""),
+                body=row.get("body", ""),
+                creation_date=row.get("creation_date", ""),
+                due_date=row.get("due_date", ""),
+            )
+            for row in rows
+        ]
+
+    def _fetch_incomplete_via_applescript(self, limit: int) -> list[_RawReminder]:
+        """Run the fetch handler to get incomplete reminders as NDJSON records.
 
-        Performance: O(N) where N is the total text size, using bulk string
-        replacements instead of character-by-character loops.
+        The handler is compiled once per ingress and receives the list,
+        limit and modified-since lookback as argv. Each call is still one
+        ``osascript`` process; the EventKit backend avoids the spawn.
         """
         resolved_list = self._resolve_list_selector()
         if self.list_name and resolved_list is None:
             self.last_fetch_error = f"list selector not found: {self.list_name}"
             return []
-        if resolved_list and resolved_list.get("id"):
-            escaped_list_id = resolved_list["id"].replace('"', '\\"')
-            target_list_clause = f'set taskList to first list whose id is "{escaped_list_id}"'
-        else:
-            escaped_list_name = self.list_name.replace('"', '\\"')
-            target_list_clause = f'set taskList to list "{escaped_list_name}"'
-
-        script = f'''
-        on pad2(n)
-            set nStr to n as text
-            if (length of nStr) is 1 then
-                return "0" & nStr
-            end if
-            return nStr
-        end pad2
-
-        on isoLocalDate(d)
-            set y to year of d as integer
-            set m to month of d as integer
-            set dd to day of d as integer
-            set hh to hours of d as integer
-            set mm to minutes of d as integer
-            set ss to seconds of d as integer
-            return (y as text) & "-" & my pad2(m) & "-" & my pad2(dd) & " " & my pad2(hh) & ":" & my pad2(mm) & ":" & my pad2(ss)
-        end isoLocalDate
-
-        on sanitise(txt)
-            set AppleScript's text item delimiters to tab
-            set parts to text items of txt
-            set AppleScript's text item delimiters to " "
-            set txt to parts as text
-            set AppleScript's text item delimiters to linefeed
-            set parts to text items of txt
-            set AppleScript's text item delimiters to " "
-            set txt to parts as text
-            set AppleScript's text item delimiters to return
-            set parts to text items of txt
-            set AppleScript's text item delimiters to " "
-            set txt to parts as text
-            set AppleScript's text item delimiters to ""
-            return txt
-        end sanitise
-
-        tell {REMINDERS_APP_TARGET}
-            set maxCount to {int(limit)}
-            set outputLines to {{}}
-
-            {target_list_clause}
-
-            set openItems to (every reminder of taskList whose completed is false)
-
-            repeat with rem in openItems
-                if (count of outputLines) >= maxCount then exit repeat
-
-                set rId to id of rem
-                if rId is missing value then
-                    set rIdStr to ""
-                else
-                    set rIdStr to my sanitise(rId as text)
-                end if
-
-                set rName to name of rem
-                if rName is missing value then
-                    set rNameStr to ""
-                else
-                    set rNameText to rName as text
-                    if length of rNameText > 1000 then set rNameText to text 1 thru 1000 of rNameText
-                    set rNameStr to my sanitise(rNameText)
-                end if
+        list_id = (resolved_list or {}).get("id", "")
 
-                try
-                    set rBody to body of rem
-                    if rBody is missing value then
-                        set rBodyStr to ""
-                    else
-                        set rBodyText to rBody as text
-                        if length of rBodyText > 4000 then set rBodyText to text 1 thru 4000 of rBodyText
-                        set rBodyStr to my sanitise(rBodyText)
-                    end if
-                on error
-                    set rBodyStr to ""
-                end try
-
-                try
-                    set rCreation to creation date of rem
-                    if rCreation is missing value then
-                        set rCreationStr to ""
-                    else
-                        set rCreationStr to my sanitise(rCreation as text)
-                    end if
-                on error
-                    set rCreationStr to ""
-                end try
-
-                try
-                    set rDue to due date of rem
-                    if rDue is missing value then
-                        set rDueStr to ""
-                    else
-                        try
-                            set rDueStr to my isoLocalDate(rDue)
-                        on error
-                            set rDueStr to my sanitise(rDue as text)
-                        end try
-                    end if
-                on error
-                    set rDueStr to ""
-                end try
+        lookback = ""
+        if self._modified_since is not None:
+            # Relative cutoff avoids locale-dependent AppleScript date literals.
+            lookback = str(int(time.monotonic() - self._modified_since) + _MODIFIED_SINCE_SLACK_SECONDS)
 
-                set end of outputLines to rIdStr & tab & rNameStr & tab & rBodyStr & tab & rCreationStr & tab & rDueStr
-            end repeat
-
-            set AppleScript's text item delimiters to linefeed
-            return (outputLines as text)
-        end tell
-        '''
+        if not self._fetch_script_compiled:
+            self._compiled_fetch_script = compile_applescript(_FETCH_SCRIPT, "reminders_fetch")
+            self._fetch_script_compiled = True
 
         result = run_osascript_with_recovery(
-            script,
+            _FETCH_SCRIPT,
+            argv=(list_id, self.list_name, str(int(limit)), lookback),
+            compiled_path=self._compiled_fetch_script,
             app_name="Reminders",
             timeout=30.0,
             max_attempts=3,
@@ -339,39 +615,44 @@ class AppleRemindersIngress:
         output = result.stdout.rstrip("\r\n")
         if not output:
             return []
-        return self._parse_tab_delimited(output)
+        return self._parse_ndjson(output)
 
     @staticmethod
-    def _parse_tab_delimited(output: str) -> list[dict[str, str]]:
-        """Parse tab-delimited reminders output into list of dicts."""
-        reminders: list[dict[str, str]] = []
+    def _parse_ndjson(output: str) -> list[_RawReminder]:
+        """Parse one JSON object per line into ``_RawReminder`` rows.
+
+        ``strict=False`` tolerates raw control characters (e.g. tabs) that the
+        AppleScript escaper leaves in place; malformed lines are skipped.
+        """
+        reminders: list[_RawReminder] = []
         for line in output.splitlines():
-            parts = line.split("\t")
-            if len(parts) < 4:
+            if not line:
                 continue
-            reminders.append({
-                "id": parts[0],
-                "name": parts[1],
-                "body": parts[2],
-                "creation_date": parts[3],
-                "due_date": parts[4] if len(parts) >= 5 else "",
-            })
+            try:
+                record = json.loads(line, strict=False)
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed reminders record: %r", line[:200])
+                continue
+            if not isinstance(record, dict):
+                continue
+            reminders.append(
+                _RawReminder(
+                    id=str(record.get("id", "")),
+                    name=str(record.get("name", "")),
+                    body=str(record.get("body", "")),
+                    creation_date=str(record.get("creation_date", "")),
+                    due_date=str(record.get("due_date", "")),
+                )
+            )
         return reminders
 
     @staticmethod
     def _compose_text(name: str, body: str, due_date: str) -> str:
         """Build task text from reminder name, notes, and optional due date."""
-        parts: list[str] = []
-        if name:
-            parts.append(name)
-        if due_date:
-            parts.append(f"[due: {due_date}]")
+        header = f"{name} [due: {due_date}]" if name and due_date else name
         if body:
-            parts.append(f"\n\n{body}")
-        return " ".join(parts) if len(parts) <= 2 and not body else "\n".join(filter(None, [
-            f"{name} [due: {due_date}]" if name and due_date else name,
-            body,
-        ]))
+            return f"{header}\n{body}" if header else body
+        return header
 
     @staticmethod
     def _occurrence_key(reminder_id: str, due_date: str) -> str:
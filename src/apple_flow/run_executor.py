@@ -3,11 +3,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-import time
+from collections import deque
 from typing import Any
-from uuid import uuid4
 
 from .models import RunState
+from .utils import short_id
 
 logger = logging.getLogger("apple_flow.run_executor")
 
@@ -30,7 +30,14 @@ class RunExecutor:
         self.lease_seconds = max(30, int(lease_seconds))
         self.recovery_scan_seconds = max(5.0, float(recovery_scan_seconds))
         self._worker_ids = [f"worker_{i}" for i in range(self.worker_count)]
-        self._last_recovery_scan = 0.0
+        # Idle workers park on this event; enqueue() sets it from any thread.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._job_available: asyncio.Event | None = None
+        # Jobs claimed in a batch on behalf of idle peers, oldest first. Their
+        # leases are renewed from claim time until a worker picks them up.
+        self._prefetched: deque[dict[str, Any]] = deque()
+        self._prefetch_keepalive: dict[str, list[asyncio.TimerHandle]] = {}
+        self._idle_workers = 0
 
     def enqueue(
         self,
@@ -44,35 +51,72 @@ class RunExecutor:
         plan_summary: str,
         phase: str = "executor",
     ) -> str:
-        job_id = f"job_{uuid4().hex[:12]}"
-        self.store.enqueue_run_job(
-            job_id=job_id,
-            run_id=run_id,
-            sender=sender,
-            phase=phase,
-            attempt=int(attempt),
-            payload={
-                "request_id": request_id,
-                "extra_instructions": extra_instructions,
-                "approval_sender": approval_sender,
-                "plan_summary": plan_summary,
-            },
-        )
-        self.store.update_run_state(run_id, RunState.QUEUED.value)
-        self.store.create_event(
-            event_id=f"evt_{uuid4().hex[:12]}",
-            run_id=run_id,
-            step="executor_queue",
-            event_type="execution_queued",
-            payload={"job_id": job_id, "attempt": int(attempt), "phase": phase},
-        )
+        job_id = short_id("job_")
+        payload = {
+            "request_id": request_id,
+            "extra_instructions": extra_instructions,
+            "approval_sender": approval_sender,
+            "plan_summary": plan_summary,
+        }
+        event_id = short_id("evt_")
+        event_payload = {"job_id": job_id, "attempt": int(attempt), "phase": phase}
+        if hasattr(self.store, "queue_run_job"):
+            # One commit for job insert, run state and event.
+            self.store.queue_run_job(
+                job_id=job_id,
+                run_id=run_id,
+                sender=sender,
+                phase=phase,
+                attempt=int(attempt),
+                payload=payload,
+                run_state=RunState.QUEUED.value,
+                event_id=event_id,
+                step="executor_queue",
+                event_type="execution_queued",
+                event_payload=event_payload,
+            )
+        else:
+            self.store.enqueue_run_job(
+                job_id=job_id,
+                run_id=run_id,
+                sender=sender,
+                phase=phase,
+                attempt=int(attempt),
+                payload=payload,
+            )
+            self.store.update_run_state(run_id, RunState.QUEUED.value)
+            self.store.create_event(
+                event_id=event_id,
+                run_id=run_id,
+                step="executor_queue",
+                event_type="execution_queued",
+                payload=event_payload,
+            )
+        self._notify_job_available()
         return job_id
 
+    def _notify_job_available(self) -> None:
+        """Wake idle workers; safe to call from worker threads or the loop."""
+        loop, event = self._loop, self._job_available
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
     async def run_forever(self, is_shutdown: Any) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._job_available = asyncio.Event()
         tasks = [
             asyncio.create_task(self._supervise_worker(worker_id, is_shutdown))
             for worker_id in self._worker_ids
         ]
+        tasks.append(asyncio.create_task(self._recovery_loop(is_shutdown)))
         try:
             await asyncio.gather(*tasks)
         except asyncio.CancelledError:
@@ -80,6 +124,8 @@ class RunExecutor:
                 task.cancel()
             await asyncio.gather(*tasks, return_exceptions=True)
             return
+        finally:
+            self._release_prefetched()
 
     def _restart_backoff_seconds(self, attempt: int) -> float:
         if attempt <= 1:
@@ -110,24 +156,87 @@ class RunExecutor:
     async def _worker_loop(self, worker_id: str, is_shutdown: Any) -> None:
         try:
             while not is_shutdown():
-                await self._maybe_recover_expired_jobs()
-                job = self.store.claim_next_run_job(worker_id=worker_id, lease_seconds=self.lease_seconds)
-                if not job:
-                    await asyncio.sleep(0.25)
-                    continue
-                await self._execute_job(worker_id=worker_id, job=job)
+                job = self._pop_prefetched()
+                if job is None:
+                    job_available = self._job_available
+                    if job_available is not None:
+                        job_available.clear()
+                    # Claim one job for this worker plus one per idle peer in a
+                    # single statement; the extras are handed to those peers.
+                    jobs = self.store.claim_next_run_jobs(
+                        worker_id=worker_id,
+                        lease_seconds=self.lease_seconds,
+                        limit=1 + self._idle_workers,
+                    )
+                    if not jobs:
+                        await self._wait_for_job(job_available)
+                        continue
+                    job = jobs[0]
+                    for extra in jobs[1:]:
+                        self._prefetch_keepalive[str(extra.get("job_id", ""))] = self._schedule_lease_renewal(
+                            job_id=str(extra.get("job_id", "")),
+                            worker_id=str(extra.get("lease_owner") or worker_id),
+                        )
+                        self._prefetched.append(extra)
+                    if job_available is not None:
+                        # More jobs may be queued or prefetched; let idle peers look.
+                        job_available.set()
+                # Renewals must use the lease owner, which may be the peer that claimed it.
+                lease_owner = str(job.get("lease_owner") or worker_id)
+                await self._execute_job(worker_id=lease_owner, job=job)
         except asyncio.CancelledError:
             return
 
-    async def _maybe_recover_expired_jobs(self) -> None:
-        now = time.monotonic()
-        if (now - self._last_recovery_scan) < self.recovery_scan_seconds:
+    def _pop_prefetched(self) -> dict[str, Any] | None:
+        if not self._prefetched:
+            return None
+        job = self._prefetched.popleft()
+        keepalive = self._prefetch_keepalive.pop(str(job.get("job_id", "")), None)
+        if keepalive:
+            keepalive[0].cancel()
+        return job
+
+    def _release_prefetched(self) -> None:
+        """Requeue prefetched jobs no worker started, so a restart can claim them at once."""
+        by_owner: dict[str, list[str]] = {}
+        while self._prefetched:
+            job = self._pop_prefetched()
+            if job is not None:
+                by_owner.setdefault(str(job.get("lease_owner") or ""), []).append(str(job.get("job_id", "")))
+        for owner, job_ids in by_owner.items():
+            try:
+                released = self.store.release_run_jobs(job_ids=job_ids, worker_id=owner)
+                logger.info("Released %d prefetched run jobs held by %s", released, owner)
+            except Exception as exc:
+                logger.warning("Failed to release prefetched run jobs %s: %s", job_ids, exc)
+
+    async def _wait_for_job(self, job_available: asyncio.Event | None) -> None:
+        """Sleep until a job is enqueued, bounded so shutdown is still noticed."""
+        if job_available is None:
+            await asyncio.sleep(0.25)
             return
-        self._last_recovery_scan = now
+        self._idle_workers += 1
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(job_available.wait(), timeout=self.recovery_scan_seconds)
+        finally:
+            self._idle_workers -= 1
+
+    async def _recovery_loop(self, is_shutdown: Any) -> None:
+        """Requeue expired leases once per scan interval for all workers."""
+        try:
+            while not is_shutdown():
+                self._recover_expired_jobs()
+                await asyncio.sleep(self.recovery_scan_seconds)
+        except asyncio.CancelledError:
+            return
+
+    def _recover_expired_jobs(self) -> None:
         try:
             count = self.store.requeue_expired_run_jobs()
             if count:
                 logger.warning("Recovered %d expired run job leases", count)
+                self._notify_job_available()
         except Exception as exc:
             logger.debug("Failed run job recovery scan: %s", exc)
 
@@ -138,8 +247,9 @@ class RunExecutor:
         sender = str(job.get("sender", ""))
         payload = job.get("payload") or {}
 
-        # Keep the lease alive while execution is happening in a thread.
-        keepalive = asyncio.create_task(self._lease_keepalive(job_id=job_id, worker_id=worker_id))
+        # Keep the lease alive while execution is happening in a thread. Nothing
+        # is written until the first interval elapses, so short jobs never renew.
+        keepalive = self._schedule_lease_renewal(job_id=job_id, worker_id=worker_id)
         try:
             result = await asyncio.to_thread(
                 self.approval_handler.execute_queued_run,
@@ -151,8 +261,12 @@ class RunExecutor:
                 plan_summary=str(payload.get("plan_summary", "")),
                 approval_sender=str(payload.get("approval_sender", sender)),
             )
-            run = self.store.get_run(run_id) or {}
-            run_state = run.get("state")
+            final_state = getattr(result, "final_state", None)
+            if final_state is not None:
+                run_state = final_state.value
+            else:
+                # Checkpoint/voice paths leave the state in the store only.
+                run_state = (self.store.get_run(run_id) or {}).get("state")
             if run_state == RunState.QUEUED.value:
                 # A queued state after execution means we checkpointed/requeued.
                 self.store.complete_run_job(job_id=job_id, status="completed")
@@ -170,25 +284,54 @@ class RunExecutor:
                 len(result.response or ""),
             )
         except Exception as exc:
-            self.store.complete_run_job(job_id=job_id, status="failed", error_text=f"{type(exc).__name__}: {exc}")
-            self.store.update_run_state(run_id, RunState.FAILED.value)
-            self.store.create_event(
-                event_id=f"evt_{uuid4().hex[:12]}",
-                run_id=run_id,
-                step="executor_queue",
-                event_type="execution_failed",
-                payload={"job_id": job_id, "reason": f"{type(exc).__name__}: {exc}"},
-            )
+            reason = f"{type(exc).__name__}: {exc}"
+            event_id = short_id("evt_")
+            event_payload = {"job_id": job_id, "reason": reason}
+            if hasattr(self.store, "fail_run_job"):
+                self.store.fail_run_job(
+                    job_id=job_id,
+                    run_id=run_id,
+                    error_text=reason,
+                    run_state=RunState.FAILED.value,
+                    event_id=event_id,
+                    step="executor_queue",
+                    event_type="execution_failed",
+                    event_payload=event_payload,
+                )
+            else:
+                self.store.complete_run_job(job_id=job_id, status="failed", error_text=reason)
+                self.store.update_run_state(run_id, RunState.FAILED.value)
+                self.store.create_event(
+                    event_id=event_id,
+                    run_id=run_id,
+                    step="executor_queue",
+                    event_type="execution_failed",
+                    payload=event_payload,
+                )
             logger.exception("Run job failed job_id=%s run_id=%s: %s", job_id, run_id, exc)
         finally:
-            keepalive.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await keepalive
+            keepalive[0].cancel()
 
-    async def _lease_keepalive(self, *, job_id: str, worker_id: str) -> None:
+    def _schedule_lease_renewal(self, *, job_id: str, worker_id: str) -> list[asyncio.TimerHandle]:
+        """Renew the lease every ``lease_seconds / 3`` via a self-rescheduling timer.
+
+        Returns a one-item holder for the pending handle; cancel ``holder[0]``
+        to stop renewing.
+        """
+        loop = asyncio.get_running_loop()
         interval = max(5.0, float(self.lease_seconds) / 3.0)
-        while True:
-            await asyncio.sleep(interval)
-            ok = self.store.renew_run_job_lease(job_id=job_id, worker_id=worker_id, lease_seconds=self.lease_seconds)
-            if not ok:
-                return
+        holder: list[asyncio.TimerHandle] = []
+
+        def _renew() -> None:
+            try:
+                ok = self.store.renew_run_job_lease(
+                    job_id=job_id, worker_id=worker_id, lease_seconds=self.lease_seconds
+                )
+            except Exception as exc:
+                logger.warning("Lease renewal failed job_id=%s: %s", job_id, exc)
+                ok = True
+            if ok:
+                holder[0] = loop.call_later(interval, _renew)
+
+        holder.append(loop.call_later(interval, _renew))
+        return holder
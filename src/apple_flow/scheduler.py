@@ -1,20 +1,30 @@
 """Follow-up scheduler with SQLite-backed trigger table.
 
 Schedules actions (follow-ups, retries, nudges) that fire at specific times.
-The companion loop checks ``check_due()`` on each cycle.
+The companion loop claims due actions with ``pop_due()`` on each cycle.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+import time
+from datetime import datetime
 from typing import Any
-from uuid import uuid4
+
+from .utils import json_dumps, json_loads, short_id
 
 logger = logging.getLogger("apple_flow.scheduler")
 
 
+def _decode_payload(raw: Any) -> Any:
+    try:
+        return json_loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
+
 class FollowUpScheduler:
     """Manages time-triggered actions stored in the SQLite store."""
 
@@ -37,10 +47,32 @@ class FollowUpScheduler:
                     trigger_at TEXT NOT NULL,
                     payload_json TEXT NOT NULL,
                     status TEXT NOT NULL DEFAULT 'pending',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    trigger_at_ms INTEGER
                 );
-                CREATE INDEX IF NOT EXISTS idx_scheduled_trigger
-                    ON scheduled_actions(status, trigger_at);
+                """
+            )
+            # Migration: integer trigger time (unix ms) for tables created before it.
+            try:
+                conn.execute("SELECT trigger_at_ms FROM scheduled_actions LIMIT 1").fetchone()
+            except sqlite3.OperationalError:
+                conn.execute("ALTER TABLE scheduled_actions ADD COLUMN trigger_at_ms INTEGER")
+            # trigger_at holds naive local time; 'utc' converts it to epoch seconds.
+            conn.execute(
+                """
+                UPDATE scheduled_actions
+                SET trigger_at_ms = CAST(strftime('%s', trigger_at, 'utc') AS INTEGER) * 1000
+                WHERE trigger_at_ms IS NULL
+                """
+            )
+            # Only pending rows are ever looked up by trigger time; a partial
+            # index stays proportional to outstanding work, not history.
+            conn.executescript(
+                """
+                DROP INDEX IF EXISTS idx_scheduled_trigger;
+                DROP INDEX IF EXISTS idx_scheduled_trigger_ms;
+                CREATE INDEX IF NOT EXISTS idx_scheduled_pending_trigger
+                    ON scheduled_actions(trigger_at_ms) WHERE status = 'pending';
                 """
             )
             conn.commit()
@@ -66,8 +98,9 @@ class FollowUpScheduler:
             The action_id of the scheduled action.
         """
         hours = hours_from_now if hours_from_now is not None else self.default_follow_up_hours
-        action_id = f"sched_{uuid4().hex[:10]}"
-        trigger_at = (datetime.now() + timedelta(hours=hours)).isoformat()
+        action_id = short_id("sched_", 5)
+        trigger_epoch = time.time() + hours * 3600
+        trigger_at = datetime.fromtimestamp(trigger_epoch).isoformat()
         payload_data = payload or {}
         payload_data["run_id"] = run_id
 
@@ -75,10 +108,10 @@ class FollowUpScheduler:
         with self.store._lock:
             conn.execute(
                 """
-                INSERT INTO scheduled_actions(action_id, sender, action_type, trigger_at, payload_json)
-                VALUES(?, ?, ?, ?, ?)
+                INSERT INTO scheduled_actions(action_id, sender, action_type, trigger_at, trigger_at_ms, payload_json)
+                VALUES(?, ?, ?, ?, ?, ?)
                 """,
-                (action_id, sender, action_type, trigger_at, json.dumps(payload_data)),
+                (action_id, sender, action_type, trigger_at, int(trigger_epoch * 1000), json_dumps(payload_data)),
             )
             conn.commit()
 
@@ -90,34 +123,68 @@ class FollowUpScheduler:
 
     def check_due(self) -> list[dict[str, Any]]:
         """Return all pending actions whose trigger time has passed."""
-        now = datetime.now().isoformat()
+        now_ms = int(time.time() * 1000)
         conn = self.store._connect()
         with self.store._lock:
             rows = conn.execute(
                 """
                 SELECT action_id, sender, action_type, trigger_at, payload_json, status
                 FROM scheduled_actions
-                WHERE status = 'pending' AND trigger_at <= ?
-                ORDER BY trigger_at ASC
+                WHERE status = 'pending' AND trigger_at_ms <= ?
+                ORDER BY trigger_at_ms ASC
                 """,
-                (now,),
+                (now_ms,),
             ).fetchall()
 
-        results = []
-        for row in rows:
-            try:
-                payload = json.loads(row["payload_json"])
-            except (json.JSONDecodeError, TypeError):
-                payload = {}
-            results.append({
+        return [
+            {
+                "action_id": row["action_id"],
+                "sender": row["sender"],
+                "action_type": row["action_type"],
+                "trigger_at": row["trigger_at"],
+                "payload": _decode_payload(row["payload_json"]),
+                "status": row["status"],
+            }
+            for row in rows
+        ]
+
+    def pop_due(self) -> list[dict[str, Any]]:
+        """Mark all due pending actions fired and return them, in one statement.
+
+        Unlike ``check_due()`` + ``mark_fired()``, an action can only be
+        returned to one caller, and a cycle costs a single commit.
+        """
+        now_ms = int(time.time() * 1000)
+        conn = self.store._connect()
+        with self.store._lock:
+            rows = conn.execute(
+                """
+                UPDATE scheduled_actions
+                SET status = 'fired'
+                WHERE action_id IN (
+                    SELECT action_id FROM scheduled_actions
+                    WHERE status = 'pending' AND trigger_at_ms <= ?
+                )
+                AND status = 'pending'
+                RETURNING action_id, sender, action_type, trigger_at, trigger_at_ms, payload_json, status
+                """,
+                (now_ms,),
+            ).fetchall()
+            conn.commit()
+
+        # RETURNING order is unspecified; keep check_due()'s trigger order.
+        rows = sorted(rows, key=lambda row: row["trigger_at_ms"] or 0)
+        return [
+            {
                 "action_id": row["action_id"],
                 "sender": row["sender"],
                 "action_type": row["action_type"],
                 "trigger_at": row["trigger_at"],
-                "payload": payload,
+                "payload": _decode_payload(row["payload_json"]),
                 "status": row["status"],
-            })
-        return results
+            }
+            for row in rows
+        ]
 
     def mark_fired(self, action_id: str) -> None:
         """Mark a scheduled action as fired."""
@@ -149,7 +216,7 @@ class FollowUpScheduler:
                     SELECT action_id, sender, action_type, trigger_at, payload_json
                     FROM scheduled_actions
                     WHERE status = 'pending' AND sender = ?
-                    ORDER BY trigger_at ASC
+                    ORDER BY trigger_at_ms ASC
                     """,
                     (sender,),
                 ).fetchall()
@@ -159,21 +226,17 @@ class FollowUpScheduler:
                     SELECT action_id, sender, action_type, trigger_at, payload_json
                     FROM scheduled_actions
                     WHERE status = 'pending'
-                    ORDER BY trigger_at ASC
+                    ORDER BY trigger_at_ms ASC
                     """,
                 ).fetchall()
 
-        results = []
-        for row in rows:
-            try:
-                payload = json.loads(row["payload_json"])
-            except (json.JSONDecodeError, TypeError):
-                payload = {}
-            results.append({
+        return [
+            {
                 "action_id": row["action_id"],
                 "sender": row["sender"],
                 "action_type": row["action_type"],
                 "trigger_at": row["trigger_at"],
-                "payload": payload,
-            })
-        return results
+                "payload": _decode_payload(row["payload_json"]),
+            }
+            for row in rows
+        ]
@@ -8,19 +8,27 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import os
 import re
 import secrets
 import sys
 from pathlib import Path
 
 from .gateway_setup import GatewayResourceStatus, ensure_gateway_resources, resolve_binary
+from .utils import atomic_write_text
+
+_PHONE_RE = re.compile(r"\+\d{7,15}")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# Matches both `KEY=value` and commented-out `# KEY=value` template lines.
+# Applied to the whole template, so leading whitespace must not span lines.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*#?[^\S\n]*([A-Za-z_][A-Za-z0-9_]*)=(.*)$", re.MULTILINE)
 
 
 def validate_phone(value: str) -> str | None:
     """Validate E.164 phone number format."""
     cleaned = value.strip()
-    if re.fullmatch(r"\+\d{7,15}", cleaned):
+    if _PHONE_RE.fullmatch(cleaned):
         return cleaned
     return None
 
@@ -28,7 +36,7 @@ def validate_phone(value: str) -> str | None:
 def validate_email(value: str) -> str | None:
     """Validate basic email format."""
     cleaned = value.strip()
-    if re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", cleaned):
+    if _EMAIL_RE.fullmatch(cleaned):
         return cleaned
     return None
 
@@ -49,9 +57,9 @@ def check_messages_db_access(db_path: Path | None = None) -> tuple[bool, str]:
     db_path = db_path or (Path.home() / "Library" / "Messages" / "chat.db")
     if not db_path.exists():
         return False, f"Messages DB not found at {db_path}"
+    # Full Disk Access is enforced at open(); no bytes need to be read.
     try:
-        with db_path.open("rb") as handle:
-            handle.read(32)
+        os.close(os.open(db_path, os.O_RDONLY))
         return True, "OK"
     except PermissionError:
         return False, "Permission denied (grant Full Disk Access to your terminal app)"
@@ -80,10 +88,18 @@ def generate_env(
 ) -> str:
     """Generate full `.env` content from `.env.example` with setup overrides."""
     env_example = _find_env_example_path()
-    if not env_example.exists():
-        raise FileNotFoundError(f".env.example not found at {env_example}")
+    try:
+        mtime_ns = env_example.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f".env.example not found at {env_example}") from None
+    template = _load_env_example(str(env_example), mtime_ns)
 
     effective_token = admin_api_token.strip() or secrets.token_hex(32)
+    enabled = frozenset(gateways)
+    mail_on = "mail" in enabled
+    reminders_on = "reminders" in enabled
+    notes_on = "notes" in enabled
+    calendar_on = "calendar" in enabled
     overrides: dict[str, str] = {
         "apple_flow_allowed_senders": phone,
         "apple_flow_allowed_workspaces": workspace,
@@ -101,27 +117,27 @@ def generate_env(
         "apple_flow_approval_ttl_minutes": "20",
         "apple_flow_max_messages_per_minute": "30",
         "apple_flow_admin_api_token": effective_token,
-        "apple_flow_enable_mail_polling": "true" if "mail" in gateways else "false",
-        "apple_flow_mail_allowed_senders": mail_address if "mail" in gateways else "",
-        "apple_flow_mail_from_address": mail_address if "mail" in gateways else "",
-        "apple_flow_enable_reminders_polling": "true" if "reminders" in gateways else "false",
+        "apple_flow_enable_mail_polling": "true" if mail_on else "false",
+        "apple_flow_mail_allowed_senders": mail_address if mail_on else "",
+        "apple_flow_mail_from_address": mail_address if mail_on else "",
+        "apple_flow_enable_reminders_polling": "true" if reminders_on else "false",
         "apple_flow_reminders_list_name": reminders_list_name,
         "apple_flow_reminders_archive_list_name": reminders_archive_list_name,
-        "apple_flow_reminders_owner": phone if "reminders" in gateways else "",
-        "apple_flow_enable_notes_polling": "true" if "notes" in gateways else "false",
+        "apple_flow_reminders_owner": phone if reminders_on else "",
+        "apple_flow_enable_notes_polling": "true" if notes_on else "false",
         "apple_flow_notes_folder_name": notes_folder_name,
         "apple_flow_notes_archive_folder_name": notes_archive_folder_name,
-        "apple_flow_notes_owner": phone if "notes" in gateways else "",
-        "apple_flow_enable_notes_logging": "true" if "notes" in gateways and enable_notes_logging else "false",
+        "apple_flow_notes_owner": phone if notes_on else "",
+        "apple_flow_enable_notes_logging": "true" if notes_on and enable_notes_logging else "false",
         "apple_flow_notes_log_folder_name": notes_log_folder_name,
-        "apple_flow_enable_calendar_polling": "true" if "calendar" in gateways else "false",
+        "apple_flow_enable_calendar_polling": "true" if calendar_on else "false",
         "apple_flow_calendar_name": calendar_name,
-        "apple_flow_calendar_owner": phone if "calendar" in gateways else "",
+        "apple_flow_calendar_owner": phone if calendar_on else "",
         "apple_flow_enable_memory": "true" if enable_agent_office else "false",
         "apple_flow_soul_file": soul_file,
     }
 
-    rendered = _render_env_from_example(env_example.read_text(encoding="utf-8"), overrides)
+    rendered = _render_env_from_example(template, overrides)
     if not rendered.endswith("\n"):
         rendered += "\n"
     return rendered
@@ -136,51 +152,42 @@ def _find_env_example_path() -> Path:
     return Path(__file__).resolve().parents[2] / ".env.example"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_env_example(path: str, mtime_ns: int) -> str:
+    """Read the template once per (path, mtime); edits invalidate via the new mtime."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 def _render_env_from_example(template: str, overrides: dict[str, str]) -> str:
-    key_line_re = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
-    commented_key_line_re = re.compile(r"^\s*#\s*([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
-    lines = template.splitlines()
     seen: set[str] = set()
-    rendered: list[str] = []
-
-    for line in lines:
-        key_match = key_line_re.match(line)
-        if key_match:
-            key = key_match.group(1)
-            if key in overrides:
-                rendered.append(f"{key}={overrides[key]}")
-                seen.add(key)
-            else:
-                rendered.append(line)
-            continue
 
-        commented_key_match = commented_key_line_re.match(line)
-        if commented_key_match:
-            key = commented_key_match.group(1)
-            if key in overrides:
-                rendered.append(f"{key}={overrides[key]}")
-                seen.add(key)
-            else:
-                rendered.append(line)
-            continue
+    def _replace(match: re.Match[str]) -> str:
+        key = match.group(1)
+        if key not in overrides:
+            return match.group(0)
+        seen.add(key)
+        return f"{key}={overrides[key]}"
 
-        rendered.append(line)
+    # One substitution pass over the template; untouched lines are never split out.
+    rendered = _ENV_LINE_RE.sub(_replace, template.replace("\r\n", "\n"))
+    if rendered.endswith("\n"):
+        rendered = rendered[:-1]
 
-    missing = [key for key in overrides if key not in seen]
+    missing = sorted(key for key in overrides if key not in seen)
     if missing:
-        rendered.append("")
-        rendered.append("# Added by setup wizard")
-        for key in sorted(missing):
-            rendered.append(f"{key}={overrides[key]}")
+        footer = "\n".join(f"{key}={overrides[key]}" for key in missing)
+        head = f"{rendered}\n" if template else ""
+        rendered = f"{head}\n# Added by setup wizard\n{footer}"
 
-    return "\n".join(rendered)
+    return rendered
 
 
 def _ask(prompt: str, *, default: str = "", validator=None, allow_empty: bool = False) -> str:
+    suffix = f" [{default}]" if default else ""
+    full_prompt = f"{prompt}{suffix}: "
     while True:
-        suffix = f" [{default}]" if default else ""
         try:
-            raw = input(f"{prompt}{suffix}: ").strip()
+            raw = input(full_prompt).strip()
         except (KeyboardInterrupt, EOFError):
             print("\nSetup cancelled.")
             raise SystemExit(1) from None
@@ -241,18 +248,15 @@ def _choose_gateways() -> list[str]:
         if not raw:
             return []
         parts = [item.strip() for item in raw.split(",") if item.strip()]
-        picked: list[str] = []
-        valid = True
-        for part in parts:
-            if not part.isdigit() or not (1 <= int(part) <= len(gateways)):
-                print(f"  Invalid selection: {part!r}")
-                valid = False
-                break
-            gateway = gateways[int(part) - 1]
-            if gateway not in picked:
-                picked.append(gateway)
-        if valid:
-            return picked
+        invalid = next(
+            (part for part in parts if not part.isdigit() or not (1 <= int(part) <= len(gateways))),
+            None,
+        )
+        if invalid is not None:
+            print(f"  Invalid selection: {invalid!r}")
+            continue
+        # dict.fromkeys dedupes while keeping the order the user typed.
+        return list(dict.fromkeys(gateways[int(part) - 1] for part in parts))
 
 
 def _ensure_gateway_resources(gateways: list[str]) -> list[GatewayResourceStatus]:
@@ -298,11 +302,12 @@ def run_wizard(
 
     resource_results = _ensure_gateway_resources(gateways)
     if resource_results:
-        print("\nGateway resource setup:")
+        report = ["\nGateway resource setup:"]
         for status in resource_results:
             result = status.result
             detail = f" ({result.detail})" if result.detail else ""
-            print(f"  - {status.label} '{status.name}': {result.status}{detail}")
+            report.append(f"  - {status.label} '{status.name}': {result.status}{detail}")
+        print("\n".join(report))
 
     env_content = generate_env(
         phone=phone,
@@ -324,7 +329,7 @@ def run_wizard(
             print("Keeping existing .env. Setup finished without changes.")
             return
 
-    env_path.write_text(env_content, encoding="utf-8")
+    atomic_write_text(env_path, env_content)
     print(f"\nWrote {env_path.resolve()}")
 
     can_read_messages_db, reason = check_messages_db_access()
@@ -336,6 +341,8 @@ def run_wizard(
 
     if start_daemon:
         print("\nStarting daemon...\n")
+        import asyncio
+
         from .daemon import run as run_daemon
 
         asyncio.run(run_daemon())
@@ -1,26 +1,263 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import queue
 import sqlite3
 import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from .models import ApprovalStatus, RunState
+from .utils import json_dumps, json_loads
 
 logger = logging.getLogger("apple_flow.store")
 
 
+_JOURNAL_MODES = frozenset({"wal", "delete", "truncate", "persist"})
+_CHECKPOINT_MODES = frozenset({"PASSIVE", "FULL", "RESTART", "TRUNCATE"})
+_BUSY_TIMEOUT_SECONDS = 5.0
+# sqlite3 keeps prepared statements per connection, keyed by SQL text. The
+# store plus the scheduler sharing its connection issue close to the default
+# 128 distinct statements before counting filter/IN-list variants; headroom
+# keeps the hot claim/event statements from being evicted and re-parsed.
+_STATEMENT_CACHE_SIZE = 256
+_RUN_ORIGIN_CACHE_SIZE = 512
+# Backslash-escapes LIKE wildcards for patterns matched with ESCAPE '\'.
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        sender TEXT PRIMARY KEY,
+        thread_id TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        last_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS messages (
+        message_id TEXT PRIMARY KEY,
+        sender TEXT NOT NULL,
+        text TEXT NOT NULL,
+        received_at TEXT NOT NULL,
+        dedupe_hash TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        sender TEXT NOT NULL,
+        intent TEXT NOT NULL,
+        state TEXT NOT NULL,
+        cwd TEXT NOT NULL,
+        risk_level TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS approvals (
+        request_id TEXT PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        sender TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        command_preview TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        expires_at TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (run_id) REFERENCES runs (run_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS events (
+        event_id TEXT PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        step TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        payload_json TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (run_id) REFERENCES runs (run_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS kv_state (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS reminders_processed (
+        occurrence_key TEXT PRIMARY KEY,
+        seen_at INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS run_jobs (
+        job_id TEXT PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        sender TEXT NOT NULL,
+        phase TEXT NOT NULL,
+        attempt INTEGER NOT NULL,
+        payload_json TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued',
+        lease_owner TEXT DEFAULT NULL,
+        lease_expires_at TEXT DEFAULT NULL,
+        error_text TEXT DEFAULT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (run_id) REFERENCES runs (run_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS healer_issues (
+        issue_id TEXT PRIMARY KEY,
+        repo TEXT NOT NULL,
+        title TEXT NOT NULL,
+        body TEXT NOT NULL DEFAULT '',
+        author TEXT NOT NULL DEFAULT '',
+        labels_json TEXT NOT NULL DEFAULT '[]',
+        priority INTEGER NOT NULL DEFAULT 100,
+        state TEXT NOT NULL DEFAULT 'queued',
+        attempt_count INTEGER NOT NULL DEFAULT 0,
+        backoff_until TEXT DEFAULT NULL,
+        lease_owner TEXT DEFAULT NULL,
+        lease_expires_at TEXT DEFAULT NULL,
+        workspace_path TEXT NOT NULL DEFAULT '',
+        branch_name TEXT NOT NULL DEFAULT '',
+        pr_number INTEGER DEFAULT NULL,
+        pr_state TEXT NOT NULL DEFAULT '',
+        last_failure_class TEXT NOT NULL DEFAULT '',
+        last_failure_reason TEXT NOT NULL DEFAULT '',
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS healer_attempts (
+        attempt_id TEXT PRIMARY KEY,
+        issue_id TEXT NOT NULL,
+        attempt_no INTEGER NOT NULL,
+        state TEXT NOT NULL,
+        prediction_source TEXT NOT NULL DEFAULT '',
+        predicted_lock_set_json TEXT NOT NULL DEFAULT '[]',
+        actual_diff_set_json TEXT NOT NULL DEFAULT '[]',
+        test_summary_json TEXT NOT NULL DEFAULT '{}',
+        verifier_summary_json TEXT NOT NULL DEFAULT '{}',
+        failure_class TEXT NOT NULL DEFAULT '',
+        failure_reason TEXT NOT NULL DEFAULT '',
+        started_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        finished_at TEXT DEFAULT NULL,
+        FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS healer_lessons (
+        lesson_id TEXT PRIMARY KEY,
+        issue_id TEXT NOT NULL,
+        attempt_id TEXT NOT NULL,
+        lesson_kind TEXT NOT NULL,
+        scope_key TEXT NOT NULL DEFAULT 'repo:*',
+        fingerprint TEXT NOT NULL DEFAULT '',
+        problem_summary TEXT NOT NULL DEFAULT '',
+        lesson_text TEXT NOT NULL,
+        test_hint TEXT NOT NULL DEFAULT '',
+        guardrail_json TEXT NOT NULL DEFAULT '{}',
+        confidence INTEGER NOT NULL DEFAULT 50,
+        outcome TEXT NOT NULL DEFAULT 'unknown',
+        use_count INTEGER NOT NULL DEFAULT 0,
+        last_used_at TEXT DEFAULT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id),
+        FOREIGN KEY (attempt_id) REFERENCES healer_attempts (attempt_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS healer_locks (
+        lock_key TEXT PRIMARY KEY,
+        granularity TEXT NOT NULL,
+        issue_id TEXT NOT NULL,
+        lease_owner TEXT NOT NULL,
+        lease_expires_at TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS scan_runs (
+        run_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        dry_run INTEGER NOT NULL DEFAULT 0,
+        summary_json TEXT NOT NULL DEFAULT '{}',
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS scan_findings (
+        fingerprint TEXT PRIMARY KEY,
+        scan_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        title TEXT NOT NULL,
+        issue_number INTEGER DEFAULT NULL,
+        status TEXT NOT NULL DEFAULT 'detected',
+        payload_json TEXT NOT NULL DEFAULT '{}',
+        first_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        last_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Performance indexes
+    CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals(status);
+    CREATE INDEX IF NOT EXISTS idx_runs_sender ON runs(sender);
+    -- Composite indexes serve the newest-first listings without a sort step;
+    -- they supersede the single-column sender/run_id indexes.
+    DROP INDEX IF EXISTS idx_messages_sender;
+    DROP INDEX IF EXISTS idx_events_run_id;
+    CREATE INDEX IF NOT EXISTS idx_messages_sender_received ON messages(sender, received_at);
+    CREATE INDEX IF NOT EXISTS idx_events_run_created ON events(run_id, created_at);
+    CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at);
+    -- Partial indexes cover only live jobs, so they stay small as history grows.
+    DROP INDEX IF EXISTS idx_run_jobs_status_created;
+    DROP INDEX IF EXISTS idx_run_jobs_lease;
+    CREATE INDEX IF NOT EXISTS idx_run_jobs_queued_created ON run_jobs(created_at) WHERE status = 'queued';
+    CREATE INDEX IF NOT EXISTS idx_run_jobs_run_status ON run_jobs(run_id, status);
+    CREATE INDEX IF NOT EXISTS idx_run_jobs_running_lease ON run_jobs(lease_expires_at) WHERE status = 'running';
+    CREATE INDEX IF NOT EXISTS idx_healer_issues_state_backoff ON healer_issues(state, backoff_until, priority, updated_at);
+    CREATE INDEX IF NOT EXISTS idx_healer_issues_lease ON healer_issues(state, lease_expires_at);
+    CREATE INDEX IF NOT EXISTS idx_healer_attempts_issue_started ON healer_attempts(issue_id, started_at);
+    CREATE INDEX IF NOT EXISTS idx_healer_lessons_scope_updated ON healer_lessons(scope_key, updated_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_healer_lessons_outcome_updated ON healer_lessons(outcome, updated_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_healer_locks_issue ON healer_locks(issue_id);
+    CREATE INDEX IF NOT EXISTS idx_healer_locks_lease ON healer_locks(lease_expires_at);
+    CREATE INDEX IF NOT EXISTS idx_scan_runs_created ON scan_runs(created_at);
+    CREATE INDEX IF NOT EXISTS idx_scan_findings_status ON scan_findings(status, last_seen_at);
+    CREATE INDEX IF NOT EXISTS idx_scan_findings_issue_number ON scan_findings(issue_number);
+"""
+
+# Columns added after their table first shipped: (table, column, type).
+_ADDED_COLUMNS = (
+    ("runs", "source_context", "TEXT DEFAULT NULL"),
+    ("healer_attempts", "failure_class", "TEXT NOT NULL DEFAULT ''"),
+    ("healer_attempts", "failure_reason", "TEXT NOT NULL DEFAULT ''"),
+)
+
+
 class SQLiteStore:
     """Thread-safe SQLite storage with connection caching."""
 
-    def __init__(self, db_path: Path, csv_audit_logger: Any | None = None):
+    def __init__(self, db_path: Path, csv_audit_logger: Any | None = None, journal_mode: str = "wal"):
         self.db_path = Path(db_path)
         self.csv_audit_logger = csv_audit_logger
+        self.journal_mode = (journal_mode or "wal").strip().lower()
+        if self.journal_mode not in _JOURNAL_MODES:
+            logger.warning("Unknown SQLite journal mode %r; using wal", journal_mode)
+            self.journal_mode = "wal"
         self._conn: sqlite3.Connection | None = None
-        self._lock = threading.Lock()
+        # Re-entrant so transaction() can hold it across nested write calls.
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._tx_owner: int | None = None
+        # Idle query_only connections for lock-free reads; only used under WAL.
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._wal_active = False
+        # Set by bootstrap() once messages_fts exists; otherwise search uses LIKE.
+        self._messages_fts = False
+        self._bootstrapped = False
+        # run_id -> (sender, cwd, source_context). These columns are written once
+        # by create_run and never updated, so entries need no invalidation.
+        self._run_origins: OrderedDict[str, tuple[str, str, dict[str, Any] | None]] = OrderedDict()
+        self._run_origins_lock = threading.Lock()
 
     def _connect(self) -> sqlite3.Connection:
         """Get or create a cached database connection (thread-safe)."""
@@ -28,13 +265,128 @@ class SQLiteStore:
             if self._conn is not None:
                 return self._conn
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
             self._conn = conn
             return conn
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply journal and sync pragmas.
+
+        WAL lets the admin API read while the daemon writes, and commits append
+        to the log instead of rewriting pages. With WAL, synchronous=NORMAL only
+        fsyncs at checkpoints; a power loss can drop the last commits but never
+        corrupts the database. Other journal modes keep the default FULL sync.
+        """
+        try:
+            active = conn.execute(f"PRAGMA journal_mode={self.journal_mode}").fetchone()[0]
+        except sqlite3.OperationalError as exc:
+            # e.g. a read-only database file; leave the existing mode alone.
+            logger.warning("Could not set SQLite journal_mode=%s for %s: %s", self.journal_mode, self.db_path, exc)
+            active = ""
+        self._wal_active = str(active).lower() == "wal"
+        if self._wal_active:
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    @contextlib.contextmanager
+    def _reader(self, *, snapshot: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for SELECT-only work.
+
+        Under WAL, readers see the last committed snapshot and never block the
+        writer, so reads use pooled ``query_only`` connections without taking
+        ``_lock``. Other journal modes read through the shared connection.
+        ``snapshot`` keeps several SELECTs in one read transaction.
+        """
+        # Skip _connect()'s lock once the writer exists; it is only replaced by close().
+        writer = self._conn or self._connect()
+        if not self._wal_active or self._tx_owner == threading.get_ident():
+            # Inside this thread's transaction(), read its uncommitted writes.
+            with self._lock:
+                yield writer
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only=ON")
+        try:
+            if snapshot:
+                conn.execute("BEGIN")
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless a transaction() block will commit for us (caller holds the lock)."""
+        if self._tx_depth == 0:
+            conn.commit()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group store writes into a single commit.
+
+        Write methods called inside the block skip their own commit; the block
+        commits once on success and rolls back on error. Other threads' writes
+        wait on the lock until the block ends. Nested blocks join the outer one.
+        """
+        conn = self._connect()
+        with self._lock:
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield
+                finally:
+                    self._tx_depth -= 1
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth = 1
+            self._tx_owner = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._tx_depth = 0
+                self._tx_owner = None
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int] | None:
+        """Copy WAL frames back into the database file.
+
+        SQLite's auto-checkpoint is PASSIVE and never shrinks the ``-wal``
+        file; TRUNCATE also resets it to zero bytes once every frame is
+        copied. Returns ``(busy, wal_frames, checkpointed_frames)``, or None
+        when the store is not in WAL mode.
+        """
+        mode = mode.upper()
+        if mode not in _CHECKPOINT_MODES:
+            raise ValueError(f"Unknown checkpoint mode: {mode}")
+        conn = self._connect()
+        with self._lock:
+            if not self._wal_active:
+                return None
+            row = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return int(row[0]), int(row[1]), int(row[2])
+
     def close(self) -> None:
-        """Close the cached database connection."""
+        """Close the cached database connection and any pooled readers."""
         with self._lock:
             if self._conn is not None:
                 try:
@@ -42,219 +394,93 @@ class SQLiteStore:
                 except Exception:
                     pass
                 self._conn = None
+            while True:
+                try:
+                    reader = self._readers.get_nowait()
+                except queue.Empty:
+                    break
+                with contextlib.suppress(Exception):
+                    reader.close()
 
     def bootstrap(self) -> None:
+        """Create tables and indexes and apply column migrations; later calls are no-ops."""
+        if self._bootstrapped:
+            return
         conn = self._connect()
         with self._lock:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS sessions (
-                    sender TEXT PRIMARY KEY,
-                    thread_id TEXT NOT NULL,
-                    mode TEXT NOT NULL,
-                    last_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS messages (
-                    message_id TEXT PRIMARY KEY,
-                    sender TEXT NOT NULL,
-                    text TEXT NOT NULL,
-                    received_at TEXT NOT NULL,
-                    dedupe_hash TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS runs (
-                    run_id TEXT PRIMARY KEY,
-                    sender TEXT NOT NULL,
-                    intent TEXT NOT NULL,
-                    state TEXT NOT NULL,
-                    cwd TEXT NOT NULL,
-                    risk_level TEXT NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS approvals (
-                    request_id TEXT PRIMARY KEY,
-                    run_id TEXT NOT NULL,
-                    sender TEXT NOT NULL,
-                    summary TEXT NOT NULL,
-                    command_preview TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending',
-                    expires_at TEXT NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (run_id) REFERENCES runs (run_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS events (
-                    event_id TEXT PRIMARY KEY,
-                    run_id TEXT NOT NULL,
-                    step TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    payload_json TEXT NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (run_id) REFERENCES runs (run_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS kv_state (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS run_jobs (
-                    job_id TEXT PRIMARY KEY,
-                    run_id TEXT NOT NULL,
-                    sender TEXT NOT NULL,
-                    phase TEXT NOT NULL,
-                    attempt INTEGER NOT NULL,
-                    payload_json TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'queued',
-                    lease_owner TEXT DEFAULT NULL,
-                    lease_expires_at TEXT DEFAULT NULL,
-                    error_text TEXT DEFAULT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (run_id) REFERENCES runs (run_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS healer_issues (
-                    issue_id TEXT PRIMARY KEY,
-                    repo TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    body TEXT NOT NULL DEFAULT '',
-                    author TEXT NOT NULL DEFAULT '',
-                    labels_json TEXT NOT NULL DEFAULT '[]',
-                    priority INTEGER NOT NULL DEFAULT 100,
-                    state TEXT NOT NULL DEFAULT 'queued',
-                    attempt_count INTEGER NOT NULL DEFAULT 0,
-                    backoff_until TEXT DEFAULT NULL,
-                    lease_owner TEXT DEFAULT NULL,
-                    lease_expires_at TEXT DEFAULT NULL,
-                    workspace_path TEXT NOT NULL DEFAULT '',
-                    branch_name TEXT NOT NULL DEFAULT '',
-                    pr_number INTEGER DEFAULT NULL,
-                    pr_state TEXT NOT NULL DEFAULT '',
-                    last_failure_class TEXT NOT NULL DEFAULT '',
-                    last_failure_reason TEXT NOT NULL DEFAULT '',
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS healer_attempts (
-                    attempt_id TEXT PRIMARY KEY,
-                    issue_id TEXT NOT NULL,
-                    attempt_no INTEGER NOT NULL,
-                    state TEXT NOT NULL,
-                    prediction_source TEXT NOT NULL DEFAULT '',
-                    predicted_lock_set_json TEXT NOT NULL DEFAULT '[]',
-                    actual_diff_set_json TEXT NOT NULL DEFAULT '[]',
-                    test_summary_json TEXT NOT NULL DEFAULT '{}',
-                    verifier_summary_json TEXT NOT NULL DEFAULT '{}',
-                    failure_class TEXT NOT NULL DEFAULT '',
-                    failure_reason TEXT NOT NULL DEFAULT '',
-                    started_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    finished_at TEXT DEFAULT NULL,
-                    FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id)
-                );
+            conn.executescript(_SCHEMA_SQL)
+            conn.commit()
 
-                CREATE TABLE IF NOT EXISTS healer_lessons (
-                    lesson_id TEXT PRIMARY KEY,
-                    issue_id TEXT NOT NULL,
-                    attempt_id TEXT NOT NULL,
-                    lesson_kind TEXT NOT NULL,
-                    scope_key TEXT NOT NULL DEFAULT 'repo:*',
-                    fingerprint TEXT NOT NULL DEFAULT '',
-                    problem_summary TEXT NOT NULL DEFAULT '',
-                    lesson_text TEXT NOT NULL,
-                    test_hint TEXT NOT NULL DEFAULT '',
-                    guardrail_json TEXT NOT NULL DEFAULT '{}',
-                    confidence INTEGER NOT NULL DEFAULT 50,
-                    outcome TEXT NOT NULL DEFAULT 'unknown',
-                    use_count INTEGER NOT NULL DEFAULT 0,
-                    last_used_at TEXT DEFAULT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id),
-                    FOREIGN KEY (attempt_id) REFERENCES healer_attempts (attempt_id)
-                );
+            for table, column_name, column_type in _ADDED_COLUMNS:
+                columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column_name not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+                    conn.commit()
 
-                CREATE TABLE IF NOT EXISTS healer_locks (
-                    lock_key TEXT PRIMARY KEY,
-                    granularity TEXT NOT NULL,
-                    issue_id TEXT NOT NULL,
-                    lease_owner TEXT NOT NULL,
-                    lease_expires_at TEXT NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (issue_id) REFERENCES healer_issues (issue_id)
-                );
+            self._messages_fts = self._ensure_messages_fts(conn)
+            self._bootstrapped = True
 
-                CREATE TABLE IF NOT EXISTS scan_runs (
-                    run_id TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,
-                    dry_run INTEGER NOT NULL DEFAULT 0,
-                    summary_json TEXT NOT NULL DEFAULT '{}',
-                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-                );
+    @staticmethod
+    def _ensure_messages_fts(conn: sqlite3.Connection) -> bool:
+        """Create the trigram full-text index over messages.text.
 
-                CREATE TABLE IF NOT EXISTS scan_findings (
-                    fingerprint TEXT PRIMARY KEY,
-                    scan_type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    issue_number INTEGER DEFAULT NULL,
-                    status TEXT NOT NULL DEFAULT 'detected',
-                    payload_json TEXT NOT NULL DEFAULT '{}',
-                    first_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    last_seen_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        The trigram tokenizer matches arbitrary case-insensitive substrings,
+        so search keeps its ``LIKE '%q%'`` semantics without scanning every
+        message. Returns False when this SQLite lacks FTS5 or trigram
+        (added in 3.34); search then stays on LIKE.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            conn.executescript(
+                """
+                BEGIN;
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    text, content='messages', content_rowid='rowid', tokenize='trigram'
                 );
-
-                -- Performance indexes
-                CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender);
-                CREATE INDEX IF NOT EXISTS idx_approvals_status ON approvals(status);
-                CREATE INDEX IF NOT EXISTS idx_runs_sender ON runs(sender);
-                CREATE INDEX IF NOT EXISTS idx_events_run_id ON events(run_id);
-                CREATE INDEX IF NOT EXISTS idx_run_jobs_status_created ON run_jobs(status, created_at);
-                CREATE INDEX IF NOT EXISTS idx_run_jobs_run_status ON run_jobs(run_id, status);
-                CREATE INDEX IF NOT EXISTS idx_run_jobs_lease ON run_jobs(status, lease_expires_at);
-                CREATE INDEX IF NOT EXISTS idx_healer_issues_state_backoff ON healer_issues(state, backoff_until, priority, updated_at);
-                CREATE INDEX IF NOT EXISTS idx_healer_issues_lease ON healer_issues(state, lease_expires_at);
-                CREATE INDEX IF NOT EXISTS idx_healer_attempts_issue_started ON healer_attempts(issue_id, started_at);
-                CREATE INDEX IF NOT EXISTS idx_healer_lessons_scope_updated ON healer_lessons(scope_key, updated_at DESC);
-                CREATE INDEX IF NOT EXISTS idx_healer_lessons_outcome_updated ON healer_lessons(outcome, updated_at DESC);
-                CREATE INDEX IF NOT EXISTS idx_healer_locks_issue ON healer_locks(issue_id);
-                CREATE INDEX IF NOT EXISTS idx_healer_locks_lease ON healer_locks(lease_expires_at);
-                CREATE INDEX IF NOT EXISTS idx_scan_runs_created ON scan_runs(created_at);
-                CREATE INDEX IF NOT EXISTS idx_scan_findings_status ON scan_findings(status, last_seen_at);
-                CREATE INDEX IF NOT EXISTS idx_scan_findings_issue_number ON scan_findings(issue_number);
+                CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+                    INSERT INTO messages_fts(rowid, text) VALUES (new.rowid, new.text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF text ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+                    INSERT INTO messages_fts(rowid, text) VALUES (new.rowid, new.text);
+                END;
+                INSERT INTO messages_fts(messages_fts) VALUES ('rebuild');
+                COMMIT;
                 """
             )
-            conn.commit()
-
-            # Migration: Add source_context column if it doesn't exist
-            try:
-                cursor = conn.execute("SELECT source_context FROM runs LIMIT 1")
-                cursor.fetchone()
-            except sqlite3.OperationalError:
-                conn.execute("ALTER TABLE runs ADD COLUMN source_context TEXT DEFAULT NULL")
-                conn.commit()
-
-            for column_name, column_type in (
-                ("failure_class", "TEXT NOT NULL DEFAULT ''"),
-                ("failure_reason", "TEXT NOT NULL DEFAULT ''"),
-            ):
-                try:
-                    cursor = conn.execute(f"SELECT {column_name} FROM healer_attempts LIMIT 1")
-                    cursor.fetchone()
-                except sqlite3.OperationalError:
-                    conn.execute(f"ALTER TABLE healer_attempts ADD COLUMN {column_name} {column_type}")
-                    conn.commit()
+        except sqlite3.OperationalError as exc:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.info("SQLite FTS5 trigram unavailable; message search will scan with LIKE: %s", exc)
+            return False
+        return True
 
     @staticmethod
     def _row_to_dict(row: sqlite3.Row | None) -> dict[str, Any] | None:
         if row is None:
             return None
-        return {k: row[k] for k in row.keys()}
+        return dict(row)
+
+    @staticmethod
+    def _payload_rows(rows: list[sqlite3.Row], *, include_payload: bool = True) -> list[dict[str, Any]]:
+        """Convert event/job rows to dicts, decoding ``payload_json`` into ``payload``."""
+        out: list[dict[str, Any]] = []
+        for row in rows:
+            data = dict(row)
+            if include_payload:
+                try:
+                    data["payload"] = json_loads(data.pop("payload_json", "{}"))
+                except json.JSONDecodeError:
+                    data["payload"] = {}
+            out.append(data)
+        return out
 
     def upsert_session(self, sender: str, thread_id: str, mode: str) -> None:
         conn = self._connect()
@@ -270,19 +496,17 @@ class SQLiteStore:
                 """,
                 (sender, thread_id, mode),
             )
-            conn.commit()
+            self._commit(conn)
 
     def get_session(self, sender: str) -> dict[str, Any] | None:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             row = conn.execute("SELECT * FROM sessions WHERE sender = ?", (sender,)).fetchone()
-            return self._row_to_dict(row)
+        return self._row_to_dict(row)
 
     def list_sessions(self) -> list[dict[str, Any]]:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             rows = conn.execute("SELECT * FROM sessions ORDER BY last_seen_at DESC").fetchall()
-            return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
 
     def record_message(self, message_id: str, sender: str, text: str, received_at: str, dedupe_hash: str) -> bool:
         conn = self._connect()
@@ -294,7 +518,7 @@ class SQLiteStore:
                 """,
                 (message_id, sender, text, received_at, dedupe_hash),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount == 1
 
     def create_run(
@@ -309,7 +533,7 @@ class SQLiteStore:
     ) -> None:
         conn = self._connect()
         with self._lock:
-            source_context_json = json.dumps(source_context) if source_context else None
+            source_context_json = json_dumps(source_context) if source_context else None
             conn.execute(
                 """
                 INSERT INTO runs(run_id, sender, intent, state, cwd, risk_level, source_context)
@@ -317,7 +541,7 @@ class SQLiteStore:
                 """,
                 (run_id, sender, intent, state, cwd, risk_level, source_context_json),
             )
-            conn.commit()
+            self._commit(conn)
 
     def update_run_state(self, run_id: str, state: str) -> None:
         conn = self._connect()
@@ -326,17 +550,15 @@ class SQLiteStore:
                 "UPDATE runs SET state = ?, updated_at = CURRENT_TIMESTAMP WHERE run_id = ?",
                 (state, run_id),
             )
-            conn.commit()
+            self._commit(conn)
 
     def get_run(self, run_id: str) -> dict[str, Any] | None:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
-            return self._row_to_dict(row)
+        return self._row_to_dict(row)
 
     def list_active_runs(self, limit: int = 20) -> list[dict[str, Any]]:
         """List active (non-terminal) runs sorted by most recently updated."""
-        conn = self._connect()
         active_states = (
             RunState.PLANNING.value,
             RunState.AWAITING_APPROVAL.value,
@@ -345,7 +567,7 @@ class SQLiteStore:
             RunState.EXECUTING.value,
             RunState.VERIFYING.value,
         )
-        with self._lock:
+        with self._reader() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM runs
@@ -355,20 +577,42 @@ class SQLiteStore:
                 """,
                 (*active_states, limit),
             ).fetchall()
-            return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
 
     def get_run_source_context(self, run_id: str) -> dict[str, Any] | None:
         """Get the source context for a run (reminder_id, note_id, etc.)"""
-        run = self.get_run(run_id)
-        if not run:
-            return None
-        source_context_json = run.get("source_context")
-        if not source_context_json:
+        origin = self._run_origin(run_id)
+        if origin is None or origin[2] is None:
             return None
-        try:
-            return json.loads(source_context_json)
-        except (json.JSONDecodeError, TypeError):
+        return dict(origin[2])
+
+    def _run_origin(self, run_id: str) -> tuple[str, str, dict[str, Any] | None] | None:
+        """Return a run's immutable (sender, cwd, source_context), cached per run_id."""
+        with self._run_origins_lock:
+            origin = self._run_origins.get(run_id)
+            if origin is not None:
+                self._run_origins.move_to_end(run_id)
+                return origin
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT sender, cwd, source_context FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            # Not cached: the run may still be created, possibly by another process.
             return None
+        source_context: dict[str, Any] | None = None
+        if row["source_context"]:
+            try:
+                decoded = json_loads(row["source_context"])
+            except (json.JSONDecodeError, TypeError):
+                decoded = None
+            source_context = decoded if isinstance(decoded, dict) else None
+        origin = (row["sender"], row["cwd"], source_context)
+        with self._run_origins_lock:
+            self._run_origins[run_id] = origin
+            if len(self._run_origins) > _RUN_ORIGIN_CACHE_SIZE:
+                self._run_origins.popitem(last=False)
+        return origin
 
     def create_approval(
         self, request_id: str, run_id: str, summary: str, command_preview: str, expires_at: str, sender: str
@@ -382,22 +626,20 @@ class SQLiteStore:
                 """,
                 (request_id, run_id, sender, summary, command_preview, expires_at),
             )
-            conn.commit()
+            self._commit(conn)
 
     def get_approval(self, request_id: str) -> dict[str, Any] | None:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             row = conn.execute("SELECT * FROM approvals WHERE request_id = ?", (request_id,)).fetchone()
-            return self._row_to_dict(row)
+        return self._row_to_dict(row)
 
     def list_pending_approvals(self) -> list[dict[str, Any]]:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM approvals WHERE status = ? ORDER BY created_at ASC",
                 (ApprovalStatus.PENDING.value,),
             ).fetchall()
-            return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
 
     def deny_all_approvals(self) -> int:
         """Mark all pending approvals as denied and their runs as denied.
@@ -406,27 +648,21 @@ class SQLiteStore:
         """
         conn = self._connect()
         with self._lock:
-            rows = conn.execute(
-                "SELECT request_id, run_id FROM approvals WHERE status = ?",
-                (ApprovalStatus.PENDING.value,),
-            ).fetchall()
-            if not rows:
-                return 0
-            ids = [row["request_id"] for row in rows]
-            run_ids = [row["run_id"] for row in rows]
-            placeholders = ",".join("?" * len(ids))
+            # Runs first: once the approvals flip, "pending" no longer identifies them.
+            # Both statements share one write transaction, so no approval can slip in between.
             conn.execute(
-                f"UPDATE approvals SET status = 'denied' WHERE request_id IN ({placeholders})",
-                ids,
+                """
+                UPDATE runs SET state = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE run_id IN (SELECT run_id FROM approvals WHERE status = ?)
+                """,
+                (RunState.DENIED.value, ApprovalStatus.PENDING.value),
             )
-            run_placeholders = ",".join("?" * len(run_ids))
-            conn.execute(
-                f"UPDATE runs SET state = '{RunState.DENIED.value}', updated_at = CURRENT_TIMESTAMP "
-                f"WHERE run_id IN ({run_placeholders})",
-                run_ids,
+            cursor = conn.execute(
+                "UPDATE approvals SET status = ? WHERE status = ?",
+                (ApprovalStatus.DENIED.value, ApprovalStatus.PENDING.value),
             )
-            conn.commit()
-            return len(ids)
+            self._commit(conn)
+            return int(cursor.rowcount)
 
     def resolve_approval(self, request_id: str, status: str) -> bool:
         conn = self._connect()
@@ -435,75 +671,89 @@ class SQLiteStore:
                 "UPDATE approvals SET status = ? WHERE request_id = ?",
                 (status, request_id),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def create_event(self, event_id: str, run_id: str, step: str, event_type: str, payload: dict[str, Any]) -> None:
         created_at = datetime.now(UTC).isoformat()
+        payload_json = json_dumps(payload)
         conn = self._connect()
         with self._lock:
-            conn.execute(
-                """
-                INSERT INTO events(event_id, run_id, step, event_type, payload_json)
-                VALUES(?, ?, ?, ?, ?)
-                """,
-                (event_id, run_id, step, event_type, json.dumps(payload)),
-            )
-            conn.execute(
-                "UPDATE runs SET updated_at = CURRENT_TIMESTAMP WHERE run_id = ?",
-                (run_id,),
+            self._insert_event(conn, event_id, run_id, step, event_type, payload_json)
+            self._commit(conn)
+        self._mirror_event(created_at, event_id, run_id, step, event_type, payload, payload_json)
+
+    @staticmethod
+    def _insert_event(
+        conn: sqlite3.Connection, event_id: str, run_id: str, step: str, event_type: str, payload_json: str
+    ) -> None:
+        """Insert an event row and touch its run; the caller holds the lock and commits."""
+        conn.execute(
+            """
+            INSERT INTO events(event_id, run_id, step, event_type, payload_json)
+            VALUES(?, ?, ?, ?, ?)
+            """,
+            (event_id, run_id, step, event_type, payload_json),
+        )
+        conn.execute(
+            "UPDATE runs SET updated_at = CURRENT_TIMESTAMP WHERE run_id = ?",
+            (run_id,),
+        )
+
+    def _mirror_event(
+        self,
+        created_at: str,
+        event_id: str,
+        run_id: str,
+        step: str,
+        event_type: str,
+        payload: dict[str, Any],
+        payload_json: str,
+    ) -> None:
+        if self.csv_audit_logger is None:
+            return
+        try:
+            sender, cwd, source_context = self._run_origin(run_id) or ("", "", None)
+            source_context = source_context or {}
+            self.csv_audit_logger.append_event(
+                {
+                    "created_at": created_at,
+                    "event_id": event_id,
+                    "run_id": run_id,
+                    "step": step,
+                    "event_type": event_type,
+                    "channel": payload.get("channel", source_context.get("channel", "")),
+                    "sender": payload.get("sender", sender),
+                    "workspace": payload.get("workspace", cwd),
+                    "connector": payload.get("connector", ""),
+                    "attempt": payload.get("attempt", ""),
+                    "status": payload.get("status", ""),
+                    "duration_ms": payload.get("duration_ms", ""),
+                    "snippet": payload.get("snippet", ""),
+                    "payload_json": payload_json,
+                }
             )
-            conn.commit()
+        except Exception as exc:
+            # CSV analytics mirror is best-effort; SQLite event insert remains canonical.
+            logger.warning("Failed to mirror event %s to CSV audit log: %s", event_id, exc)
 
-        if self.csv_audit_logger is not None:
-            try:
-                run = self.get_run(run_id) or {}
-                payload_json = json.dumps(payload)
-                source_context = self.get_run_source_context(run_id) or {}
-                self.csv_audit_logger.append_event(
-                    {
-                        "created_at": created_at,
-                        "event_id": event_id,
-                        "run_id": run_id,
-                        "step": step,
-                        "event_type": event_type,
-                        "channel": payload.get("channel", source_context.get("channel", "")),
-                        "sender": payload.get("sender", run.get("sender", "")),
-                        "workspace": payload.get("workspace", run.get("cwd", "")),
-                        "connector": payload.get("connector", ""),
-                        "attempt": payload.get("attempt", ""),
-                        "status": payload.get("status", ""),
-                        "duration_ms": payload.get("duration_ms", ""),
-                        "snippet": payload.get("snippet", ""),
-                        "payload_json": payload_json,
-                    }
-                )
-            except Exception as exc:
-                # CSV analytics mirror is best-effort; SQLite event insert remains canonical.
-                logger.warning("Failed to mirror event %s to CSV audit log: %s", event_id, exc)
+    def list_events(self, limit: int = 200, *, include_payload: bool = True) -> list[dict[str, Any]]:
+        """Return the newest events.
 
-    def list_events(self, limit: int = 200) -> list[dict[str, Any]]:
-        conn = self._connect()
-        with self._lock:
+        With ``include_payload=False`` the raw ``payload_json`` text is kept
+        and not decoded, for callers that only read the scalar columns.
+        """
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM events ORDER BY created_at DESC LIMIT ?",
                 (limit,),
             ).fetchall()
-            events = []
-            for row in rows:
-                data = self._row_to_dict(row)
-                if data is None:
-                    continue
-                try:
-                    data["payload"] = json.loads(data.pop("payload_json", "{}"))
-                except json.JSONDecodeError:
-                    data["payload"] = {}
-                events.append(data)
-            return events
+        return self._payload_rows(rows, include_payload=include_payload)
 
-    def list_events_for_run(self, run_id: str, limit: int = 50) -> list[dict[str, Any]]:
-        conn = self._connect()
-        with self._lock:
+    def list_events_for_run(
+        self, run_id: str, limit: int = 50, *, include_payload: bool = True
+    ) -> list[dict[str, Any]]:
+        with self._reader() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM events
@@ -513,27 +763,20 @@ class SQLiteStore:
                 """,
                 (run_id, limit),
             ).fetchall()
-            events = []
-            for row in rows:
-                data = self._row_to_dict(row)
-                if data is None:
-                    continue
-                try:
-                    data["payload"] = json.loads(data.pop("payload_json", "{}"))
-                except json.JSONDecodeError:
-                    data["payload"] = {}
-                events.append(data)
-            return events
+        return self._payload_rows(rows, include_payload=include_payload)
 
     def get_latest_event_for_run(self, run_id: str) -> dict[str, Any] | None:
-        events = self.list_events_for_run(run_id, limit=1)
-        if not events:
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM events WHERE run_id = ? ORDER BY created_at DESC LIMIT 1",
+                (run_id,),
+            ).fetchone()
+        if row is None:
             return None
-        return events[0]
+        return self._payload_rows([row])[0]
 
     def count_run_events(self, run_id: str, event_type: str | None = None) -> int:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             if event_type:
                 row = conn.execute(
                     "SELECT COUNT(*) FROM events WHERE run_id = ? AND event_type = ?",
@@ -572,54 +815,118 @@ class SQLiteStore:
                     sender,
                     phase,
                     int(attempt),
-                    json.dumps(payload or {}),
+                    json_dumps(payload or {}),
                     status,
                 ),
             )
-            conn.commit()
+            self._commit(conn)
 
-    def claim_next_run_job(self, *, worker_id: str, lease_seconds: int) -> dict[str, Any] | None:
-        """Atomically claim the oldest queued job for a worker lease window."""
+    def queue_run_job(
+        self,
+        *,
+        job_id: str,
+        run_id: str,
+        sender: str,
+        phase: str,
+        attempt: int,
+        payload: dict[str, Any],
+        run_state: str,
+        event_id: str,
+        step: str,
+        event_type: str,
+        event_payload: dict[str, Any],
+    ) -> None:
+        """Insert a job, set its run state and log the event in one commit."""
+        created_at = datetime.now(UTC).isoformat()
+        event_json = json_dumps(event_payload)
         conn = self._connect()
         with self._lock:
-            row = conn.execute(
+            conn.execute(
                 """
-                SELECT job_id
-                FROM run_jobs
-                WHERE status = 'queued'
-                ORDER BY created_at ASC
-                LIMIT 1
+                INSERT INTO run_jobs(job_id, run_id, sender, phase, attempt, payload_json, status)
+                VALUES(?, ?, ?, ?, ?, ?, 'queued')
+                """,
+                (job_id, run_id, sender, phase, int(attempt), json_dumps(payload)),
+            )
+            conn.execute(
+                "UPDATE runs SET state = ?, updated_at = CURRENT_TIMESTAMP WHERE run_id = ?",
+                (run_state, run_id),
+            )
+            self._insert_event(conn, event_id, run_id, step, event_type, event_json)
+            self._commit(conn)
+        self._mirror_event(created_at, event_id, run_id, step, event_type, event_payload, event_json)
+
+    def fail_run_job(
+        self,
+        *,
+        job_id: str,
+        run_id: str,
+        error_text: str,
+        run_state: str,
+        event_id: str,
+        step: str,
+        event_type: str,
+        event_payload: dict[str, Any],
+    ) -> None:
+        """Mark a job failed, set its run state and log the event in one commit."""
+        created_at = datetime.now(UTC).isoformat()
+        event_json = json_dumps(event_payload)
+        conn = self._connect()
+        with self._lock:
+            conn.execute(
                 """
-            ).fetchone()
-            if row is None:
-                return None
+                UPDATE run_jobs
+                SET status = 'failed',
+                    error_text = ?,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = ?
+                """,
+                (error_text, job_id),
+            )
+            conn.execute(
+                "UPDATE runs SET state = ?, updated_at = CURRENT_TIMESTAMP WHERE run_id = ?",
+                (run_state, run_id),
+            )
+            self._insert_event(conn, event_id, run_id, step, event_type, event_json)
+            self._commit(conn)
+        self._mirror_event(created_at, event_id, run_id, step, event_type, event_payload, event_json)
 
-            job_id = str(row["job_id"])
-            cursor = conn.execute(
+    def claim_next_run_job(self, *, worker_id: str, lease_seconds: int) -> dict[str, Any] | None:
+        """Atomically claim the oldest queued job for a worker lease window."""
+        jobs = self.claim_next_run_jobs(worker_id=worker_id, lease_seconds=lease_seconds, limit=1)
+        return jobs[0] if jobs else None
+
+    def claim_next_run_jobs(self, *, worker_id: str, lease_seconds: int, limit: int) -> list[dict[str, Any]]:
+        """Atomically claim up to ``limit`` of the oldest queued jobs in one statement."""
+        conn = self._connect()
+        with self._lock:
+            rows = conn.execute(
                 """
                 UPDATE run_jobs
                 SET status = 'running',
                     lease_owner = ?,
                     lease_expires_at = datetime('now', ?),
                     updated_at = CURRENT_TIMESTAMP
-                WHERE job_id = ? AND status = 'queued'
+                WHERE job_id IN (
+                    SELECT job_id
+                    FROM run_jobs
+                    WHERE status = 'queued'
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                )
+                AND status = 'queued'
+                RETURNING *
                 """,
-                (worker_id, f"+{int(max(1, lease_seconds))} seconds", job_id),
-            )
-            if cursor.rowcount == 0:
-                conn.commit()
-                return None
+                (worker_id, f"+{int(max(1, lease_seconds))} seconds", int(max(1, limit))),
+            ).fetchall()
+            self._commit(conn)
 
-            claimed = conn.execute("SELECT * FROM run_jobs WHERE job_id = ?", (job_id,)).fetchone()
-            conn.commit()
-            data = self._row_to_dict(claimed)
-            if data is None:
-                return None
-            try:
-                data["payload"] = json.loads(data.pop("payload_json", "{}"))
-            except json.JSONDecodeError:
-                data["payload"] = {}
-            return data
+        jobs = self._payload_rows(rows)
+        # RETURNING order is unspecified; keep oldest-first.
+        jobs.sort(key=lambda job: str(job.get("created_at", "")))
+        return jobs
 
     def renew_run_job_lease(self, *, job_id: str, worker_id: str, lease_seconds: int) -> bool:
         conn = self._connect()
@@ -632,9 +939,32 @@ class SQLiteStore:
                 """,
                 (f"+{int(max(1, lease_seconds))} seconds", job_id, worker_id),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
+    def release_run_jobs(self, *, job_ids: list[str], worker_id: str) -> int:
+        """Return claimed jobs that never started to the queue, if ``worker_id`` still holds them."""
+        if not job_ids:
+            return 0
+        placeholders = ",".join("?" for _ in job_ids)
+        conn = self._connect()
+        with self._lock:
+            cursor = conn.execute(
+                f"""
+                UPDATE run_jobs
+                SET status = 'queued',
+                    lease_owner = NULL,
+                    lease_expires_at = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE job_id IN ({placeholders})
+                  AND status = 'running'
+                  AND lease_owner = ?
+                """,
+                (*job_ids, worker_id),
+            )
+            self._commit(conn)
+            return int(cursor.rowcount)
+
     def complete_run_job(self, *, job_id: str, status: str, error_text: str | None = None) -> bool:
         conn = self._connect()
         with self._lock:
@@ -650,12 +980,11 @@ class SQLiteStore:
                 """,
                 (status, error_text, job_id),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def list_run_jobs(self, *, run_id: str | None = None, status: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             query = "SELECT * FROM run_jobs WHERE 1=1"
             params: list[Any] = []
             if run_id is not None:
@@ -668,17 +997,7 @@ class SQLiteStore:
             params.append(limit)
             rows = conn.execute(query, params).fetchall()
 
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            data = self._row_to_dict(row)
-            if data is None:
-                continue
-            try:
-                data["payload"] = json.loads(data.pop("payload_json", "{}"))
-            except json.JSONDecodeError:
-                data["payload"] = {}
-            out.append(data)
-        return out
+        return self._payload_rows(rows)
 
     def cancel_run_jobs(self, run_id: str) -> int:
         conn = self._connect()
@@ -694,7 +1013,7 @@ class SQLiteStore:
                 """,
                 (run_id,),
             )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount)
 
     def requeue_expired_run_jobs(self) -> int:
@@ -713,7 +1032,7 @@ class SQLiteStore:
                   AND lease_expires_at <= CURRENT_TIMESTAMP
                 """
             )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount)
 
     # --- Autonomous healer queue/state ---
@@ -792,7 +1111,7 @@ class SQLiteStore:
                     int(priority),
                 ),
             )
-            conn.commit()
+            self._commit(conn)
 
     def get_healer_issue(self, issue_id: str) -> dict[str, Any] | None:
         conn = self._connect()
@@ -854,14 +1173,14 @@ class SQLiteStore:
                 (worker_id, f"+{int(max(1, lease_seconds))} seconds", issue_id),
             )
             if cursor.rowcount == 0:
-                conn.commit()
+                self._commit(conn)
                 return None
 
             claimed = conn.execute(
                 "SELECT * FROM healer_issues WHERE issue_id = ?",
                 (issue_id,),
             ).fetchone()
-            conn.commit()
+            self._commit(conn)
         return self._decode_healer_issue_row(self._row_to_dict(claimed))
 
     def renew_healer_issue_lease(self, *, issue_id: str, worker_id: str, lease_seconds: int) -> bool:
@@ -875,7 +1194,7 @@ class SQLiteStore:
                 """,
                 (f"+{int(max(1, lease_seconds))} seconds", issue_id, worker_id),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def increment_healer_attempt(self, issue_id: str) -> int:
@@ -893,7 +1212,7 @@ class SQLiteStore:
                 "SELECT attempt_count FROM healer_issues WHERE issue_id = ?",
                 (issue_id,),
             ).fetchone()
-            conn.commit()
+            self._commit(conn)
             if row is None:
                 return 0
             return int(row["attempt_count"])
@@ -947,7 +1266,7 @@ class SQLiteStore:
                 f"UPDATE healer_issues SET {', '.join(updates)} WHERE issue_id = ?",
                 params,
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def requeue_expired_healer_issue_leases(self) -> int:
@@ -965,7 +1284,7 @@ class SQLiteStore:
                   AND lease_expires_at <= CURRENT_TIMESTAMP
                 """
             )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount)
 
     def create_healer_attempt(
@@ -996,7 +1315,7 @@ class SQLiteStore:
                     json.dumps(predicted_lock_set or []),
                 ),
             )
-            conn.commit()
+            self._commit(conn)
 
     def finish_healer_attempt(
         self,
@@ -1033,7 +1352,7 @@ class SQLiteStore:
                     attempt_id,
                 ),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def list_healer_attempts(self, *, issue_id: str, limit: int = 20) -> list[dict[str, Any]]:
@@ -1114,7 +1433,7 @@ class SQLiteStore:
                     outcome,
                 ),
             )
-            conn.commit()
+            self._commit(conn)
 
     def list_healer_lessons(self, *, limit: int = 200) -> list[dict[str, Any]]:
         conn = self._connect()
@@ -1151,7 +1470,7 @@ class SQLiteStore:
                 """,
                 unique_ids,
             )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount or 0)
 
     def get_healer_lesson_stats(self) -> dict[str, Any]:
@@ -1183,7 +1502,7 @@ class SQLiteStore:
             cursor = conn.execute(
                 "DELETE FROM healer_locks WHERE lease_expires_at <= CURRENT_TIMESTAMP"
             )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount)
 
     def acquire_healer_lock(
@@ -1212,12 +1531,12 @@ class SQLiteStore:
                     """,
                     (lock_key, granularity, issue_id, lease_owner, f"+{int(max(1, lease_seconds))} seconds"),
                 )
-                conn.commit()
+                self._commit(conn)
                 return True
 
             existing_issue = str(row["issue_id"])
             if existing_issue != issue_id:
-                conn.commit()
+                self._commit(conn)
                 return False
 
             conn.execute(
@@ -1236,7 +1555,7 @@ class SQLiteStore:
                     issue_id,
                 ),
             )
-            conn.commit()
+            self._commit(conn)
             return True
 
     def release_healer_locks(self, *, issue_id: str, lock_keys: list[str] | None = None) -> int:
@@ -1253,7 +1572,7 @@ class SQLiteStore:
                     "DELETE FROM healer_locks WHERE issue_id = ?",
                     (issue_id,),
                 )
-            conn.commit()
+            self._commit(conn)
             return int(cursor.rowcount)
 
     def list_healer_locks(self, *, issue_id: str | None = None) -> list[dict[str, Any]]:
@@ -1268,7 +1587,7 @@ class SQLiteStore:
                 rows = conn.execute(
                     "SELECT * FROM healer_locks ORDER BY lock_key ASC",
                 ).fetchall()
-        return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
 
     # --- Scan pipeline state ---
 
@@ -1282,7 +1601,7 @@ class SQLiteStore:
                 """,
                 (run_id, 1 if dry_run else 0),
             )
-            conn.commit()
+            self._commit(conn)
 
     def finish_scan_run(self, *, run_id: str, status: str, summary: dict[str, Any]) -> bool:
         conn = self._connect()
@@ -1295,7 +1614,7 @@ class SQLiteStore:
                 """,
                 (status, json.dumps(summary or {}), run_id),
             )
-            conn.commit()
+            self._commit(conn)
             return cursor.rowcount > 0
 
     def get_scan_finding(self, fingerprint: str) -> dict[str, Any] | None:
@@ -1352,7 +1671,7 @@ class SQLiteStore:
                     json.dumps(payload or {}),
                 ),
             )
-            conn.commit()
+            self._commit(conn)
 
     def list_scan_runs(self, *, limit: int = 50) -> list[dict[str, Any]]:
         conn = self._connect()
@@ -1367,9 +1686,7 @@ class SQLiteStore:
             ).fetchall()
         out: list[dict[str, Any]] = []
         for row in rows:
-            data = self._row_to_dict(row)
-            if data is None:
-                continue
+            data = dict(row)
             try:
                 data["summary"] = json.loads(data.pop("summary_json", "{}"))
             except json.JSONDecodeError:
@@ -1391,9 +1708,7 @@ class SQLiteStore:
             ).fetchall()
         out: list[dict[str, Any]] = []
         for row in rows:
-            data = self._row_to_dict(row)
-            if data is None:
-                continue
+            data = dict(row)
             try:
                 data["payload"] = json.loads(data.pop("payload_json", "{}"))
             except json.JSONDecodeError:
@@ -1412,11 +1727,10 @@ class SQLiteStore:
                 """,
                 (key, value),
             )
-            conn.commit()
+            self._commit(conn)
 
     def get_state(self, key: str) -> str | None:
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             row = conn.execute(
                 "SELECT value FROM kv_state WHERE key = ?",
                 (key,),
@@ -1425,58 +1739,111 @@ class SQLiteStore:
                 return None
             return str(row["value"])
 
+    # --- Reminders ingress dedupe ---
+
+    def list_reminder_occurrences(self) -> dict[str, int]:
+        """Return processed reminder occurrence keys mapped to their last-seen unix time, oldest first."""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT occurrence_key, seen_at FROM reminders_processed ORDER BY seen_at ASC"
+            ).fetchall()
+        return {str(row["occurrence_key"]): int(row["seen_at"]) for row in rows}
+
+    def upsert_reminder_occurrences(self, occurrences: list[tuple[str, int]]) -> None:
+        """Insert or refresh processed reminder occurrences in a single commit."""
+        if not occurrences:
+            return
+        conn = self._connect()
+        with self._lock:
+            conn.executemany(
+                """
+                INSERT INTO reminders_processed(occurrence_key, seen_at)
+                VALUES(?, ?)
+                ON CONFLICT(occurrence_key) DO UPDATE SET seen_at=excluded.seen_at
+                """,
+                occurrences,
+            )
+            self._commit(conn)
+
+    def delete_reminder_occurrences(self, occurrence_keys: list[str]) -> int:
+        """Forget processed reminder occurrences. Returns the number of rows removed."""
+        if not occurrence_keys:
+            return 0
+        conn = self._connect()
+        with self._lock:
+            cursor = conn.executemany(
+                "DELETE FROM reminders_processed WHERE occurrence_key = ?",
+                [(key,) for key in occurrence_keys],
+            )
+            self._commit(conn)
+            return int(cursor.rowcount or 0)
+
     # --- Feature 2: Health Dashboard ---
 
     def get_stats(self) -> dict[str, Any]:
         """Return aggregate stats for the health dashboard."""
-        conn = self._connect()
-        with self._lock:
-            session_count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
-            message_count = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
-            pending_count = conn.execute(
-                "SELECT COUNT(*) FROM approvals WHERE status = 'pending'"
-            ).fetchone()[0]
+        with self._reader(snapshot=True) as conn:
+            session_count, message_count, pending_count = conn.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM sessions),
+                    (SELECT COUNT(*) FROM messages),
+                    (SELECT COUNT(*) FROM approvals WHERE status = 'pending')
+                """
+            ).fetchone()
 
             # Runs by state
             rows = conn.execute(
                 "SELECT state, COUNT(*) as cnt FROM runs GROUP BY state"
             ).fetchall()
-            runs_by_state = {row["state"]: row["cnt"] for row in rows}
 
             # Most recent event
             last_event_row = conn.execute(
                 "SELECT * FROM events ORDER BY created_at DESC LIMIT 1"
             ).fetchone()
-            last_event = self._row_to_dict(last_event_row)
 
-            return {
-                "active_sessions": session_count,
-                "total_messages": message_count,
-                "pending_approvals": pending_count,
-                "runs_by_state": runs_by_state,
-                "last_event": last_event,
-            }
+        return {
+            "active_sessions": session_count,
+            "total_messages": message_count,
+            "pending_approvals": pending_count,
+            "runs_by_state": {row["state"]: row["cnt"] for row in rows},
+            "last_event": self._row_to_dict(last_event_row),
+        }
 
     # --- Feature 3: Conversation Memory ---
 
     def recent_messages(self, sender: str, limit: int = 10) -> list[dict[str, Any]]:
         """Fetch the most recent messages from a sender."""
-        conn = self._connect()
-        with self._lock:
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM messages WHERE sender = ? ORDER BY received_at DESC LIMIT ?",
                 (sender, limit),
             ).fetchall()
-            return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
 
     def search_messages(self, sender: str, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search messages from a sender by text content."""
-        conn = self._connect()
+        # Trigrams need at least three characters to match anything.
+        if self._messages_fts and len(query) >= 3:
+            # One quoted FTS5 string is a literal substring match; "" escapes quotes.
+            match = '"' + query.replace('"', '""') + '"'
+            with self._reader() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT m.* FROM messages_fts f
+                    JOIN messages m ON m.rowid = f.rowid
+                    WHERE messages_fts MATCH ? AND m.sender = ?
+                    ORDER BY m.received_at DESC
+                    LIMIT ?
+                    """,
+                    (match, sender, limit),
+                ).fetchall()
+            return [dict(row) for row in rows]
         # Escape LIKE wildcards to prevent data disclosure via % or _ in user input
-        escaped_query = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        with self._lock:
+        escaped_query = query.translate(_LIKE_ESCAPES)
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM messages WHERE sender = ? AND text LIKE ? ESCAPE '\\' ORDER BY received_at DESC LIMIT ?",
                 (sender, f"%{escaped_query}%", limit),
             ).fetchall()
-            return [self._row_to_dict(row) for row in rows if row is not None]
+        return [dict(row) for row in rows]
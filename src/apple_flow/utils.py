@@ -2,7 +2,90 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
+import os
 import re
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+try:  # Optional fast JSON backend; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Hand stdlib-unsupported types to ``default`` (which raises) instead of
+# letting orjson encode them natively.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+_ENTROPY_REFILL_BYTES = 4096
+_entropy_pool = bytearray()
+_entropy_lock = threading.Lock()
+
+
+def _reset_entropy_pool() -> None:
+    # A forked child must not hand out the parent's remaining bytes.
+    _entropy_pool.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_entropy_pool)
+
+
+def short_id(prefix: str, nbytes: int = 6) -> str:
+    """Return ``prefix`` + ``2 * nbytes`` random hex chars.
+
+    Bytes are sliced from a pooled ``os.urandom`` buffer, so a burst of ids
+    costs one syscall per 4 KiB instead of one ``uuid4()`` each.
+    """
+    with _entropy_lock:
+        if len(_entropy_pool) < nbytes:
+            _entropy_pool.extend(os.urandom(_ENTROPY_REFILL_BYTES))
+        chunk = bytes(_entropy_pool[:nbytes])
+        del _entropy_pool[:nbytes]
+    return prefix + chunk.hex()
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize ``value`` to JSON, using orjson when installed.
+
+    The output is equivalent JSON but not byte-identical to ``json.dumps``.
+    orjson writes compact separators and raw UTF-8 instead of ``\\u`` escapes,
+    and it encodes NaN/Infinity as ``null``. Datetimes and dataclasses still
+    raise ``TypeError`` as with the stdlib. UUID and Enum members are the
+    exception: orjson encodes them natively. Builtin subclasses, and values
+    orjson cannot encode (e.g. ints wider than 64 bits), go through the
+    stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_reject_json_value, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+def _reject_json_value(value: Any) -> Any:
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_loads(raw: str | bytes) -> Any:
+    """Parse JSON text, using orjson when installed.
+
+    orjson's decode error subclasses ``json.JSONDecodeError``, so callers
+    keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def normalize_sender(raw: str) -> str:
@@ -42,3 +125,29 @@ def normalize_echo_text(text: str) -> str:
     normalized = normalized.replace('"', "'").lower()
     normalized = re.sub(r"[^a-z0-9@:+#./'_-]+", " ", normalized)
     return " ".join(normalized.split())
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` via a temp file and ``os.replace``.
+
+    Readers see either the old file or the complete new one, never a
+    truncated write. An existing file's permission bits are kept; new files
+    get the temp file's owner-only mode, which suits ``.env`` secrets.
+    """
+    try:
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
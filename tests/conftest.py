@@ -78,6 +78,7 @@ class FakeStore:
         self.sessions: dict[str, dict[str, Any]] = {}
         self.events: list[dict[str, Any]] = []
         self.state: dict[str, str] = {}
+        self.reminder_occurrences: dict[str, int] = {}
         self.run_jobs: dict[str, dict[str, Any]] = {}
         self.scan_runs: dict[str, dict[str, Any]] = {}
         self.scan_findings: dict[str, dict[str, Any]] = {}
@@ -200,7 +201,7 @@ class FakeStore:
             }
         )
 
-    def list_events(self, limit: int = 200) -> list[dict[str, Any]]:
+    def list_events(self, limit: int = 200, *, include_payload: bool = True) -> list[dict[str, Any]]:
         return self.events[:limit]
 
     def list_events_for_run(self, run_id: str, limit: int = 50) -> list[dict[str, Any]]:
@@ -225,6 +226,19 @@ class FakeStore:
     def get_state(self, key: str) -> str | None:
         return self.state.get(key)
 
+    def list_reminder_occurrences(self) -> dict[str, int]:
+        return dict(sorted(self.reminder_occurrences.items(), key=lambda item: item[1]))
+
+    def upsert_reminder_occurrences(self, occurrences: list[tuple[str, int]]) -> None:
+        self.reminder_occurrences.update(occurrences)
+
+    def delete_reminder_occurrences(self, occurrence_keys: list[str]) -> int:
+        removed = 0
+        for key in occurrence_keys:
+            if self.reminder_occurrences.pop(key, None) is not None:
+                removed += 1
+        return removed
+
     def enqueue_run_job(
         self,
         *,
@@ -353,6 +367,12 @@ class FakeStore:
         return results[:limit]
 
 
+@pytest.fixture(autouse=True)
+def _isolated_osascript_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep compiled AppleScript handlers out of the real user cache."""
+    monkeypatch.setattr("apple_flow.osascript_utils._COMPILED_SCRIPT_DIR", tmp_path / "osascript-cache")
+
+
 @pytest.fixture
 def fake_connector() -> FakeConnector:
     """Provide a fake connector for tests."""
@@ -0,0 +1,40 @@
+import httpx
+
+from apple_flow.admin_client import AdminClient
+
+
+def test_admin_client_reuses_one_pooled_client():
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(f"{request.method} {request.url}")
+        if request.url.path.endswith("/health"):
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path.endswith("/override"):
+            return httpx.Response(200, json={"request_id": "req_1", "status": "approved"})
+        return httpx.Response(200, json=[])
+
+    with AdminClient("http://admin.test/api/") as client:
+        client._client = httpx.Client(
+            base_url=client.base_url, timeout=client.timeout, transport=httpx.MockTransport(handler)
+        )
+        pooled = client._http()
+        assert client.health() == {"status": "ok"}
+        assert client.audit_events(limit=5) == []
+        assert client.override_approval("req_1", "approved")["status"] == "approved"
+        assert client._http() is pooled
+
+    assert client._client is None
+    assert pooled.is_closed
+    assert seen == [
+        "GET http://admin.test/api/health",
+        "GET http://admin.test/api/audit/events?limit=5",
+        "POST http://admin.test/api/approvals/req_1/override",
+    ]
+
+
+def test_admin_client_opens_connection_lazily():
+    client = AdminClient()
+    assert client._client is None
+    client.close()
+    assert client._client is None
@@ -381,6 +381,37 @@ class TestVoiceMessages:
         source = Path("/tmp/fake.aiff")
         assert at._prepare_imessage_attachment_path(source) == source
 
+    def test_synthesize_with_say_keeps_nonempty_audio(self, tmp_path):
+        audio = tmp_path / "out.aiff"
+
+        def fake_say(command, timeout):
+            audio.write_bytes(b"FORM")
+            return {"ok": True, "stderr": "", "error": ""}
+
+        with patch("apple_flow.apple_tools._build_temp_audio_path", return_value=str(audio)):
+            with patch("apple_flow.apple_tools._resolve_binary", return_value="/usr/bin/say"):
+                with patch("apple_flow.apple_tools._run_command", side_effect=fake_say):
+                    result = at._synthesize_tts_to_audio_file(
+                        "hi", voice="", rate=180, tts_engine="say", piper_command="piper", piper_model_path=""
+                    )
+        assert result == {"ok": True, "engine": "say", "path": str(audio)}
+
+    def test_synthesize_with_say_discards_empty_audio(self, tmp_path):
+        audio = tmp_path / "out.aiff"
+
+        def fake_say(command, timeout):
+            audio.write_bytes(b"")
+            return {"ok": True, "stderr": "", "error": ""}
+
+        with patch("apple_flow.apple_tools._build_temp_audio_path", return_value=str(audio)):
+            with patch("apple_flow.apple_tools._resolve_binary", return_value="/usr/bin/say"):
+                with patch("apple_flow.apple_tools._run_command", side_effect=fake_say):
+                    result = at._synthesize_tts_to_audio_file(
+                        "hi", voice="", rate=180, tts_engine="say", piper_command="piper", piper_model_path=""
+                    )
+        assert result["ok"] is False
+        assert not audio.exists()
+
 
 # ---------------------------------------------------------------------------
 # Apple Notes
@@ -112,3 +112,19 @@ def test_extract_prompt_labels_from_classify_into_phrase():
 def test_extract_prompt_labels_returns_empty_when_not_provided():
     labels = extract_prompt_labels("task: summarize latest unread email")
     assert labels == []
+
+
+@pytest.mark.parametrize(("text", "kind", "payload"), [
+    ("Deny All", CommandKind.DENY_ALL, ""),
+    ("deny  all", CommandKind.DENY, "all"),
+    ("NEW CHAT", CommandKind.CLEAR_CONTEXT, ""),
+    ("Status run_1", CommandKind.STATUS, "run_1"),
+    ("approve", CommandKind.CHAT, "approve"),
+    ("status: what now", CommandKind.CHAT, "status: what now"),
+    ("IDEA:ship it", CommandKind.IDEA, "ship it"),
+    ("idea : ship it", CommandKind.CHAT, "idea : ship it"),
+    ("health:", CommandKind.HEALTH, ""),
+])
+def test_parse_command_dispatch_edge_cases(text, kind, payload):
+    parsed = parse_command(text)
+    assert (parsed.kind, parsed.payload) == (kind, payload)
@@ -537,7 +537,7 @@ class TestCheckAndNotify:
         connector = FakeConnector()
         connector.run_turn = lambda tid, prompt: "Follow-up: checking in."
         scheduler = MagicMock()
-        scheduler.check_due.return_value = [
+        scheduler.pop_due.return_value = [
             {"action_id": "a1", "action_type": "check_in", "payload": {"summary": "deploy check"}}
         ]
         comp = _make_companion(connector=connector, egress=egress, scheduler=scheduler)
@@ -546,7 +546,7 @@ class TestCheckAndNotify:
              patch("apple_flow.apple_tools.calendar_list_events", return_value=[]), \
              patch("apple_flow.apple_tools.reminders_list", return_value=[]):
             comp._check_and_notify()
-        scheduler.mark_fired.assert_called_once_with("a1")
+        scheduler.pop_due.assert_called_once_with()
         assert len(egress.messages) >= 1
 
 
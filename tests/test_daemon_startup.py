@@ -124,7 +124,7 @@ def test_relaydaemon_wires_gemini_approval_mode(monkeypatch, tmp_path):
     captured_kwargs: dict[str, object] = {}
 
     class _FakeStore:
-        def __init__(self, _path, csv_audit_logger=None):
+        def __init__(self, _path, csv_audit_logger=None, journal_mode="wal"):
             self._conn = sqlite3.connect(":memory:")
             self._lock = threading.Lock()
 
@@ -196,7 +196,7 @@ def test_relaydaemon_wires_ollama_connector(monkeypatch, tmp_path):
     captured_kwargs: dict[str, object] = {}
 
     class _FakeStore:
-        def __init__(self, _path, csv_audit_logger=None):
+        def __init__(self, _path, csv_audit_logger=None, journal_mode="wal"):
             self._conn = sqlite3.connect(":memory:")
             self._lock = threading.Lock()
 
@@ -356,7 +356,7 @@ def test_relaydaemon_initializes_memory_v2(monkeypatch, tmp_path):
     captured: dict[str, object] = {}
 
     class _FakeStore:
-        def __init__(self, _path, csv_audit_logger=None):
+        def __init__(self, _path, csv_audit_logger=None, journal_mode="wal"):
             self._conn = sqlite3.connect(":memory:")
             self._lock = threading.Lock()
 
@@ -576,7 +576,8 @@ async def test_reminders_poll_loop_marks_processed_only_after_success():
 
     daemon.reminders_ingress = SimpleNamespace(
         fetch_new=_fetch_new,
-        mark_processed_occurrence=lambda key: marked.append(key),
+        mark_processed_occurrence=lambda key, **kwargs: marked.append(key),
+        flush_processed=lambda: None,
         last_fetch_error="",
     )
     daemon.reminders_egress = SimpleNamespace(
@@ -596,6 +597,61 @@ async def test_reminders_poll_loop_marks_processed_only_after_success():
     assert marked == []
 
 
+@pytest.mark.asyncio
+async def test_reminders_poll_loop_flushes_marks_once_per_dispatch_batch():
+    daemon = RelayDaemon.__new__(RelayDaemon)
+    daemon._shutdown_requested = False
+    daemon._concurrency_sem = asyncio.Semaphore(2)
+    daemon.settings = SimpleNamespace(reminders_list_name="agent-task", reminders_archive_list_name="agent-archive", reminders_poll_interval_seconds=0)
+    daemon._inflight_dispatch_tasks = set()
+    daemon.store = FakeStore()
+    daemon._record_gateway_success = lambda gateway: None
+    daemon._record_gateway_failure = lambda gateway, error: None
+    daemon._record_loop_success = lambda name: None
+    daemon._record_loop_failure = lambda name, reason: None
+    daemon._record_connector_completion = lambda: None
+    daemon._publish_watchdog_state = lambda: None
+
+    inbound = [
+        InboundMessage(
+            id=f"reminder_{n}",
+            sender="+15551234567",
+            text=f"task: item {n}",
+            received_at="2026-01-01T00:00:00Z",
+            is_from_me=False,
+            context={"reminder_id": f"rem-{n}", "occurrence_key": f"rem-{n}|"},
+        )
+        for n in (1, 2)
+    ]
+    events: list[str] = []
+    batches = [inbound]
+
+    def _fetch_new():
+        if batches:
+            return batches.pop()
+        daemon._shutdown_requested = True
+        return []
+
+    daemon.reminders_ingress = SimpleNamespace(
+        fetch_new=_fetch_new,
+        mark_processed_occurrence=lambda key, **kwargs: events.append(f"mark:{key}"),
+        flush_processed=lambda: events.append("flush"),
+        last_fetch_error="",
+    )
+    daemon.reminders_egress = SimpleNamespace(
+        annotate_reminder=lambda *args, **kwargs: None,
+        move_to_archive=lambda *args, **kwargs: None,
+    )
+    daemon.reminders_orchestrator = SimpleNamespace(
+        handle_message=lambda msg: SimpleNamespace(kind=CommandKind.CHAT, response="", run_id=None)
+    )
+
+    await daemon._poll_reminders_loop()
+
+    assert sorted(events[:2]) == ["mark:rem-1|", "mark:rem-2|"]
+    assert events[2:] == ["flush", "flush"]
+
+
 @pytest.mark.asyncio
 async def test_reminders_poll_loop_skips_fetch_while_live_gate_active(monkeypatch):
     daemon = RelayDaemon.__new__(RelayDaemon)
@@ -634,7 +690,8 @@ async def test_reminders_poll_loop_skips_fetch_while_live_gate_active(monkeypatc
 
     daemon.reminders_ingress = SimpleNamespace(
         fetch_new=_fetch_new,
-        mark_processed_occurrence=lambda key: None,
+        mark_processed_occurrence=lambda key, **kwargs: None,
+        flush_processed=lambda: None,
         last_fetch_error="",
     )
     daemon.reminders_egress = SimpleNamespace(
@@ -1192,3 +1249,19 @@ async def test_top_level_run_handles_cancellederror_gracefully(monkeypatch):
 
     await daemon_module.run()
     assert shutdown_called["value"] is True
+
+
+def test_poll_delay_drops_to_active_cadence_after_messages_and_backs_off_when_idle():
+    delay = daemon_module._next_poll_delay(2.0, True, 2.0)
+    assert delay == 0.25
+
+    steps = []
+    for _ in range(5):
+        delay = daemon_module._next_poll_delay(delay, False, 2.0)
+        steps.append(delay)
+    assert steps == [0.5, 1.0, 2.0, 2.0, 2.0]
+
+
+def test_poll_delay_never_exceeds_a_small_configured_interval():
+    assert daemon_module._next_poll_delay(0.1, True, 0.1) == 0.1
+    assert daemon_module._next_poll_delay(0.1, False, 0.1) == 0.1
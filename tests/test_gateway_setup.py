@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from apple_flow import gateway_setup
+from apple_flow.osascript_utils import OsaScriptRunResult
+
+
+def _ensure_all(**overrides):
+    kwargs = dict(
+        enable_reminders=True,
+        enable_notes=True,
+        enable_notes_logging=True,
+        enable_calendar=True,
+        reminders_list_name="agent-task",
+        reminders_archive_list_name="agent-archive",
+        notes_folder_name="agent-task",
+        notes_archive_folder_name="agent-archive",
+        notes_log_folder_name="agent-logs",
+        calendar_name="agent-schedule",
+    )
+    kwargs.update(overrides)
+    return gateway_setup.ensure_gateway_resources(**kwargs)
+
+
+def test_ensure_gateway_resources_uses_one_osascript_call(monkeypatch):
+    calls: list[dict] = []
+
+    def fake_run(script, **kwargs):
+        calls.append({"script": script, **kwargs})
+        return OsaScriptRunResult(
+            ok=True,
+            stdout="created\nexists\nexists\nfailed: Notes got an error\ncreated\nexists",
+        )
+
+    monkeypatch.setattr(gateway_setup, "run_osascript_with_recovery", fake_run)
+
+    statuses = _ensure_all()
+
+    assert len(calls) == 1
+    assert calls[0]["app_name"] == ""
+    assert 'tell application "Reminders"' in calls[0]["script"]
+    assert 'tell application "Calendar"' in calls[0]["script"]
+    assert [(s.label, s.result.status) for s in statuses] == [
+        ("Reminders task list", "created"),
+        ("Reminders archive list", "exists"),
+        ("Notes task folder", "exists"),
+        ("Notes archive folder", "failed"),
+        ("Notes log folder", "created"),
+        ("Calendar", "exists"),
+    ]
+    assert statuses[3].result.detail == "Notes got an error"
+
+
+def test_ensure_gateway_resources_reports_run_failure_for_each_resource(monkeypatch):
+    monkeypatch.setattr(
+        gateway_setup,
+        "run_osascript_with_recovery",
+        lambda script, **kwargs: OsaScriptRunResult(ok=False, stderr="timed out", returncode=-1),
+    )
+
+    statuses = _ensure_all(enable_notes=False, enable_notes_logging=False, enable_calendar=False)
+
+    assert [(s.result.status, s.result.detail) for s in statuses] == [("failed", "timed out")] * 2
+
+
+def test_nested_reminders_selector_fails_without_running_script(monkeypatch):
+    calls: list[str] = []
+
+    def fake_run(script, **kwargs):
+        calls.append(kwargs["app_name"])
+        return OsaScriptRunResult(ok=True, stdout="exists")
+
+    monkeypatch.setattr(gateway_setup, "run_osascript_with_recovery", fake_run)
+
+    statuses = _ensure_all(
+        reminders_list_name="Work/agent-task",
+        enable_notes=False,
+        enable_notes_logging=False,
+        enable_calendar=False,
+    )
+
+    assert statuses[0].result.status == "failed"
+    assert "nested" in statuses[0].result.detail
+    assert statuses[1].result.status == "exists"
+    assert calls == ["Reminders"]
+
+
+def test_missing_output_lines_are_reported_as_failed(monkeypatch):
+    monkeypatch.setattr(
+        gateway_setup,
+        "run_osascript_with_recovery",
+        lambda script, **kwargs: OsaScriptRunResult(ok=True, stdout="created"),
+    )
+
+    statuses = _ensure_all(enable_notes=False, enable_notes_logging=False, enable_calendar=False)
+
+    assert [s.result.status for s in statuses] == ["created", "failed"]
+    assert statuses[1].result.detail == "empty AppleScript output"
+
+
+def test_escape_applescript_escapes_backslash_and_quote_once():
+    assert gateway_setup._escape_applescript('a\\b"c') == 'a\\\\b\\"c'
+    assert gateway_setup._escape_applescript('\\"') == '\\\\\\"'
+
+
+def test_app_not_running_marker_warms_app_and_retries(monkeypatch):
+    scripts: list[str] = []
+    outputs = iter(["failed:Application isn't running. (-600)", "created"])
+    warmed: list[str] = []
+
+    def fake_run(script, **kwargs):
+        scripts.append(script)
+        return OsaScriptRunResult(ok=True, stdout=next(outputs))
+
+    monkeypatch.setattr(gateway_setup, "run_osascript_with_recovery", fake_run)
+    monkeypatch.setattr(gateway_setup, "warm_app", lambda app: warmed.append(app) or True)
+
+    result = gateway_setup.ensure_reminders_list("agent-task")
+
+    assert result.status == "created"
+    assert warmed == ["Reminders"]
+    assert len(scripts) == 2
+
+
+def test_recovery_reruns_only_failed_resources(monkeypatch):
+    scripts: list[str] = []
+    outputs = iter([
+        "exists\nexists\nfailed:Application isn’t running. (-600)\nexists\nexists\n"
+        "failed:Connection Invalid error for service com.apple.hiservices-xpcservice",
+        "created\nexists",
+    ])
+    warmed: list[str] = []
+
+    def fake_run(script, **kwargs):
+        scripts.append(script)
+        return OsaScriptRunResult(ok=True, stdout=next(outputs))
+
+    monkeypatch.setattr(gateway_setup, "run_osascript_with_recovery", fake_run)
+    monkeypatch.setattr(gateway_setup, "warm_app", lambda app: warmed.append(app) or True)
+
+    statuses = _ensure_all()
+
+    assert [s.result.status for s in statuses] == ["exists", "exists", "created", "exists", "exists", "exists"]
+    assert warmed == ["Notes"]
+    retry_script = scripts[1]
+    assert retry_script.count("tell application") == 2
+    assert 'tell application "Notes"' in retry_script
+    assert 'tell application "Calendar"' in retry_script
+    assert 'tell application "Reminders"' not in retry_script
+
+
+def test_unrecoverable_in_script_failure_is_not_retried(monkeypatch):
+    calls: list[str] = []
+
+    def fake_run(script, **kwargs):
+        calls.append(script)
+        return OsaScriptRunResult(ok=True, stdout="failed:Notes got an error")
+
+    monkeypatch.setattr(gateway_setup, "run_osascript_with_recovery", fake_run)
+
+    assert gateway_setup.ensure_notes_folder("agent-task").status == "failed"
+    assert len(calls) == 1
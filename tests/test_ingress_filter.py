@@ -34,3 +34,28 @@ def test_fetch_new_can_filter_by_allowlist(tmp_path):
     assert len(rows) == 1
     assert rows[0].sender == "+15551234567"
     assert rows[0].text == "mine"
+
+
+def test_fetch_new_reports_scanned_tip_past_filtered_rows(tmp_path):
+    db_path = tmp_path / "chat.db"
+    _create_messages_db(db_path)
+
+    ingress = IMessageIngress(db_path)
+    rows = ingress.fetch_new(sender_allowlist=["+15551234567"])
+
+    assert [row.id for row in rows] == ["1"]
+    assert ingress.last_scanned_rowid == 2
+
+    assert ingress.fetch_new(since_rowid=2, sender_allowlist=["+15551234567"]) == []
+    assert ingress.last_scanned_rowid == 2
+
+
+def test_fetch_new_withholds_scanned_tip_when_batch_is_truncated(tmp_path):
+    db_path = tmp_path / "chat.db"
+    _create_messages_db(db_path)
+
+    ingress = IMessageIngress(db_path)
+    rows = ingress.fetch_new(limit=1)
+
+    assert [row.id for row in rows] == ["1"]
+    assert ingress.last_scanned_rowid is None
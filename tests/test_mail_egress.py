@@ -181,7 +181,7 @@ def test_fingerprint_includes_mail_prefix():
 
 def test_gc_removes_expired_entries():
     egress = AppleMailEgress(echo_window_seconds=0.0)
-    egress._recent_fingerprints["old_fp"] = time.time() - 1
+    egress._recent_fingerprints["old_fp"] = time.monotonic() - 1
     egress._gc_recent()
     assert "old_fp" not in egress._recent_fingerprints
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import subprocess
+from pathlib import Path
 
-from apple_flow.osascript_utils import run_osascript_with_recovery
+from apple_flow.osascript_utils import compile_applescript, run_osascript_with_recovery
 
 
 def _completed(returncode: int, stdout: str = "", stderr: str = "") -> subprocess.CompletedProcess[str]:
@@ -57,3 +58,48 @@ def test_run_osascript_with_recovery_launches_app_when_not_running(monkeypatch):
     assert result.stdout == "ok"
     assert opened == [["open", "-a", "Calendar"]]
     assert len(calls) == 3
+
+
+def test_run_osascript_with_recovery_passes_argv_to_compiled_script(monkeypatch):
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, capture_output, text, timeout, check=False):
+        calls.append(cmd)
+        return _completed(0, stdout="ok\n")
+
+    monkeypatch.setattr("apple_flow.osascript_utils.subprocess.run", fake_run)
+
+    result = run_osascript_with_recovery("unused", compiled_path="/tmp/x.scpt", argv=("a", "b"))
+    inline = run_osascript_with_recovery("return 1", argv=("c",))
+
+    assert result.ok is True and inline.ok is True
+    assert calls == [["osascript", "/tmp/x.scpt", "a", "b"], ["osascript", "-e", "return 1", "c"]]
+
+
+def test_compile_applescript_returns_none_when_osacompile_missing(monkeypatch):
+    def fake_run(cmd, capture_output, text, timeout, check=False):
+        raise FileNotFoundError("osacompile")
+
+    monkeypatch.setattr("apple_flow.osascript_utils.subprocess.run", fake_run)
+
+    assert compile_applescript("return 1", "probe") is None
+
+
+def test_compile_applescript_reuses_cached_script(monkeypatch, tmp_path):
+    monkeypatch.setattr("apple_flow.osascript_utils._COMPILED_SCRIPT_DIR", tmp_path)
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, capture_output, text, timeout, check=False):
+        calls.append(cmd)
+        Path(cmd[2]).write_bytes(b"compiled")
+        return _completed(0)
+
+    monkeypatch.setattr("apple_flow.osascript_utils.subprocess.run", fake_run)
+
+    first = compile_applescript("return 1", "probe")
+    second = compile_applescript("return 1", "probe")
+    changed = compile_applescript("return 2", "probe")
+
+    assert first == second and first is not None and first.startswith(str(tmp_path))
+    assert changed != first
+    assert len(calls) == 2
@@ -13,6 +13,13 @@ def test_sender_allowlist_enforced():
     assert not policy.is_sender_allowed("+15550000000")
 
 
+def test_empty_sender_allowlist_blocks_everyone():
+    policy = PolicyEngine(RelaySettings(allowed_senders=[]))
+
+    assert not policy.is_sender_allowed("+15551234567")
+    assert not policy.is_sender_allowed("")
+
+
 def test_workspace_allowlist_enforced():
     settings = RelaySettings(
         allowed_senders=["+15551234567"],
@@ -2,52 +2,52 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from apple_flow.reminders_egress import AppleRemindersEgress
 
 
-def test_complete_reminder_builds_correct_script(monkeypatch):
-    captured_scripts: list[str] = []
+def _osascript_result(stdout: str, *, returncode: int = 0, text: bool = False) -> SimpleNamespace:
+    """Fake CompletedProcess honouring the caller's text/bytes mode."""
+    if text:
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
+    return SimpleNamespace(returncode=returncode, stdout=stdout.encode("utf-8"), stderr=b"")
+
+
+def _resolved(selector: str) -> dict[str, str]:
+    return {"id": "", "name": selector, "path": selector, "source": "applescript"}
 
+
+def _run_recorder(calls: list[list[str]], stdout: str = "ok"):
     def fake_run(args, **kwargs):
-        captured_scripts.append(args[2])
+        calls.append(list(args))
+        return _osascript_result(stdout, text=kwargs.get("text", False))
 
-        class Result:
-            returncode = 0
-            stdout = "ok"
-            stderr = ""
+    return fake_run
 
-        return Result()
 
+def test_complete_reminder_passes_values_as_argv(monkeypatch):
+    calls: list[list[str]] = []
     import subprocess
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", _run_recorder(calls))
 
     egress = AppleRemindersEgress(list_name="agent-task")
-    result = egress.complete_reminder("rem_001", "Task completed successfully")
+    monkeypatch.setattr(egress, "_resolve_list_selector", _resolved)
+    result = egress.complete_reminder("rem_001", 'Done "quoted"\nline two')
 
     assert result is True
-    script = captured_scripts[-1]
-    assert "rem_001" in script
-    assert "agent-task" in script
-    assert "completed of matchedReminder to true" in script
+    assert calls[0][0] == "osacompile"
+    assert "set completed of matchedReminder to true" in calls[0][4]
+    compiled_path = calls[0][2]
+    assert calls[-1] == ["osascript", compiled_path, "", "agent-task", "rem_001", 'Done "quoted"\nline two']
 
 
 def test_complete_reminder_uses_resolved_list_id(monkeypatch):
-    captured_scripts: list[str] = []
-
-    def fake_run(args, **kwargs):
-        captured_scripts.append(args[2])
-
-        class Result:
-            returncode = 0
-            stdout = "ok"
-            stderr = ""
-
-        return Result()
-
+    calls: list[list[str]] = []
     import subprocess
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", _run_recorder(calls))
 
     egress = AppleRemindersEgress(list_name="agent-task")
     monkeypatch.setattr(
@@ -63,18 +63,46 @@ def test_complete_reminder_uses_resolved_list_id(monkeypatch):
     result = egress.complete_reminder("rem_001", "Task completed successfully")
 
     assert result is True
-    script = captured_scripts[0]
-    assert 'set taskList to first list whose id is "list_dev"' in script
+    assert calls[-1][2:4] == ["list_dev", "agent-task"]
 
 
-def test_complete_reminder_returns_false_on_error(monkeypatch):
+def test_scripts_are_compiled_once_per_egress(monkeypatch):
+    calls: list[list[str]] = []
+    import subprocess
+
+    monkeypatch.setattr(subprocess, "run", _run_recorder(calls))
+
+    egress = AppleRemindersEgress(list_name="agent-task")
+    monkeypatch.setattr(egress, "_resolve_list_selector", _resolved)
+    egress.complete_reminder("rem_001", "one")
+    egress.complete_reminder("rem_002", "two")
+
+    assert [call[0] for call in calls] == ["osacompile", "osascript", "osascript"]
+
+
+def test_falls_back_to_inline_script_when_osacompile_missing(monkeypatch):
+    calls: list[list[str]] = []
+    import subprocess
+
     def fake_run(args, **kwargs):
-        class Result:
-            returncode = 1
-            stdout = "error: reminder not found"
-            stderr = ""
+        if args[0] == "osacompile":
+            raise FileNotFoundError("osacompile")
+        calls.append(list(args))
+        return _osascript_result("ok", text=kwargs.get("text", False))
 
-        return Result()
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    egress = AppleRemindersEgress(list_name="agent-task")
+    monkeypatch.setattr(egress, "_resolve_list_selector", _resolved)
+
+    assert egress.complete_reminder("rem_001", "text") is True
+    assert calls[-1][:2] == ["osascript", "-e"]
+    assert calls[-1][3:] == ["", "agent-task", "rem_001", "text"]
+
+
+def test_complete_reminder_returns_false_on_error(monkeypatch):
+    def fake_run(args, **kwargs):
+        return _osascript_result("error: reminder not found", returncode=1, text=kwargs.get("text", False))
 
     import subprocess
 
@@ -114,41 +142,24 @@ def test_complete_reminder_handles_missing_osascript(monkeypatch):
     assert result is False
 
 
-def test_annotate_reminder_builds_correct_script(monkeypatch):
-    captured_scripts: list[str] = []
-
-    def fake_run(args, **kwargs):
-        captured_scripts.append(args[2])
-
-        class Result:
-            returncode = 0
-            stdout = "ok"
-            stderr = ""
-
-        return Result()
-
+def test_annotate_reminder_passes_note_as_argv(monkeypatch):
+    calls: list[list[str]] = []
     import subprocess
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", _run_recorder(calls))
 
     egress = AppleRemindersEgress(list_name="agent-task")
+    monkeypatch.setattr(egress, "_resolve_list_selector", _resolved)
     result = egress.annotate_reminder("rem_002", "Awaiting approval")
 
     assert result is True
-    script = captured_scripts[-1]
-    assert "rem_002" in script
-    assert "agent-task" in script
-    assert "completed of matchedReminder to true" not in script
+    assert "set completed of matchedReminder to true" not in calls[0][4]
+    assert calls[-1][2:] == ["", "agent-task", "rem_002", "Awaiting approval"]
 
 
 def test_annotate_reminder_returns_false_on_error(monkeypatch):
     def fake_run(args, **kwargs):
-        class Result:
-            returncode = 0
-            stdout = "error: list not found"
-            stderr = ""
-
-        return Result()
+        return _osascript_result("error: list not found", returncode=0, text=kwargs.get("text", False))
 
     import subprocess
 
@@ -160,42 +171,24 @@ def test_annotate_reminder_returns_false_on_error(monkeypatch):
     assert result is False
 
 
-def test_move_to_archive_builds_correct_script(monkeypatch):
-    captured_scripts: list[str] = []
-
-    def fake_run(args, **kwargs):
-        captured_scripts.append(args[2])
-
-        class Result:
-            returncode = 0
-            stdout = "ok"
-            stderr = ""
-
-        return Result()
-
+def test_move_to_archive_passes_both_lists_as_argv(monkeypatch):
+    calls: list[list[str]] = []
     import subprocess
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "run", _run_recorder(calls))
 
     egress = AppleRemindersEgress(list_name="agent-task")
+    monkeypatch.setattr(egress, "_resolve_list_selector", _resolved)
     result = egress.move_to_archive("rem_003", "done", "agent-task", "agent-archive")
 
     assert result is True
-    script = captured_scripts[-1]
-    assert "rem_003" in script
-    assert 'set sourceList to list "agent-task"' in script
-    assert 'set archiveList to list "agent-archive"' in script
-    assert "move matchedReminder to archiveList" in script
+    assert "move matchedReminder to archiveList" in calls[0][4]
+    assert calls[-1][2:] == ["", "agent-task", "", "agent-archive", "rem_003", "done"]
 
 
 def test_move_to_archive_returns_false_on_error(monkeypatch):
     def fake_run(args, **kwargs):
-        class Result:
-            returncode = 1
-            stdout = "error: archive list missing"
-            stderr = ""
-
-        return Result()
+        return _osascript_result("error: archive list missing", returncode=1, text=kwargs.get("text", False))
 
     import subprocess
 
@@ -0,0 +1,69 @@
+"""Tests for the optional EventKit Reminders backend (no PyObjC required)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from apple_flow.reminders_eventkit import EventKitRemindersBackend
+
+
+class _FakeEventStore:
+    def __init__(self, calendars, reminders):
+        self.calendars = calendars
+        self.reminders = reminders
+        self.predicate_calendars = None
+
+    def calendarsForEntityType_(self, _entity_type):
+        return self.calendars
+
+    def predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(self, _start, _end, calendars):
+        self.predicate_calendars = calendars
+        return "predicate"
+
+    def fetchRemindersMatchingPredicate_completion_(self, _predicate, completion):
+        completion(self.reminders)
+
+
+def _calendar(title):
+    return SimpleNamespace(title=lambda: title)
+
+
+def _reminder(identifier, title, notes=None):
+    return SimpleNamespace(
+        calendarItemIdentifier=lambda: identifier,
+        title=lambda: title,
+        notes=lambda: notes,
+        creationDate=lambda: None,
+        dueDateComponents=lambda: None,
+    )
+
+
+def test_fetch_incomplete_uses_applescript_id_form():
+    # Reminders.app reports ids as "x-apple-reminder://<calendarItemIdentifier>".
+    store = _FakeEventStore(
+        [_calendar("agent-task"), _calendar("other")],
+        [_reminder("9F1C-UUID", "Ship it", "notes"), _reminder("A2B3-UUID", "Second")],
+    )
+    backend = EventKitRemindersBackend(SimpleNamespace(), store)
+
+    rows = backend.fetch_incomplete("agent-task", limit=1)
+
+    assert rows == [
+        {"id": "x-apple-reminder://9F1C-UUID", "name": "Ship it", "body": "notes", "creation_date": "", "due_date": ""}
+    ]
+    assert [c.title() for c in store.predicate_calendars] == ["agent-task"]
+
+
+def test_fetch_incomplete_returns_none_for_ambiguous_list():
+    store = _FakeEventStore([_calendar("agent-task"), _calendar("agent-task")], [])
+    backend = EventKitRemindersBackend(SimpleNamespace(), store)
+
+    assert backend.fetch_incomplete("agent-task", limit=10) is None
+
+
+def test_store_change_notification_bumps_change_count():
+    backend = EventKitRemindersBackend(SimpleNamespace(), _FakeEventStore([], []))
+
+    backend._on_store_changed(None)
+
+    assert backend.change_count == 1
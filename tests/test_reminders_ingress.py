@@ -7,7 +7,8 @@ from datetime import datetime, timedelta
 
 from conftest import FakeStore
 
-from apple_flow.reminders_ingress import AppleRemindersIngress
+from apple_flow.osascript_utils import OsaScriptRunResult
+from apple_flow.reminders_ingress import AppleRemindersIngress, _RawReminder
 
 
 def _due_in(offset_seconds: int) -> str:
@@ -22,13 +23,13 @@ def test_fetch_new_converts_to_inbound_messages(monkeypatch):
         store=store,
     )
     raw = [
-        {
-            "id": "rem_001",
-            "name": "Fix the login bug",
-            "body": "Users can't log in with SSO",
-            "creation_date": "2026-02-17T10:00:00",
-            "due_date": "",
-        },
+        _RawReminder(
+            id="rem_001",
+            name="Fix the login bug",
+            body="Users can't log in with SSO",
+            creation_date="2026-02-17T10:00:00",
+            due_date="",
+        ),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
@@ -57,7 +58,7 @@ def test_fetch_new_auto_approve_uses_relay_prefix(monkeypatch):
         store=store,
     )
     raw = [
-        {"id": "rem_002", "name": "Explain the auth flow", "body": "", "creation_date": "", "due_date": ""},
+        _RawReminder(id="rem_002", name="Explain the auth flow", body="", creation_date="", due_date=""),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
@@ -76,8 +77,8 @@ def test_fetch_new_skips_already_processed_occurrence(monkeypatch):
     ingress.mark_processed_occurrence("rem_001|")
 
     raw = [
-        {"id": "rem_001", "name": "Already done", "body": "", "creation_date": "", "due_date": ""},
-        {"id": "rem_002", "name": "New task", "body": "", "creation_date": "", "due_date": ""},
+        _RawReminder(id="rem_001", name="Already done", body="", creation_date="", due_date=""),
+        _RawReminder(id="rem_002", name="New task", body="", creation_date="", due_date=""),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
@@ -94,7 +95,7 @@ def test_fetch_new_skips_empty_names(monkeypatch):
         store=store,
     )
     raw = [
-        {"id": "rem_empty", "name": "", "body": "", "creation_date": "", "due_date": ""},
+        _RawReminder(id="rem_empty", name="", body="", creation_date="", due_date=""),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
@@ -110,7 +111,7 @@ def test_fetch_new_skips_missing_id(monkeypatch):
         store=store,
     )
     raw = [
-        {"id": "", "name": "No ID", "body": "", "creation_date": "", "due_date": ""},
+        _RawReminder(id="", name="No ID", body="", creation_date="", due_date=""),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
@@ -129,9 +130,7 @@ def test_mark_processed_occurrence_persists_to_store():
     ingress.mark_processed_occurrence("rem_001|")
     ingress.mark_processed_occurrence("rem_002|2026-03-01 12:00:00")
 
-    raw = store.get_state("reminders_processed_occurrences")
-    assert raw is not None
-    occurrences = json.loads(raw)
+    occurrences = store.list_reminder_occurrences()
     assert "rem_001|" in occurrences
     assert "rem_002|2026-03-01 12:00:00" in occurrences
 
@@ -150,6 +149,17 @@ def test_processed_occurrences_hydrated_from_store():
     )
     assert "rem_old_1|" in ingress._processed_occurrences
     assert "rem_old_2|2026-03-01 08:00:00" in ingress._processed_occurrences
+    assert "rem_old_1|" in store.list_reminder_occurrences()
+    assert not store.get_state("reminders_processed_occurrences")
+
+
+def test_processed_occurrences_hydrated_from_table():
+    store = FakeStore()
+    store.upsert_reminder_occurrences([("rem_a|", 100), ("rem_b|", 200)])
+
+    ingress = AppleRemindersIngress(list_name="agent-task", store=store)
+
+    assert list(ingress._processed_occurrences) == ["rem_a|", "rem_b|"]
 
 
 def test_legacy_processed_ids_migrated_to_occurrences():
@@ -163,9 +173,8 @@ def test_legacy_processed_ids_migrated_to_occurrences():
     )
     assert "rem_old_1|" in ingress._processed_occurrences
     assert "rem_old_2|" in ingress._processed_occurrences
-    migrated = store.get_state("reminders_processed_occurrences")
-    assert migrated is not None
-    assert "rem_old_1|" in json.loads(migrated)
+    assert "rem_old_1|" in store.list_reminder_occurrences()
+    assert not store.get_state("reminders_processed_ids")
 
 
 def test_latest_rowid_returns_zero():
@@ -202,27 +211,41 @@ def test_compose_text_empty():
     assert result == ""
 
 
-def test_parse_tab_delimited():
+def test_parse_ndjson():
     output = (
-        "rem1\tTask 1\tBody 1\t2026-02-17\t2026-02-18 10:00:00\n"
-        "rem2\tTask 2\tBody 2\t2026-02-17\t\n"
-        "rem3\tTask 3\t\t\t"
+        '{"id":"rem1","name":"Task 1","body":"Body 1","creation_date":"2026-02-17","due_date":"2026-02-18 10:00:00"}\n'
+        '{"id":"rem2","name":"Task 2","body":"Body 2","creation_date":"2026-02-17","due_date":""}\n'
+        '{"id":"rem3","name":"Task 3","body":"","creation_date":"","due_date":""}'
     )
-    results = AppleRemindersIngress._parse_tab_delimited(output)
+    results = AppleRemindersIngress._parse_ndjson(output)
     assert len(results) == 3
-    assert results[0]["id"] == "rem1"
-    assert results[0]["name"] == "Task 1"
-    assert results[0]["body"] == "Body 1"
-    assert results[0]["creation_date"] == "2026-02-17"
-    assert results[0]["due_date"] == "2026-02-18 10:00:00"
+    assert results[0].id == "rem1"
+    assert results[0].name == "Task 1"
+    assert results[0].body == "Body 1"
+    assert results[0].creation_date == "2026-02-17"
+    assert results[0].due_date == "2026-02-18 10:00:00"
+
+    assert results[1].id == "rem2"
+    assert results[1].due_date == ""
 
-    assert results[1]["id"] == "rem2"
-    assert results[1]["due_date"] == ""
+    assert results[2].id == "rem3"
+    assert results[2].body == ""
+    assert results[2].creation_date == ""
+    assert results[2].due_date == ""
 
-    assert results[2]["id"] == "rem3"
-    assert results[2]["body"] == ""
-    assert results[2]["creation_date"] == ""
-    assert results[2]["due_date"] == ""
+
+def test_parse_ndjson_keeps_escaped_newlines_raw_tabs_and_skips_bad_lines():
+    output = (
+        '{"id":"rem1","name":"Say \\"hi\\"","body":"line 1\\nline 2\tindented \\\\ done",'
+        '"creation_date":"","due_date":""}\n'
+        "not json\n"
+        '{"id":"rem2","name":"Task 2"}'
+    )
+    results = AppleRemindersIngress._parse_ndjson(output)
+    assert [r.id for r in results] == ["rem1", "rem2"]
+    assert results[0].name == 'Say "hi"'
+    assert results[0].body == "line 1\nline 2\tindented \\ done"
+    assert results[1].body == ""
 
 
 def test_fetch_new_respects_limit(monkeypatch):
@@ -233,7 +256,7 @@ def test_fetch_new_respects_limit(monkeypatch):
         store=store,
     )
     raw = [
-        {"id": f"rem_{i}", "name": f"Task {i}", "body": "", "creation_date": "", "due_date": ""}
+        _RawReminder(id=f"rem_{i}", name=f"Task {i}", body="", creation_date="", due_date="")
         for i in range(10)
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
@@ -251,11 +274,299 @@ def test_fetch_new_skips_due_dates_in_future(monkeypatch):
         due_delay_seconds=0,
     )
     raw = [
-        {"id": "future", "name": "Future task", "body": "", "creation_date": "", "due_date": _due_in(300)},
-        {"id": "ready", "name": "Ready task", "body": "", "creation_date": "", "due_date": _due_in(-300)},
+        _RawReminder(id="future", name="Future task", body="", creation_date="", due_date=_due_in(300)),
+        _RawReminder(id="ready", name="Ready task", body="", creation_date="", due_date=_due_in(-300)),
     ]
     monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
 
     messages = ingress.fetch_new()
     assert len(messages) == 1
     assert messages[0].context["reminder_id"] == "ready"
+
+
+def test_quiet_poll_enables_modified_since_filter(monkeypatch):
+    store = FakeStore()
+    ingress = AppleRemindersIngress(list_name="agent-task", owner_sender="+15551234567", store=store)
+    ingress.mark_processed_occurrence("rem_001|")
+    raw = [_RawReminder(id="rem_001", name="Already done")]
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
+
+    assert ingress.fetch_new() == []
+    assert ingress._modified_since is not None
+
+    argvs: list[tuple[str, ...]] = []
+
+    def _capture(script, **kwargs):
+        argvs.append(tuple(kwargs["argv"]))
+        return OsaScriptRunResult(ok=True, stdout="")
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ingress, "_resolve_list_selector", lambda: None)
+    monkeypatch.setattr("apple_flow.reminders_ingress.compile_applescript", lambda source, name: None)
+    ingress.list_name = ""
+    monkeypatch.setattr("apple_flow.reminders_ingress.run_osascript_with_recovery", _capture)
+    ingress.fetch_new()
+    assert argvs[0][:3] == ("", "", "50")
+    assert int(argvs[0][3]) >= 5
+
+
+def test_fetch_script_is_compiled_once_and_called_with_argv(monkeypatch):
+    ingress = AppleRemindersIngress(list_name="agent-task", owner_sender="+15551234567", store=FakeStore())
+    monkeypatch.setattr(
+        ingress,
+        "_resolve_list_selector",
+        lambda: {"id": "list-1", "name": "agent-task", "path": "agent-task", "source": "applescript"},
+    )
+    compiled: list[str] = []
+
+    def _compile(source, name):
+        compiled.append(name)
+        return "/tmp/reminders_fetch.scpt"
+
+    calls: list[dict] = []
+
+    def _run(script, **kwargs):
+        calls.append(kwargs)
+        return OsaScriptRunResult(ok=True, stdout='{"id":"rem1","name":"Task"}')
+
+    monkeypatch.setattr("apple_flow.reminders_ingress.compile_applescript", _compile)
+    monkeypatch.setattr("apple_flow.reminders_ingress.run_osascript_with_recovery", _run)
+
+    ingress.fetch_new(limit=10)
+    ingress.fetch_new(limit=10)
+
+    assert compiled == ["reminders_fetch"]
+    assert calls[0]["compiled_path"] == "/tmp/reminders_fetch.scpt"
+    assert tuple(calls[0]["argv"]) == ("list-1", "agent-task", "10", "")
+
+
+def test_pending_reminders_force_full_scan(monkeypatch):
+    store = FakeStore()
+    ingress = AppleRemindersIngress(
+        list_name="agent-task",
+        owner_sender="+15551234567",
+        store=store,
+        due_delay_seconds=0,
+    )
+    ingress._modified_since = 0.0
+    raw = [_RawReminder(id="future", name="Future task", due_date=_due_in(300))]
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
+
+    assert ingress.fetch_new() == []
+    assert ingress._modified_since is None
+
+    raw[:] = [_RawReminder(id="new", name="New task")]
+    assert len(ingress.fetch_new()) == 1
+    assert ingress._modified_since is None
+
+
+def test_unchanged_reminders_store_skips_fetch_until_idle_interval(monkeypatch, tmp_path):
+    (tmp_path / "Data-local.sqlite").write_text("x")
+    monkeypatch.setattr("apple_flow.reminders_ingress._REMINDERS_STORE_DIRS", (tmp_path,))
+    ingress = AppleRemindersIngress(
+        list_name="agent-task",
+        owner_sender="+15551234567",
+        store=FakeStore(),
+        idle_poll_interval_seconds=60,
+    )
+    calls: list[int] = []
+
+    def _fetch(limit):
+        calls.append(limit)
+        return []
+
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", _fetch)
+
+    ingress.fetch_new()
+    ingress.fetch_new()
+    assert len(calls) == 1
+
+    (tmp_path / "Data-local.sqlite-wal").write_text("changed")
+    ingress.fetch_new()
+    assert len(calls) == 2
+
+    ingress._last_fetch_at -= 61
+    ingress.fetch_new()
+    assert len(calls) == 3
+
+
+def test_processed_occurrences_are_capped(monkeypatch):
+    monkeypatch.setattr("apple_flow.reminders_ingress._PROCESSED_OCCURRENCES_MAX", 2)
+    ingress = AppleRemindersIngress(list_name="agent-task", store=FakeStore())
+
+    for key in ("a|", "b|", "c|"):
+        ingress.mark_processed_occurrence(key)
+
+    assert list(ingress._processed_occurrences) == ["b|", "c|"]
+    assert sorted(ingress._store.list_reminder_occurrences()) == ["b|", "c|"]
+
+
+def test_full_scan_prunes_expired_occurrences_but_keeps_open_ones(monkeypatch):
+    store = FakeStore()
+    stale = int(datetime.now().timestamp()) - 31 * 24 * 60 * 60
+    store.upsert_reminder_occurrences([("gone|", stale), ("still_open|", stale)])
+    ingress = AppleRemindersIngress(list_name="agent-task", owner_sender="+15551234567", store=store)
+    raw = [_RawReminder(id="still_open", name="Awaiting approval")]
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw)
+
+    assert ingress.fetch_new() == []
+
+    assert list(store.list_reminder_occurrences()) == ["still_open|"]
+    assert ingress._processed_occurrences["still_open|"] > stale
+
+
+def test_compose_text_exact_layout():
+    assert AppleRemindersIngress._compose_text("Fix", "", "2026-03-01") == "Fix [due: 2026-03-01]"
+    assert AppleRemindersIngress._compose_text("Fix", "Details", "2026-03-01") == "Fix [due: 2026-03-01]\nDetails"
+    assert AppleRemindersIngress._compose_text("", "Details", "2026-03-01") == "Details"
+    assert AppleRemindersIngress._compose_text("", "", "2026-03-01") == ""
+
+
+def test_trigger_tag_filters_before_due_check_and_is_stripped(monkeypatch):
+    ingress = AppleRemindersIngress(
+        list_name="agent-task",
+        owner_sender="+15551234567",
+        store=FakeStore(),
+        trigger_tag="!!agent",
+        due_delay_seconds=0,
+    )
+    raw = [
+        _RawReminder(id="untagged_future", name="No tag", due_date=_due_in(300)),
+        _RawReminder(id="tagged", name="  Deploy !!agent ", body="now"),
+    ]
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: raw[:limit])
+
+    messages = ingress.fetch_new()
+
+    assert [msg.context["reminder_id"] for msg in messages] == ["tagged"]
+    assert messages[0].text == "task: Deploy\nnow"
+    assert messages[0].context["reminder_name"] == "Deploy"
+
+
+def test_deferred_marks_are_flushed_in_one_batch_on_next_fetch(monkeypatch):
+    store = FakeStore()
+    batches: list[list[tuple[str, int]]] = []
+    original_upsert = store.upsert_reminder_occurrences
+
+    def _record(occurrences):
+        batches.append(list(occurrences))
+        original_upsert(occurrences)
+
+    monkeypatch.setattr(store, "upsert_reminder_occurrences", _record)
+    ingress = AppleRemindersIngress(list_name="agent-task", store=store)
+    monkeypatch.setattr(ingress, "_fetch_incomplete_via_applescript", lambda limit: [])
+
+    ingress.mark_processed_occurrence("rem_1|", defer=True)
+    ingress.mark_processed_occurrence("rem_2|", defer=True)
+    assert "rem_1|" in ingress._processed_occurrences
+    assert batches == []
+
+    ingress.fetch_new()
+
+    assert len(batches) == 1
+    assert sorted(key for key, _ in batches[0]) == ["rem_1|", "rem_2|"]
+
+
+def test_mark_processed_many_writes_once():
+    store = FakeStore()
+    ingress = AppleRemindersIngress(list_name="agent-task", store=store)
+
+    ingress.mark_processed_many(["rem_1|", "", "rem_2|"])
+
+    assert sorted(store.list_reminder_occurrences()) == ["rem_1|", "rem_2|"]
+
+
+class _FakeEventKitBackend:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls: list[tuple[str, int]] = []
+        self.change_count = 0
+
+    def fetch_incomplete(self, list_name, limit):
+        self.calls.append((list_name, limit))
+        if isinstance(self.rows, Exception):
+            raise self.rows
+        return self.rows
+
+
+def test_eventkit_backend_used_when_enabled(monkeypatch):
+    backend = _FakeEventKitBackend(
+        [{"id": "x-apple-reminder://ek1", "name": "From EventKit", "body": "", "due_date": ""}]
+    )
+    monkeypatch.setattr("apple_flow.reminders_ingress.load_eventkit_backend", lambda: backend)
+    ingress = AppleRemindersIngress(list_name="agent-task", store=FakeStore(), use_eventkit=True)
+    monkeypatch.setattr(
+        ingress,
+        "_fetch_incomplete_via_applescript",
+        lambda limit: (_ for _ in ()).throw(AssertionError("osascript should not run")),
+    )
+
+    messages = ingress.fetch_new(limit=10)
+
+    assert backend.calls == [("agent-task", 10)]
+    assert [m.context["reminder_id"] for m in messages] == ["x-apple-reminder://ek1"]
+
+
+def test_eventkit_failure_falls_back_to_applescript(monkeypatch):
+    backend = _FakeEventKitBackend(RuntimeError("boom"))
+    monkeypatch.setattr("apple_flow.reminders_ingress.load_eventkit_backend", lambda: backend)
+    ingress = AppleRemindersIngress(list_name="agent-task", store=FakeStore(), use_eventkit=True)
+    monkeypatch.setattr(
+        ingress,
+        "_fetch_incomplete_via_applescript",
+        lambda limit: [_RawReminder(id="rem_1", name="Via AppleScript")],
+    )
+
+    messages = ingress.fetch_new()
+
+    assert len(backend.calls) == 1
+    assert [m.context["reminder_id"] for m in messages] == ["rem_1"]
+
+
+def test_eventkit_not_loaded_by_default(monkeypatch):
+    monkeypatch.setattr(
+        "apple_flow.reminders_ingress.load_eventkit_backend",
+        lambda: (_ for _ in ()).throw(AssertionError("should not load")),
+    )
+    ingress = AppleRemindersIngress(list_name="agent-task", store=FakeStore())
+
+    assert ingress._eventkit is None
+
+
+def test_eventkit_change_notifications_gate_idle_fetches(monkeypatch):
+    backend = _FakeEventKitBackend([])
+    monkeypatch.setattr("apple_flow.reminders_ingress.load_eventkit_backend", lambda: backend)
+    monkeypatch.setattr(
+        AppleRemindersIngress,
+        "_store_signature",
+        staticmethod(lambda: (_ for _ in ()).throw(AssertionError("store files should not be read"))),
+    )
+    ingress = AppleRemindersIngress(
+        list_name="agent-task", store=FakeStore(), use_eventkit=True, idle_poll_interval_seconds=60
+    )
+
+    ingress.fetch_new()
+    ingress.fetch_new()
+    assert len(backend.calls) == 1
+
+    backend.change_count += 1
+    ingress.fetch_new()
+    assert len(backend.calls) == 2
+
+
+def test_eventkit_backend_loaded_on_first_fetch_not_init(monkeypatch):
+    loads: list[int] = []
+    backend = _FakeEventKitBackend([])
+
+    def _load():
+        loads.append(1)
+        return backend
+
+    monkeypatch.setattr("apple_flow.reminders_ingress.load_eventkit_backend", _load)
+    ingress = AppleRemindersIngress(list_name="agent-task", store=FakeStore(), use_eventkit=True)
+    assert loads == []
+
+    ingress.fetch_new()
+    ingress.fetch_new()
+
+    assert loads == [1]
@@ -7,6 +7,7 @@ import pytest
 
 from apple_flow.models import RunState
 from apple_flow.run_executor import RunExecutor
+from apple_flow.store import SQLiteStore
 
 
 class _StoreStub:
@@ -25,8 +26,8 @@ class _StoreStub:
     def create_event(self, **_kwargs) -> None:
         pass
 
-    def claim_next_run_job(self, *, worker_id: str, lease_seconds: int):  # noqa: ARG002
-        return None
+    def claim_next_run_jobs(self, *, worker_id: str, lease_seconds: int, limit: int):  # noqa: ARG002
+        return []
 
     def requeue_expired_run_jobs(self) -> int:
         return 0
@@ -56,6 +57,46 @@ async def test_execute_job_keepalive_cancelled_is_suppressed():
     assert store.completed == [("job_1", "completed")]
 
 
+@pytest.mark.asyncio
+async def test_execute_job_short_job_never_renews_lease(monkeypatch):
+    store = _StoreStub()
+    renewals: list[str] = []
+    monkeypatch.setattr(store, "renew_run_job_lease", lambda **kw: renewals.append(kw["job_id"]) or True)
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=1)
+    handles: list = []
+    original = executor._schedule_lease_renewal
+
+    def _capture(**kwargs):
+        holder = original(**kwargs)
+        handles.append(holder)
+        return holder
+
+    monkeypatch.setattr(executor, "_schedule_lease_renewal", _capture)
+    job = {"job_id": "job_1", "run_id": "run_1", "sender": "+15550001111", "attempt": 1, "payload": {}}
+
+    await executor._execute_job(worker_id="worker_0", job=job)
+
+    assert renewals == []
+    assert handles[0][0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_lease_renewal_reschedules_until_renew_fails():
+    store = _StoreStub()
+    results = iter([True, False])
+    store.renew_run_job_lease = lambda **_kw: next(results)
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=1)
+
+    holder = executor._schedule_lease_renewal(job_id="job_1", worker_id="worker_0")
+    first = holder[0]
+    first._run()
+    second = holder[0]
+    assert second is not first and not second.cancelled()
+    second._run()
+    assert holder[0] is second
+    second.cancel()
+
+
 @pytest.mark.asyncio
 async def test_worker_loop_cancelled_exits_cleanly():
     store = _StoreStub()
@@ -112,3 +153,159 @@ async def test_supervised_worker_restarts_after_failure():
     await stopper
 
     assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_workers_wake_on_enqueue_from_thread():
+    store = _StoreStub()
+    queued: list[dict] = []
+    claims = {"count": 0}
+
+    def claim_next_run_jobs(*, worker_id: str, lease_seconds: int, limit: int):  # noqa: ARG001
+        claims["count"] += 1
+        return [queued.pop()] if queued else []
+
+    store.claim_next_run_jobs = claim_next_run_jobs
+    store.enqueue_run_job = lambda **kwargs: queued.append(
+        {"job_id": kwargs["job_id"], "run_id": kwargs["run_id"], "payload": kwargs["payload"]}
+    )
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=2)
+    shutdown = {"value": False}
+    task = asyncio.create_task(executor.run_forever(lambda: shutdown["value"]))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    idle_claims = claims["count"]
+
+    await asyncio.to_thread(
+        executor.enqueue,
+        run_id="run_1",
+        sender="+15550001111",
+        request_id="req_1",
+        attempt=1,
+        extra_instructions="",
+        approval_sender="+15550001111",
+        plan_summary="",
+    )
+    for _ in range(100):
+        if store.completed:
+            break
+        await asyncio.sleep(0.01)
+
+    assert idle_claims == 2
+    assert len(store.completed) == 1
+    shutdown["value"] = True
+    task.cancel()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_recovery_scan_runs_once_per_interval_not_per_worker():
+    store = _StoreStub()
+    scans = {"count": 0}
+
+    def requeue_expired_run_jobs():
+        scans["count"] += 1
+        return 0
+
+    store.requeue_expired_run_jobs = requeue_expired_run_jobs
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=4)
+    shutdown = {"value": False}
+    task = asyncio.create_task(executor.run_forever(lambda: shutdown["value"]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert scans["count"] == 1
+    shutdown["value"] = True
+    task.cancel()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_busy_worker_claims_batch_for_idle_peers():
+    store = _StoreStub()
+    limits: list[int] = []
+    queued = [
+        {"job_id": f"job_{n}", "run_id": f"run_{n}", "payload": {}, "lease_owner": "worker_0"} for n in range(3)
+    ]
+
+    def claim_next_run_jobs(*, worker_id: str, lease_seconds: int, limit: int):  # noqa: ARG001
+        limits.append(limit)
+        claimed = queued[:limit]
+        del queued[:limit]
+        return claimed
+
+    executed: list[tuple[str, str]] = []
+    shutdown = {"value": False}
+
+    async def fake_execute(*, worker_id, job):
+        executed.append((worker_id, job["job_id"]))
+        shutdown["value"] = len(executed) == 3
+
+    store.claim_next_run_jobs = claim_next_run_jobs
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=3)
+    executor._execute_job = fake_execute
+    executor._loop = asyncio.get_running_loop()
+    executor._job_available = asyncio.Event()
+    executor._idle_workers = 2
+
+    await executor._worker_loop("worker_0", lambda: shutdown["value"])
+
+    assert limits[0] == 3
+    assert sorted(job_id for _, job_id in executed) == ["job_0", "job_1", "job_2"]
+    assert {owner for owner, _ in executed} == {"worker_0"}
+
+
+@pytest.mark.asyncio
+async def test_execute_job_uses_returned_final_state_without_rereading_run():
+    store = _StoreStub()
+    store.get_run = lambda _run_id: pytest.fail("get_run should not be called")
+
+    class _FailingApproval:
+        def execute_queued_run(self, **_kwargs):
+            return SimpleNamespace(response="nope", final_state=RunState.FAILED)
+
+    executor = RunExecutor(store=store, approval_handler=_FailingApproval(), worker_count=1)
+
+    await executor._execute_job(worker_id="worker_0", job={"job_id": "job_1", "run_id": "run_1", "payload": {}})
+
+    assert store.completed == [("job_1", "failed")]
+
+
+@pytest.mark.asyncio
+async def test_stopping_executor_requeues_prefetched_jobs(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    store.create_run(
+        run_id="run_1", sender="+15550001111", intent="task", state="queued", cwd="/tmp", risk_level="execute"
+    )
+    for n in range(3):
+        store.enqueue_run_job(
+            job_id=f"job_{n}", run_id="run_1", sender="+15550001111", phase="executor", attempt=1, payload={}
+        )
+
+    executor = RunExecutor(store=store, approval_handler=_ApprovalStub(), worker_count=1)
+    started = asyncio.Event()
+    executed: list[str] = []
+
+    async def fake_execute(*, worker_id, job):  # noqa: ARG001
+        executed.append(job["job_id"])
+        started.set()
+        await asyncio.Event().wait()
+
+    executor._execute_job = fake_execute
+    # Pretend two peers are idle so the worker claims a batch of three.
+    executor._idle_workers = 2
+    shutdown = {"value": False}
+    task = asyncio.create_task(executor.run_forever(lambda: shutdown["value"]))
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    assert len(executor._prefetched) == 2
+    assert len(executor._prefetch_keepalive) == 2
+    shutdown["value"] = True
+    task.cancel()
+    await task
+
+    statuses = {job["job_id"]: job["status"] for job in store.list_run_jobs(run_id="run_1")}
+    assert statuses == {"job_0": "running", "job_1": "queued", "job_2": "queued"}
+    assert executed == ["job_0"]
+    assert executor._prefetch_keepalive == {}
@@ -80,6 +80,29 @@ class TestCheckDue:
         assert len(due) == 2
 
 
+class TestPopDue:
+    def test_pop_due_returns_and_fires_due_actions(self, store):
+        sched = FollowUpScheduler(store)
+        first = sched.schedule(run_id="run_1", sender="+1", hours_from_now=-0.002)
+        second = sched.schedule(run_id="run_2", sender="+2", hours_from_now=-0.001)
+        sched.schedule(run_id="run_3", sender="+3", hours_from_now=24.0)
+
+        popped = sched.pop_due()
+
+        assert [action["action_id"] for action in popped] == [first, second]
+        assert popped[0]["payload"]["run_id"] == "run_1"
+        assert all(action["status"] == "fired" for action in popped)
+        assert sched.check_due() == []
+        assert len(sched.list_pending()) == 1
+
+    def test_pop_due_is_claimed_once(self, store):
+        sched = FollowUpScheduler(store)
+        sched.schedule(run_id="run_1", sender="+1", hours_from_now=-0.001)
+
+        assert len(sched.pop_due()) == 1
+        assert sched.pop_due() == []
+
+
 class TestMarkFired:
     def test_mark_fired(self, store):
         sched = FollowUpScheduler(store)
@@ -119,3 +142,41 @@ class TestListPending:
         scheduler.schedule(run_id="run_2", sender="+2")
         all_pending = scheduler.list_pending()
         assert len(all_pending) == 2
+
+
+
+class TestTriggerMillisMigration:
+    def test_legacy_rows_are_backfilled(self, store):
+        conn = store._connect()
+        conn.executescript(
+            """
+            CREATE TABLE scheduled_actions (
+                action_id TEXT PRIMARY KEY,
+                sender TEXT NOT NULL,
+                action_type TEXT NOT NULL,
+                trigger_at TEXT NOT NULL,
+                payload_json TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO scheduled_actions(action_id, sender, action_type, trigger_at, payload_json)
+            VALUES ('sched_old', '+1', 'follow_up', '2000-01-01T00:00:00', '{}');
+            """
+        )
+        conn.commit()
+
+        sched = FollowUpScheduler(store)
+
+        assert [action["action_id"] for action in sched.check_due()] == ["sched_old"]
+        row = conn.execute("SELECT trigger_at_ms FROM scheduled_actions").fetchone()
+        assert row["trigger_at_ms"] is not None
+
+
+class TestIndexes:
+    def test_check_due_uses_pending_partial_index(self, scheduler, store):
+        plan = store._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT action_id FROM scheduled_actions "
+            "WHERE status = 'pending' AND trigger_at_ms <= 0 ORDER BY trigger_at_ms"
+        ).fetchall()
+
+        assert "idx_scheduled_pending_trigger" in " ".join(str(row["detail"]) for row in plan)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+
+from apple_flow import setup_wizard
+from apple_flow.setup_wizard import (
+    _render_env_from_example,
+    check_messages_db_access,
+    validate_email,
+    validate_phone,
+)
+
+
+def test_render_env_overrides_active_and_commented_keys():
+    template = "\n".join(
+        [
+            "# Core settings",
+            "apple_flow_connector=codex-cli",
+            "# apple_flow_admin_api_token=",
+            "#apple_flow_soul_file=agent-office/SOUL.md",
+            "apple_flow_untouched=keep",
+            "# plain comment = not a key",
+        ]
+    )
+    overrides = {
+        "apple_flow_connector": "claude-cli",
+        "apple_flow_admin_api_token": "abc",
+        "apple_flow_soul_file": "custom.md",
+    }
+
+    rendered = _render_env_from_example(template, overrides).splitlines()
+
+    assert rendered == [
+        "# Core settings",
+        "apple_flow_connector=claude-cli",
+        "apple_flow_admin_api_token=abc",
+        "apple_flow_soul_file=custom.md",
+        "apple_flow_untouched=keep",
+        "# plain comment = not a key",
+    ]
+
+
+def test_render_env_appends_missing_keys_sorted():
+    rendered = _render_env_from_example("apple_flow_a=1", {"apple_flow_z": "2", "apple_flow_b": "3"})
+
+    assert rendered.splitlines() == [
+        "apple_flow_a=1",
+        "",
+        "# Added by setup wizard",
+        "apple_flow_b=3",
+        "apple_flow_z=2",
+    ]
+
+
+def test_validators_strip_and_match_whole_value():
+    assert validate_phone(" +15551234567 ") == "+15551234567"
+    assert validate_phone("+1555abc") is None
+    assert validate_email("me@example.com") == "me@example.com"
+    assert validate_email("me@example") is None
+
+
+def test_generate_env_rereads_template_after_edit(tmp_path, monkeypatch):
+    template = tmp_path / ".env.example"
+    template.write_text("apple_flow_marker=one\n", encoding="utf-8")
+    monkeypatch.setattr(setup_wizard, "_find_env_example_path", lambda: template)
+    kwargs = dict(phone="+15551234567", connector="codex-cli", connector_command="codex", workspace="/tmp", gateways=[])
+
+    assert "apple_flow_marker=one" in setup_wizard.generate_env(**kwargs)
+    assert "apple_flow_marker=one" in setup_wizard.generate_env(**kwargs)
+
+    template.write_text("apple_flow_marker=two\n", encoding="utf-8")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert "apple_flow_marker=two" in setup_wizard.generate_env(**kwargs)
+
+
+def test_check_messages_db_access_reports_missing_ok_and_denied(tmp_path, monkeypatch):
+    db_path = tmp_path / "chat.db"
+    assert check_messages_db_access(db_path) == (False, f"Messages DB not found at {db_path}")
+
+    db_path.write_bytes(b"SQLite format 3\x00")
+    assert check_messages_db_access(db_path) == (True, "OK")
+
+    def deny(*_args, **_kwargs):
+        raise PermissionError("Operation not permitted")
+
+    monkeypatch.setattr(setup_wizard.os, "open", deny)
+    ok, detail = check_messages_db_access(db_path)
+    assert ok is False
+    assert "Full Disk Access" in detail
+
+
+def test_choose_gateways_dedupes_in_order_and_retries_invalid(monkeypatch, capsys):
+    answers = iter(["2, 9", "3,1, 3", ""])
+    monkeypatch.setattr(setup_wizard, "_ask", lambda *_args, **_kwargs: next(answers))
+
+    assert setup_wizard._choose_gateways() == ["notes", "mail"]
+    assert "Invalid selection: '9'" in capsys.readouterr().out
+    assert setup_wizard._choose_gateways() == []
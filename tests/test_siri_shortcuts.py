@@ -30,7 +30,7 @@ class TaskStore:
     def resolve_approval(self, request_id, status):
         return True
 
-    def list_events(self, limit=200):
+    def list_events(self, limit=200, *, include_payload=True):
         return []
 
 
@@ -1,3 +1,7 @@
+import sqlite3
+
+import pytest
+
 from apple_flow.store import SQLiteStore
 
 
@@ -227,3 +231,388 @@ def test_scan_run_and_finding_roundtrip(tmp_path):
     assert runs and runs[0]["run_id"] == "scan_1"
     findings = store.list_scan_findings(limit=5)
     assert findings and findings[0]["fingerprint"] == "abc123"
+
+
+def test_reminder_occurrences_roundtrip(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+
+    store.upsert_reminder_occurrences([("rem_b|", 200), ("rem_a|", 100)])
+    store.upsert_reminder_occurrences([("rem_a|", 300)])
+
+    assert store.list_reminder_occurrences() == {"rem_b|": 200, "rem_a|": 300}
+    assert store.delete_reminder_occurrences(["rem_b|", "missing|"]) == 1
+    assert store.list_reminder_occurrences() == {"rem_a|": 300}
+
+
+def test_claim_next_run_jobs_claims_batch_once(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    store.create_run(
+        run_id="run_1",
+        sender="+15551234567",
+        intent="task",
+        state="queued",
+        cwd="/tmp",
+        risk_level="execute",
+    )
+    for n in range(3):
+        store.enqueue_run_job(
+            job_id=f"job_{n}",
+            run_id="run_1",
+            sender="+15551234567",
+            phase="executor",
+            attempt=1,
+            payload={"n": n},
+        )
+
+    first = store.claim_next_run_jobs(worker_id="worker_1", lease_seconds=120, limit=2)
+    second = store.claim_next_run_jobs(worker_id="worker_2", lease_seconds=120, limit=2)
+
+    assert len(first) == 2 and len(second) == 1
+    assert {job["job_id"] for job in first + second} == {"job_0", "job_1", "job_2"}
+    assert all(job["status"] == "running" for job in first + second)
+    assert {job["lease_owner"] for job in first} == {"worker_1"}
+    assert store.claim_next_run_jobs(worker_id="worker_3", lease_seconds=120, limit=2) == []
+
+    assert store.release_run_jobs(job_ids=[job["job_id"] for job in first], worker_id="worker_2") == 0
+    assert store.release_run_jobs(job_ids=[job["job_id"] for job in first], worker_id="worker_1") == 2
+    reclaimed = store.claim_next_run_jobs(worker_id="worker_3", lease_seconds=120, limit=2)
+    assert {job["job_id"] for job in reclaimed} == {job["job_id"] for job in first}
+
+
+def test_queue_and_fail_run_job_write_job_state_and_event(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    store.create_run(
+        run_id="run_1",
+        sender="+15551234567",
+        intent="task",
+        state="awaiting_approval",
+        cwd="/tmp",
+        risk_level="execute",
+    )
+
+    store.queue_run_job(
+        job_id="job_1",
+        run_id="run_1",
+        sender="+15551234567",
+        phase="executor",
+        attempt=1,
+        payload={"request_id": "req_1"},
+        run_state="queued",
+        event_id="evt_1",
+        step="executor_queue",
+        event_type="execution_queued",
+        event_payload={"job_id": "job_1"},
+    )
+    assert store.get_run("run_1")["state"] == "queued"
+    assert store.list_run_jobs(run_id="run_1")[0]["payload"] == {"request_id": "req_1"}
+
+    store.fail_run_job(
+        job_id="job_1",
+        run_id="run_1",
+        error_text="RuntimeError: boom",
+        run_state="failed",
+        event_id="evt_2",
+        step="executor_queue",
+        event_type="execution_failed",
+        event_payload={"job_id": "job_1", "reason": "RuntimeError: boom"},
+    )
+    job = store.list_run_jobs(run_id="run_1")[0]
+    assert job["status"] == "failed" and job["error_text"] == "RuntimeError: boom"
+    assert store.get_run("run_1")["state"] == "failed"
+    assert {e["event_type"] for e in store.list_events_for_run("run_1")} == {"execution_queued", "execution_failed"}
+
+
+def test_run_job_queries_use_partial_indexes(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    conn = store._connect()
+
+    claim_plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT job_id FROM run_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 4"
+    ).fetchall()
+    lease_plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT job_id FROM run_jobs WHERE status = 'running' AND lease_expires_at <= CURRENT_TIMESTAMP"
+    ).fetchall()
+
+    assert "idx_run_jobs_queued_created" in " ".join(str(row["detail"]) for row in claim_plan)
+    assert "idx_run_jobs_running_lease" in " ".join(str(row["detail"]) for row in lease_plan)
+
+
+def test_store_uses_wal_with_normal_sync_by_default(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    conn = store._connect()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    store.close()
+
+
+def test_store_journal_mode_override_keeps_full_sync(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db", journal_mode="DELETE")
+    store.bootstrap()
+    conn = store._connect()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+    store.close()
+
+
+def test_store_unknown_journal_mode_falls_back_to_wal(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db", journal_mode="off; DROP TABLE sessions")
+
+    assert store.journal_mode == "wal"
+
+
+def test_wal_reads_do_not_wait_for_writer_lock(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    store.set_state("k", "v")
+
+    with store._lock:  # a writer holding the lock must not stall readers
+        assert store.get_state("k") == "v"
+        assert store.get_stats()["total_messages"] == 0
+
+    with store._reader() as reader:
+        assert reader is not store._conn
+        assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+    store.close()
+
+
+def test_non_wal_reads_use_shared_connection(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db", journal_mode="delete")
+    store.bootstrap()
+    store.set_state("k", "v")
+
+    with store._reader(snapshot=True) as reader:
+        assert reader is store._conn
+    assert store.get_state("k") == "v"
+    assert store.get_stats()["total_messages"] == 0
+    store.close()
+
+
+def test_transaction_commits_writes_once(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    conn = store._connect()
+    before = conn.total_changes
+
+    with store.transaction():
+        store.set_state("last_rowid", "10")
+        store.upsert_session("+1", "thread_1", "chat")
+        assert conn.in_transaction
+        # Reads inside the block see the block's own uncommitted writes.
+        assert store.get_state("last_rowid") == "10"
+
+    assert not conn.in_transaction
+    assert conn.total_changes - before == 2
+    assert store.get_state("last_rowid") == "10"
+    store.close()
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    store.set_state("last_rowid", "1")
+
+    try:
+        with store.transaction():
+            store.set_state("last_rowid", "2")
+            with store.transaction():  # nested blocks join the outer one
+                store.set_state("other", "x")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert store.get_state("last_rowid") == "1"
+    assert store.get_state("other") is None
+    store.close()
+
+
+def test_list_events_can_skip_payload_decoding(tmp_path):
+    store = SQLiteStore(tmp_path / "events.db")
+    store.bootstrap()
+    store.create_event("evt_1", "run_1", "planner", "plan_ready", {"snippet": "hi"})
+
+    decoded = store.list_events()[0]
+    raw = store.list_events(include_payload=False)[0]
+
+    assert decoded["payload"] == {"snippet": "hi"}
+    assert "payload_json" not in decoded
+    assert "payload" not in raw
+    assert raw["event_type"] == "plan_ready"
+    assert raw["payload_json"]
+    assert store.list_events_for_run("run_1", include_payload=False)[0]["event_id"] == "evt_1"
+
+
+def test_search_messages_uses_fts_substring_match(tmp_path):
+    store = SQLiteStore(tmp_path / "search.db")
+    store.bootstrap()
+    # Simulate a database created before the index existed; bootstrap backfills it.
+    conn = store._connect()
+    conn.executescript(
+        "DROP TRIGGER messages_fts_ai; DROP TRIGGER messages_fts_ad; DROP TRIGGER messages_fts_au; DROP TABLE messages_fts;"
+    )
+    store.record_message("m0", "+1555", "Deploy the Staging build", "2026-01-01T00:00:00Z", "h0")
+    store.close()
+    store = SQLiteStore(tmp_path / "search.db")
+    store.bootstrap()
+    store.record_message("m1", "+1555", 'said "ship it" 100%', "2026-01-02T00:00:00Z", "h1")
+    store.record_message("m2", "+1666", "staging for someone else", "2026-01-03T00:00:00Z", "h2")
+
+    assert store._messages_fts
+    assert [m["message_id"] for m in store.search_messages("+1555", "stagin")] == ["m0"]
+    assert [m["message_id"] for m in store.search_messages("+1555", '"ship')] == ["m1"]
+    assert [m["message_id"] for m in store.search_messages("+1555", "0%")] == ["m1"]
+    assert store.search_messages("+1555", "a_b") == []
+
+
+def test_search_messages_like_fallback_escapes_wildcards(tmp_path):
+    store = SQLiteStore(tmp_path / "search.db")
+    store.bootstrap()
+    store._messages_fts = False
+    store.record_message("m1", "+1555", "50% done", "2026-01-01T00:00:00Z", "h1")
+    store.record_message("m2", "+1555", "all done", "2026-01-02T00:00:00Z", "h2")
+
+    assert [m["message_id"] for m in store.search_messages("+1555", "0% d")] == ["m1"]
+    assert [m["message_id"] for m in store.search_messages("+1555", "%")] == ["m1"]
+
+
+def test_get_latest_event_for_run(tmp_path):
+    store = SQLiteStore(tmp_path / "events.db")
+    store.bootstrap()
+    assert store.get_latest_event_for_run("run_1") is None
+
+    store.create_event("evt_1", "run_1", "planner", "plan_ready", {"snippet": "first"})
+    conn = store._connect()
+    conn.execute("UPDATE events SET created_at = '2000-01-01 00:00:00' WHERE event_id = 'evt_1'")
+    conn.commit()
+    store.create_event("evt_2", "run_1", "executor", "execution_started", {"snippet": "second"})
+    store.create_event("evt_3", "run_2", "executor", "execution_started", {})
+
+    latest = store.get_latest_event_for_run("run_1")
+    assert latest["event_id"] == "evt_2"
+    assert latest["payload"] == {"snippet": "second"}
+
+
+def test_get_stats_counts(tmp_path):
+    store = SQLiteStore(tmp_path / "stats.db")
+    store.bootstrap()
+    store.upsert_session("+1", "thread_1", "chat")
+    store.record_message("m1", "+1", "hi", "2026-01-01T00:00:00Z", "h1")
+    store.record_message("m2", "+1", "again", "2026-01-01T00:01:00Z", "h2")
+    store.create_event("evt_1", "run_1", "planner", "plan_ready", {})
+
+    stats = store.get_stats()
+
+    assert stats["active_sessions"] == 1
+    assert stats["total_messages"] == 2
+    assert stats["pending_approvals"] == 0
+    assert stats["runs_by_state"] == {}
+    assert stats["last_event"]["event_id"] == "evt_1"
+
+
+def test_run_source_context_roundtrip(tmp_path):
+    store = SQLiteStore(tmp_path / "runs.db")
+    store.bootstrap()
+    store.create_run("run_1", "+1", "task", "planning", "/tmp", "default", source_context={"note_id": "n-1"})
+    store.create_run("run_2", "+1", "task", "planning", "/tmp", "default")
+
+    assert store.get_run_source_context("run_1") == {"note_id": "n-1"}
+    assert store.get_run_source_context("run_2") is None
+
+
+def test_run_source_context_is_cached_per_run(tmp_path):
+    store = SQLiteStore(tmp_path / "runs.db")
+    store.bootstrap()
+    assert store.get_run_source_context("run_1") is None
+    store.create_run("run_1", "+1", "task", "planning", "/tmp", "default", source_context={"channel": "notes"})
+
+    first = store.get_run_source_context("run_1")
+    first["channel"] = "mutated"
+    store.update_run_state("run_1", "executing")
+
+    assert store.get_run_source_context("run_1") == {"channel": "notes"}
+    assert list(store._run_origins) == ["run_1"]
+
+
+def test_bootstrap_adds_missing_columns_once(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, sender TEXT NOT NULL, intent TEXT NOT NULL, "
+        "state TEXT NOT NULL, cwd TEXT NOT NULL, risk_level TEXT NOT NULL, "
+        "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    legacy.commit()
+    legacy.close()
+
+    store = SQLiteStore(db_path)
+    store.bootstrap()
+    columns = {row["name"] for row in store._connect().execute("PRAGMA table_info(runs)")}
+    assert "source_context" in columns
+
+    store._connect().execute("DROP TABLE sessions")
+    store.bootstrap()  # no-op once bootstrapped
+    assert store._connect().execute("SELECT name FROM sqlite_master WHERE name = 'sessions'").fetchone() is None
+
+
+def test_newest_first_listings_use_composite_indexes(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    conn = store._connect()
+
+    def plan(sql: str, *params: object) -> str:
+        return " ".join(str(row["detail"]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    messages_plan = plan("SELECT * FROM messages WHERE sender = ? ORDER BY received_at DESC LIMIT 10", "+1")
+    run_events_plan = plan("SELECT * FROM events WHERE run_id = ? ORDER BY created_at DESC LIMIT 50", "run_1")
+    events_plan = plan("SELECT * FROM events ORDER BY created_at DESC LIMIT 200")
+
+    assert "idx_messages_sender_received" in messages_plan
+    assert "idx_events_run_created" in run_events_plan
+    assert "idx_events_created" in events_plan
+    assert "TEMP B-TREE" not in messages_plan + run_events_plan + events_plan
+
+
+def test_deny_all_approvals_denies_pending_runs_only(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    for run_id in ("run_1", "run_2", "run_3"):
+        store.create_run(run_id, "+1", "task", "awaiting_approval", "/tmp", "default")
+    store.create_approval("req_1", "run_1", "s", "p", "2999-01-01T00:00:00Z", "+1")
+    store.create_approval("req_2", "run_2", "s", "p", "2999-01-01T00:00:00Z", "+1")
+    store.create_approval("req_3", "run_3", "s", "p", "2999-01-01T00:00:00Z", "+1")
+    store.resolve_approval("req_3", "approved")
+
+    assert store.deny_all_approvals() == 2
+    assert store.deny_all_approvals() == 0
+
+    assert [store.get_approval(f"req_{i}")["status"] for i in (1, 2, 3)] == ["denied", "denied", "approved"]
+    assert [store.get_run(f"run_{i}")["state"] for i in (1, 2, 3)] == ["denied", "denied", "awaiting_approval"]
+
+
+def test_checkpoint_truncates_wal(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db")
+    store.bootstrap()
+    for i in range(20):
+        store.set_state(f"key_{i}", "x" * 512)
+    wal_path = tmp_path / "relay.db-wal"
+    assert wal_path.stat().st_size > 0
+
+    busy, _frames, _copied = store.checkpoint("truncate")
+
+    assert busy == 0
+    assert wal_path.stat().st_size == 0
+    assert store.get_state("key_19") == "x" * 512
+
+
+def test_checkpoint_is_noop_without_wal(tmp_path):
+    store = SQLiteStore(tmp_path / "relay.db", journal_mode="delete")
+    store.bootstrap()
+    assert store.checkpoint() is None
+    with pytest.raises(ValueError):
+        store.checkpoint("sideways")
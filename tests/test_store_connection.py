@@ -96,10 +96,11 @@ def test_store_indexes_created(tmp_path: Path):
     indexes = [row[0] for row in cursor.fetchall()]
 
     expected_indexes = [
-        "idx_messages_sender",
+        "idx_messages_sender_received",
         "idx_approvals_status",
         "idx_runs_sender",
-        "idx_events_run_id",
+        "idx_events_run_created",
+        "idx_events_created",
     ]
 
     for idx in expected_indexes:
@@ -1,6 +1,13 @@
 """Tests for shared utility functions."""
 
-from apple_flow.utils import normalize_sender
+import json
+import os
+import stat
+
+import pytest
+
+from apple_flow import utils
+from apple_flow.utils import atomic_write_text, json_dumps, json_loads, normalize_sender, short_id
 
 
 def test_normalize_sender_with_plus():
@@ -43,3 +50,86 @@ def test_normalize_sender_empty():
     """Empty strings should return empty."""
     assert normalize_sender("") == ""
     assert normalize_sender(None) == ""
+
+
+def test_json_roundtrip_matches_stdlib():
+    payload = {"run_id": "run_1", "text": "héllo\n", "n": [1, 2.5, None, True]}
+
+    assert json.loads(json_dumps(payload)) == payload
+    assert json_loads(json_dumps(payload)) == payload
+
+
+def test_json_dumps_falls_back_for_values_fast_backend_rejects():
+    assert json.loads(json_dumps({"big": 2**70 + 1})) == {"big": 2**70 + 1}
+
+
+def test_json_loads_raises_stdlib_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("not json")
+
+
+def test_json_dumps_rejects_values_stdlib_rejects():
+    from dataclasses import dataclass
+    from datetime import datetime
+
+    @dataclass
+    class _Row:
+        value: int
+
+    for value in (datetime(2026, 1, 1), _Row(1)):
+        with pytest.raises(TypeError):
+            json_dumps({"value": value})
+
+
+def test_json_dumps_accepts_builtin_subclasses():
+    from enum import StrEnum
+
+    class _State(StrEnum):
+        QUEUED = "queued"
+
+    assert json.loads(json_dumps({"state": _State.QUEUED})) == {"state": "queued"}
+
+
+def test_short_id_format_and_uniqueness():
+    ids = {short_id("job_") for _ in range(2000)}
+
+    assert len(ids) == 2000
+    assert all(len(value) == len("job_") + 12 and value.startswith("job_") for value in ids)
+    int(next(iter(ids))[4:], 16)
+    assert len(short_id("sched_", 5)) == len("sched_") + 10
+
+
+def test_atomic_write_text_replaces_and_keeps_mode(tmp_path):
+    target = tmp_path / ".env"
+    target.write_text("old\n", encoding="utf-8")
+    os.chmod(target, 0o640)
+
+    atomic_write_text(target, "new\n")
+
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_atomic_write_text_new_file_is_owner_only(tmp_path):
+    target = tmp_path / ".env"
+
+    atomic_write_text(target, "token=secret\n")
+
+    assert target.read_text(encoding="utf-8") == "token=secret\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_atomic_write_text_failure_leaves_original(tmp_path, monkeypatch):
+    target = tmp_path / ".env"
+    target.write_text("old\n", encoding="utf-8")
+
+    def boom(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utils.os, "replace", boom)
+    with pytest.raises(OSError):
+        atomic_write_text(target, "new\n")
+
+    assert target.read_text(encoding="utf-8") == "old\n"
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]